@@ -5,20 +5,65 @@
 
 import argparse
 import pathlib
+from typing import Optional, Type, Dict
 
 from farr.exceptions import InterpretError
+from farr.cache import load_module
 from farr.lexer import FarrRegexLexer
 from farr.parser import FarrParser
 from farr.interpreter import FarrInterpreter
+from farr.interpreter.closures import ClosureInterpreter
+from farr.interpreter.python import PythonInterpreter
+from farr.compiler import FarrCompiler, disassemble
+from farr.compiler.python import PythonCompiler
+from farr.vm import FarrVirtualMachine, StacklessVirtualMachine
+
+ENGINES: Dict[str, Type[FarrInterpreter]] = {
+    'tree': FarrInterpreter,
+    'closure': ClosureInterpreter,
+    'vm': FarrVirtualMachine,
+    'stackless': StacklessVirtualMachine,
+    'python': PythonInterpreter,
+}
+
+TARGETS: Dict[str, Type[PythonCompiler]] = {
+    'python': PythonCompiler,
+}
+
+
+def run_file(
+    filepath: str,
+    engine: str = 'tree',
+    tail_calls: Optional[bool] = None,
+    cache: Optional[bool] = None,
+) -> None:
+    """Executes the code from a file."""
+    interpreter = ENGINES[engine](tail_calls=tail_calls, cache=cache)
+    return interpreter.interpret(interpreter.parse_file(pathlib.Path(filepath)))
 
 
-def run_file(filepath: str) -> None:
-    """Executes the code from a file."""
-    return FarrInterpreter().interpret(
-        FarrParser().parse(
-            FarrRegexLexer().tokenize(pathlib.Path(filepath).read_text())
-        )
+def disassemble_file(filepath: str) -> None:
+    """Prints the bytecode of a file."""
+    print(
+        disassemble(FarrCompiler().compile(load_module(pathlib.Path(filepath))))
+    )
+    return None
+
+
+def compile_file(
+    filepath: str,
+    target: str = 'python',
+    output: Optional[str] = None,
+) -> None:
+    """Translates a file and prints or writes the result."""
+    source = TARGETS[target]().compile(
+        load_module(path := pathlib.Path(filepath)), str(path.resolve())
     )
+    if output is None:
+        print(source, end='')
+        return None
+    pathlib.Path(output).write_text(source)
+    return None
 
 
 def run_cmd(code: str) -> None:
@@ -58,6 +103,24 @@ def main() -> None:
 
     run_parser = subparsers.add_parser('run', help='Run code from a file.')
     run_parser.add_argument('filepath', type=str, help='path to the file')
+    run_parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='parse the file and its imports again without caching them',
+    )
+    run_parser.add_argument(
+        '--engine',
+        choices=ENGINES,
+        default='tree',
+        help='walk the syntax tree, compile it to closures or bytecode, run '
+        'the bytecode without nesting calls on the Python stack, or translate '
+        'it to Python',
+    )
+    run_parser.add_argument(
+        '--no-tail-calls',
+        action='store_true',
+        help='keep the caller of every `return! f(...)` in the stack trace',
+    )
 
     cmd_parser = subparsers.add_parser(
         'cmd', help='Run a string containing code.'
@@ -66,12 +129,41 @@ def main() -> None:
 
     subparsers.add_parser('shell', help='Start the Farr REPL.')
 
+    dis_parser = subparsers.add_parser(
+        'dis', help='Show the bytecode of a file.'
+    )
+    dis_parser.add_argument('filepath', type=str, help='path to the file')
+
+    compile_parser = subparsers.add_parser(
+        'compile', help='Translate a file to another language.'
+    )
+    compile_parser.add_argument('filepath', type=str, help='path to the file')
+    compile_parser.add_argument(
+        '--target',
+        choices=TARGETS,
+        default='python',
+        help='the language to translate to',
+    )
+    compile_parser.add_argument(
+        '-o', '--output', type=str, help='write the result to this file'
+    )
+
     if (args := parser.parse_args()).command == 'run':
-        run_file(args.filepath)
+        run_file(
+            args.filepath,
+            args.engine,
+            # The environment variables decide when a flag is not given
+            tail_calls=False if args.no_tail_calls else None,
+            cache=False if args.no_cache else None,
+        )
     elif args.command == 'cmd':
         run_cmd(args.code)
     elif args.command == 'shell':
         repl()
+    elif args.command == 'dis':
+        disassemble_file(args.filepath)
+    elif args.command == 'compile':
+        compile_file(args.filepath, args.target, args.output)
     else:
         parser.print_help()
     return None
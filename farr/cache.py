@@ -0,0 +1,167 @@
+# Farr's goal is to give programmers the sense of liberation that comes
+# from the beauty of the code itself, even if it hurts productivity!
+# We understand that beauty is not objective...
+# https://github.com/sheikhartin/farr
+
+import os
+import sys
+import types
+import pickle
+import marshal
+import hashlib
+import pathlib
+import tempfile
+import importlib.util
+from functools import cache
+from typing import Optional, Any, Callable, BinaryIO, Tuple
+
+import farr
+from farr.constants import CACHE_DIRECTORY, CACHE_DISABLER
+from farr.lexer import FarrRegexLexer
+from farr.parser import FarrParser
+from farr.parser.nodes import ModuleNode
+
+Header = Tuple[str, int, int, str]
+
+
+@cache
+def compiler_stamp(
+    parts: Tuple[str, ...] = ('lexer', 'parser', 'helpers.py'),
+) -> str:
+    """Identifies the version of the lexer, parser and what they use.
+
+    Each part is a package or a single module of Farr; the parser also
+    unescapes strings with the helpers, so they shape the trees as well.
+    """
+    stamp = hashlib.blake2b(farr.__version__.encode(), digest_size=16)
+    for part in parts:
+        path = pathlib.Path(farr.__file__).parent.joinpath(part)
+        for module in sorted(path.glob('*.py')) if path.is_dir() else [path]:
+            stamp.update(module.read_bytes())
+    return stamp.hexdigest()
+
+
+def cache_path(path: pathlib.Path) -> pathlib.Path:
+    """Returns where the syntax tree of a source file is kept."""
+    return path.parent / CACHE_DIRECTORY / f'{path.name}.pickle'
+
+
+def code_path(path: pathlib.Path) -> pathlib.Path:
+    """Returns where the Python translation of a source file is kept."""
+    return (
+        path.parent
+        / CACHE_DIRECTORY
+        / f'{path.name}.{sys.implementation.cache_tag}.pyc'
+    )
+
+
+def _read(path: pathlib.Path) -> Tuple[Optional[Header], Optional[ModuleNode]]:
+    """Reads the header and the syntax tree of a cache file."""
+    try:
+        with path.open('rb') as file:
+            header = pickle.load(file)
+            if header[0] != compiler_stamp():
+                return None, None
+            return header, pickle.load(file)
+    except (OSError, EOFError, pickle.UnpicklingError, TypeError, IndexError):
+        return None, None
+
+
+def _replace(path: pathlib.Path, write: Callable[[BinaryIO], Any]) -> None:
+    """Replaces a cache file atomically, so readers never see half of it."""
+    try:
+        path.parent.mkdir(exist_ok=True)
+        file = tempfile.NamedTemporaryFile(
+            'wb', dir=path.parent, prefix=f'{path.name}.', delete=False
+        )
+    except OSError:  # A read-only place only makes the next run slower
+        return None
+    try:
+        with file:
+            write(file)  # type: ignore[arg-type]
+        os.replace(file.name, path)
+    except (OSError, RecursionError):
+        pathlib.Path(file.name).unlink(missing_ok=True)
+    return None
+
+
+def _write(path: pathlib.Path, header: Header, module: ModuleNode) -> None:
+    """Writes the header and the syntax tree of a cache file."""
+
+    def write(file: BinaryIO) -> None:
+        pickle.dump(header, file, pickle.HIGHEST_PROTOCOL)
+        pickle.dump(module, file, pickle.HIGHEST_PROTOCOL)
+
+    return _replace(path, write)
+
+
+def _enabled(cache: Optional[bool]) -> bool:
+    """Decides whether to cache, leaving it to the environment if unsaid."""
+    return not os.getenv(CACHE_DISABLER) if cache is None else cache
+
+
+def load_module(
+    path: pathlib.Path,
+    cache: Optional[bool] = None,
+) -> ModuleNode:
+    """Parses a source file or loads its syntax tree from the cache.
+
+    The cache is trusted when the modification time and the size of the
+    source are unchanged; otherwise the hash of the source decides. Without
+    `cache`, the environment variable `FARRNOCACHE` turns the cache off.
+    """
+    if not _enabled(cache):
+        with path.open('rb') as file:
+            return FarrParser().parse(FarrRegexLexer().tokenize_iter(file))
+
+    stat = path.stat()
+    header, module = _read(cached_path := cache_path(path))
+    if module is not None and header[1:3] == (  # type: ignore[index]
+        stat.st_mtime_ns,
+        stat.st_size,
+    ):
+        return module
+
+    source_hash = hashlib.blake2b(
+        source := path.read_bytes(), digest_size=16
+    ).hexdigest()
+    if module is None or header[3] != source_hash:  # type: ignore[index]
+        module = FarrParser().parse(FarrRegexLexer().tokenize_iter(source))
+    _write(
+        cached_path,
+        (compiler_stamp(), stat.st_mtime_ns, stat.st_size, source_hash),
+        module,
+    )
+    return module
+
+
+def load_code(
+    path: pathlib.Path,
+    build: Callable[[], types.CodeType],
+    cache: Optional[bool] = None,
+) -> types.CodeType:
+    """Loads the Python translation of a source file or builds it.
+
+    The translation is kept as a hash-based `.pyc`, where the hash covers the
+    source and the compiler that translated it.
+    """
+    if not _enabled(cache):
+        return build()
+
+    key = hashlib.blake2b(
+        compiler_stamp(
+            ('lexer', 'parser', 'helpers.py', 'compiler', 'interpreter')
+        ).encode()
+        + path.read_bytes(),
+        digest_size=8,
+    ).digest()
+    header = importlib.util.MAGIC_NUMBER + (1).to_bytes(4, 'little') + key
+    try:
+        data = (cached_path := code_path(path)).read_bytes()
+        if data[:16] == header:
+            return marshal.loads(data[16:])
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+    code = build()
+    _replace(cached_path, lambda file: file.write(header + marshal.dumps(code)))
+    return code
@@ -0,0 +1,796 @@
+# Farr's goal is to give programmers the sense of liberation that comes
+# from the beauty of the code itself, even if it hurts productivity!
+# We understand that beauty is not objective...
+# https://github.com/sheikhartin/farr
+
+from typing import Optional, List
+
+from farr.helpers import plain_string
+from farr.parser.nodes import (
+    ASTNode,
+    ModuleNode,
+    BlockNode,
+    PositionedNode,
+    PassNode,
+    NullNode,
+    BinaryNode,
+    OctalNode,
+    HexadecimalNode,
+    IntegerNode,
+    FloatNode,
+    StringNode,
+    InterpolatedStringNode,
+    IdentifierNode,
+    RangeNode,
+    ItemizedExpressionNode,
+    ChainedExpressionsNode,
+    ListNode,
+    HashMapNode,
+    PairNode,
+    ExpandableArgumentNode,
+    CallNode,
+    GroupedExpressionNode,
+    NegationOperationNode,
+    UnaryOperationNode,
+    PreIncrementNode,
+    PreDecrementNode,
+    PostIncrementNode,
+    PostDecrementNode,
+    BinaryOperationNode,
+    ArithmeticOperationNode,
+    RelationalOperationNode,
+    LogicalOperationNode,
+    TernaryOperationNode,
+    VariableDeclarationNode,
+    VariadicParameterDeclarationNode,
+    AssignmentNode,
+    AggregateAssignmentNode,
+    WhileNode,
+    ForNode,
+    BreakNode,
+    ContinueNode,
+    IfNode,
+    CaseNode,
+    MatchNode,
+    FunctionDefinitionNode,
+    ReturnNode,
+)
+from farr.interpreter.objects import (
+    PassObject,
+    NullObject,
+    IntegerObject,
+    FloatObject,
+)
+from farr.compiler.base import Opcode, OPERATORS, CodeObject, Compiler
+
+
+class FarrCompiler(Compiler):
+    """Lowers the nodes of Farr to the bytecode of its virtual machine.
+
+    Nodes without instructions of their own, like `try` or `use`, are left
+    to the tree-walker through `EVAL`.
+    """
+
+    def _compile_root(self, node: ASTNode) -> None:
+        """Compiles the node and returns its value, or nothing for bodies."""
+        if self._code.function:
+            self._compile_statement(node)
+            self.emit(Opcode.LOAD_CONST, self.constant(None))
+        else:
+            self._compile(node)
+        self.emit(Opcode.RETURN_VALUE)
+        return None
+
+    def _compile_fallback(self, node: ASTNode) -> None:
+        """Leaves the node to the interpreter."""
+        self.emit(Opcode.EVAL, self.constant(node), node)
+        return None
+
+    def _compile_variable(
+        self,
+        opcode: Opcode,
+        identifier: IdentifierNode,
+        node: ASTNode,
+    ) -> None:
+        """Emits a name instruction, or its slot version if it has a slot."""
+        if (slot := self.slot(identifier)) is not None:
+            self.emit(_FAST_OPCODES[opcode], slot, node)
+            return None
+        self.emit(opcode, self.name(identifier.value), node)
+        return None
+
+    def _compile_none(self) -> None:
+        """Pushes the value of a statement."""
+        self.emit(Opcode.LOAD_CONST, self.constant(None))
+        return None
+
+    def _compile_statement(self, node: ASTNode) -> None:
+        """Compiles a node and throws its value away."""
+        self._compile(node)
+        # Only the value that ends a statement has no node, and nothing jumps
+        # past it, so it can be dropped instead of being popped
+        if self._code.nodes[-1] is None and self._code.instructions[-1] == (
+            Opcode.LOAD_CONST,
+            self.constant(None),
+        ):
+            self._code.instructions.pop()
+            self._code.nodes.pop()
+            return None
+        self.emit(Opcode.POP_TOP)
+        return None
+
+    def _compile_items(self, nodes: List[ASTNode]) -> int:
+        """Compiles the nodes one after another and returns their count."""
+        for node in nodes:
+            self._compile(node)
+        return len(nodes)
+
+    def _compile_body(self, node: BlockNode) -> None:
+        """Compiles the children of a body as statements."""
+        for child in node.body:
+            self._compile_statement(child)
+        self._compile_none()
+        return None
+
+    def _compile_module_node(self, node: ModuleNode) -> None:
+        """Compiles a `ModuleNode`."""
+        return self._compile_body(node)
+
+    def _compile_block_node(self, node: BlockNode) -> None:
+        """Compiles a `BlockNode`."""
+        return self._compile_body(node)
+
+    def _compile_pass_node(self, node: PassNode) -> None:
+        """Compiles a `PassNode`."""
+        self.emit(
+            Opcode.LOAD_CONST, self.constant(PassObject(), PassObject), node
+        )
+        return None
+
+    def _compile_null_node(self, node: NullNode) -> None:
+        """Compiles a `NullNode`."""
+        self.emit(
+            Opcode.LOAD_CONST, self.constant(NullObject(), NullObject), node
+        )
+        return None
+
+    def _compile_integer(self, node: PositionedNode, value: int) -> None:
+        """Loads an integer from the constants."""
+        self.emit(
+            Opcode.LOAD_CONST,
+            self.constant(IntegerObject(value=value), (IntegerObject, value)),
+            node,
+        )
+        return None
+
+    def _compile_binary_node(self, node: BinaryNode) -> None:
+        """Compiles a `BinaryNode`."""
+        return self._compile_integer(node, int(node.value, 2))
+
+    def _compile_octal_node(self, node: OctalNode) -> None:
+        """Compiles an `OctalNode`."""
+        return self._compile_integer(node, int(node.value, 8))
+
+    def _compile_hexadecimal_node(self, node: HexadecimalNode) -> None:
+        """Compiles a `HexadecimalNode`."""
+        return self._compile_integer(node, int(node.value, 16))
+
+    def _compile_integer_node(self, node: IntegerNode) -> None:
+        """Compiles an `IntegerNode`."""
+        return self._compile_integer(node, int(node.value))
+
+    def _compile_float_node(self, node: FloatNode) -> None:
+        """Compiles a `FloatNode`."""
+        self.emit(
+            Opcode.LOAD_CONST,
+            self.constant(
+                FloatObject(value=(value := float(node.value))),
+                (FloatObject, value),
+            ),
+            node,
+        )
+        return None
+
+    def _compile_string_node(self, node: StringNode) -> None:
+        """Compiles a `StringNode`, or leaves the invalid interpolations."""
+        if (text := plain_string(node.value)) is not None:
+            self.emit(
+                Opcode.LOAD_STRING, self.constant(text, (str, text)), node
+            )
+            return None
+        self._compile_fallback(node)
+        return None
+
+    def _compile_interpolated_string_node(
+        self,
+        node: InterpolatedStringNode,
+    ) -> None:
+        """Compiles an `InterpolatedStringNode`."""
+        *texts, last = node.texts
+        for text, expressions in zip(texts, node.interpolations):
+            self.emit(Opcode.LOAD_CONST, self.constant(text, (str, text)))
+            self.emit(
+                Opcode.FORMAT_VALUES, self._compile_items(expressions), node
+            )
+        self.emit(Opcode.LOAD_CONST, self.constant(last, (str, last)))
+        self.emit(Opcode.BUILD_STRING, 2 * len(texts) + 1, node)
+        return None
+
+    def _compile_identifier_node(self, node: IdentifierNode) -> None:
+        """Compiles an `IdentifierNode`."""
+        self._compile_variable(Opcode.LOAD_NAME, node, node)
+        return None
+
+    def _compile_range_node(self, node: RangeNode) -> None:
+        """Compiles a `RangeNode`."""
+        self._compile(node.from_)
+        flags = 0
+        if node.to is not None:
+            self._compile(node.to)
+            flags |= 1
+        if node.by is not None:
+            self._compile(node.by)
+            flags |= 2
+        self.emit(Opcode.BUILD_RANGE, flags, node)
+        return None
+
+    def _compile_itemized_expression_node(
+        self,
+        node: ItemizedExpressionNode,
+    ) -> None:
+        """Compiles an `ItemizedExpressionNode`."""
+        self.emit(Opcode.BUILD_ITEMS, self._compile_items(node.items), node)
+        return None
+
+    @staticmethod
+    def _is_plain(args: ItemizedExpressionNode) -> bool:
+        """Checks whether all arguments are positional or not."""
+        return not any(
+            isinstance(x, (AssignmentNode, ExpandableArgumentNode))
+            for x in args.items
+        )
+
+    def _compile_chained_expressions_node(
+        self,
+        node: ChainedExpressionsNode,
+    ) -> None:
+        """Compiles a `ChainedExpressionsNode` link by link."""
+        first, *links = node.expressions.items
+        self._compile(first)
+        for link in links:
+            if isinstance(link, IdentifierNode):
+                self.emit(Opcode.LOAD_ATTR, self.name(link.value), node)
+            elif isinstance(link, CallNode):
+                self.emit(
+                    Opcode.LOAD_METHOD, self.name(link.invoke.value), node
+                )
+                if self._is_plain(link.args):
+                    self.emit(
+                        Opcode.CALL_METHOD,
+                        self._compile_items(link.args.items),
+                        node,
+                    )
+                    continue
+                self.emit(
+                    Opcode.CALL_METHOD_WITH_NODE,
+                    self.constant(link.args),
+                    node,
+                )
+            else:
+                self._compile(link)
+                self.emit(Opcode.LOAD_INDEX, 0, node)
+        return None
+
+    def _compile_list_node(self, node: ListNode) -> None:
+        """Compiles a `ListNode`."""
+        self.emit(
+            Opcode.BUILD_LIST, self._compile_items(node.elements.items), node
+        )
+        return None
+
+    def _compile_hash_map_node(self, node: HashMapNode) -> None:
+        """Compiles a `HashMapNode`."""
+        self.emit(
+            Opcode.BUILD_HASH_MAP,
+            (
+                self._compile_items(node.pairs.items)
+                if node.pairs is not None
+                else 0
+            ),
+            node,
+        )
+        return None
+
+    def _compile_pair_node(self, node: PairNode) -> None:
+        """Compiles a `PairNode`."""
+        self._compile(node.key)
+        self._compile(node.value)
+        self.emit(Opcode.BUILD_PAIR, 0, node)
+        return None
+
+    def _compile_call_node(self, node: CallNode) -> None:
+        """Compiles a `CallNode`."""
+        return self._compile_call(node, False)
+
+    def _compile_call(self, node: CallNode, tail: bool) -> None:
+        """Compiles a call that may be left to the caller in tail position."""
+        self._compile(node.invoke)
+        if self._is_plain(node.args):
+            self.emit(
+                Opcode.TAIL_CALL if tail else Opcode.CALL,
+                self._compile_items(node.args.items),
+                node,
+            )
+            return None
+        self.emit(
+            Opcode.TAIL_CALL_WITH_NODE if tail else Opcode.CALL_WITH_NODE,
+            self.constant(node.args),
+            node,
+        )
+        return None
+
+    def _compile_grouped_expression_node(
+        self,
+        node: GroupedExpressionNode,
+    ) -> None:
+        """Compiles a `GroupedExpressionNode`."""
+        return self._compile(node.expression)
+
+    def _compile_negation_operation_node(
+        self,
+        node: NegationOperationNode,
+    ) -> None:
+        """Compiles a `NegationOperationNode`."""
+        self._compile(node.operand)
+        self.emit(Opcode.UNARY_NOT, 0, node)
+        return None
+
+    def _compile_step(
+        self,
+        node: UnaryOperationNode,
+        operator: str,
+        post: bool,
+    ) -> None:
+        """Compiles an increment or a decrement of a plain variable."""
+        if len(node.operand.items) != 1 or not isinstance(  # type: ignore[attr-defined]
+            target := node.operand.items[0], IdentifierNode  # type: ignore[attr-defined]
+        ):
+            self._compile_fallback(node)
+            return None
+        self._compile_variable(Opcode.LOAD_NAME, target, node)
+        if post:
+            self.emit(Opcode.DUP_TOP)
+        self._compile_integer(node, 1)
+        self.emit(Opcode.BINARY_OP, OPERATORS.index(operator), node)
+        if not post:
+            self.emit(Opcode.DUP_TOP)
+        self._compile_variable(Opcode.STORE_NAME, target, node)
+        return None
+
+    def _compile_pre_increment_node(self, node: PreIncrementNode) -> None:
+        """Compiles a `PreIncrementNode`."""
+        return self._compile_step(node, 'Add', False)
+
+    def _compile_pre_decrement_node(self, node: PreDecrementNode) -> None:
+        """Compiles a `PreDecrementNode`."""
+        return self._compile_step(node, 'Subtract', False)
+
+    def _compile_post_increment_node(self, node: PostIncrementNode) -> None:
+        """Compiles a `PostIncrementNode`."""
+        return self._compile_step(node, 'Add', True)
+
+    def _compile_post_decrement_node(self, node: PostDecrementNode) -> None:
+        """Compiles a `PostDecrementNode`."""
+        return self._compile_step(node, 'Subtract', True)
+
+    def _compile_binary_operation(self, node: BinaryOperationNode) -> None:
+        """Evaluates both sides and then applies the operator."""
+        if node.operator not in OPERATORS:
+            self._compile_fallback(node)
+            return None
+        self._compile(node.left)
+        self._compile(node.right)
+        self.emit(Opcode.BINARY_OP, OPERATORS.index(node.operator), node)
+        return None
+
+    def _compile_arithmetic_operation_node(
+        self,
+        node: ArithmeticOperationNode,
+    ) -> None:
+        """Compiles an `ArithmeticOperationNode`."""
+        return self._compile_binary_operation(node)
+
+    def _compile_relational_operation_node(
+        self,
+        node: RelationalOperationNode,
+    ) -> None:
+        """Compiles a `RelationalOperationNode`."""
+        return self._compile_binary_operation(node)
+
+    def _compile_logical_operation_node(
+        self,
+        node: LogicalOperationNode,
+    ) -> None:
+        """Compiles a `LogicalOperationNode` that jumps over needless sides."""
+        if node.operator not in ('And', 'Or'):
+            self._compile_fallback(node)
+            return None
+        self._compile(node.left)
+        end = self.emit(
+            (
+                Opcode.JUMP_IF_FALSE_OR_POP
+                if node.operator == 'And'
+                else Opcode.JUMP_IF_TRUE_OR_POP
+            ),
+            0,
+            node,
+        )
+        self._compile(node.right)
+        self.patch(end)
+        return None
+
+    def _compile_ternary_operation_node(
+        self,
+        node: TernaryOperationNode,
+    ) -> None:
+        """Compiles a `TernaryOperationNode`."""
+        self._compile(node.condition)
+        orelse = self.emit(Opcode.POP_JUMP_IF_FALSE, 0, node)
+        self._compile(node.then)
+        end = self.emit(Opcode.JUMP)
+        self.patch(orelse)
+        if node.orelse is not None:
+            self._compile(node.orelse)
+        else:
+            self.emit(Opcode.LOAD_CONST, self.constant(None), node)
+        self.patch(end)
+        return None
+
+    def _compile_declaration(
+        self,
+        node: VariableDeclarationNode,
+        default: Opcode,
+    ) -> None:
+        """Declares a variable with its value or a default one."""
+        if node.expression is not None:
+            self._compile(node.expression)
+        elif default == Opcode.BUILD_LIST:
+            self.emit(Opcode.BUILD_LIST, 0, node)
+        else:
+            self.emit(
+                Opcode.LOAD_CONST, self.constant(NullObject(), NullObject), node
+            )
+        self._compile_variable(Opcode.DECLARE_NAME, node.identifier, node)
+        self._compile_none()
+        return None
+
+    def _compile_variable_declaration_node(
+        self,
+        node: VariableDeclarationNode,
+    ) -> None:
+        """Compiles a `VariableDeclarationNode`."""
+        return self._compile_declaration(node, Opcode.LOAD_CONST)
+
+    def _compile_variadic_parameter_declaration_node(
+        self,
+        node: VariadicParameterDeclarationNode,
+    ) -> None:
+        """Compiles a `VariadicParameterDeclarationNode`."""
+        return self._compile_declaration(node, Opcode.BUILD_LIST)
+
+    def _compile_assignment(
+        self,
+        node: AssignmentNode,
+        operator: Optional[str],
+    ) -> None:
+        """Compiles an assignment to a plain variable."""
+        if len(node.references.items) != 1 or not isinstance(
+            target := node.references.items[0], IdentifierNode
+        ):
+            self._compile_fallback(node)
+            return None
+        if operator is not None:
+            self._compile_variable(Opcode.LOAD_NAME, target, node)
+        self._compile(node.expression)
+        if operator is not None:
+            self.emit(Opcode.BINARY_OP, OPERATORS.index(operator), node)
+        self._compile_variable(Opcode.STORE_NAME, target, node)
+        self._compile_none()
+        return None
+
+    def _compile_assignment_node(self, node: AssignmentNode) -> None:
+        """Compiles an `AssignmentNode`."""
+        return self._compile_assignment(node, None)
+
+    def _compile_aggregate_assignment(
+        self,
+        node: AggregateAssignmentNode,
+    ) -> None:
+        """Compiles an assignment that combines the previous value."""
+        return self._compile_assignment(
+            node, node.__class__.__name__.removesuffix('AssignmentNode')
+        )
+
+    _compile_left_shift_assignment_node = _compile_aggregate_assignment
+    _compile_right_shift_assignment_node = _compile_aggregate_assignment
+    _compile_add_assignment_node = _compile_aggregate_assignment
+    _compile_subtract_assignment_node = _compile_aggregate_assignment
+    _compile_multiply_assignment_node = _compile_aggregate_assignment
+    _compile_divide_assignment_node = _compile_aggregate_assignment
+    _compile_modulus_assignment_node = _compile_aggregate_assignment
+    _compile_power_assignment_node = _compile_aggregate_assignment
+
+    def _compile_loop_end(
+        self,
+        node: WhileNode,
+        head: int,
+        exit_: int,
+        setup: int,
+        cleanup: List[Opcode],
+    ) -> None:
+        """Closes a loop and runs its else clause when it is not broken."""
+        self.emit(Opcode.JUMP, head)
+        self.patch(exit_)
+        self.emit(Opcode.POP_BLOCK)
+        if node.orelse is not None:
+            self._compile_statement(node.orelse)
+        end = self.emit(Opcode.JUMP)
+        self.patch(setup)
+        self.emit(Opcode.POP_BLOCK)
+        for opcode in cleanup:
+            self.emit(opcode)
+        self.patch(end)
+        self._compile_none()
+        return None
+
+    def _compile_while_node(self, node: WhileNode) -> None:
+        """Compiles a `WhileNode`."""
+        setup = self.emit(Opcode.SETUP_LOOP, 0, node)
+        head = self.label()
+        self._compile(node.condition)
+        exit_ = self.emit(Opcode.POP_JUMP_IF_FALSE, 0, node)
+        self._compile_statement(node.body)
+        return self._compile_loop_end(node, head, exit_, setup, [])
+
+    def _compile_for_node(self, node: ForNode) -> None:
+        """Compiles a `ForNode`."""
+        self._compile_statement(node.initial)
+        self._compile(node.condition)
+        self.emit(Opcode.GET_ITER, 0, node)
+        setup = self.emit(Opcode.SETUP_LOOP, 0, node)
+        head = self.label()
+        exit_ = self.emit(Opcode.FOR_ITER, 0, node)
+        identifiers = [
+            (
+                variable
+                if isinstance(variable, IdentifierNode)
+                else variable.identifier  # type: ignore[union-attr]
+            )
+            for variable in node.initial.items
+        ]
+        if len(identifiers) == 1 and isinstance(node.condition, RangeNode):
+            # The numbers of a range are never unpacked
+            self._compile_variable(Opcode.DECLARE_NAME, identifiers[0], node)
+        else:
+            names = tuple(x.value for x in identifiers)
+            self.emit(
+                Opcode.STORE_FOR, self.constant(names, (tuple, names)), node
+            )
+        self._compile_statement(node.body)
+        return self._compile_loop_end(
+            node, head, exit_, setup, [Opcode.POP_TOP]
+        )
+
+    def _compile_break_node(self, node: BreakNode) -> None:
+        """Compiles a `BreakNode`."""
+        self.emit(Opcode.BREAK_LOOP, 0, node)
+        self._compile_none()
+        return None
+
+    def _compile_continue_node(self, node: ContinueNode) -> None:
+        """Compiles a `ContinueNode`."""
+        self.emit(Opcode.CONTINUE_LOOP, 0, node)
+        self._compile_none()
+        return None
+
+    def _compile_if_node(self, node: IfNode) -> None:
+        """Compiles an `IfNode`."""
+        self._compile(node.condition)
+        orelse = self.emit(Opcode.POP_JUMP_IF_FALSE, 0, node)
+        self._compile_statement(node.body)
+        if node.orelse is None:
+            self.patch(orelse)
+            self._compile_none()
+            return None
+        end = self.emit(Opcode.JUMP)
+        self.patch(orelse)
+        self._compile_statement(node.orelse)
+        self.patch(end)
+        self._compile_none()
+        return None
+
+    def _compile_case(
+        self,
+        node: MatchNode,
+        case: CaseNode,
+        ends: List[int],
+    ) -> None:
+        """Tests the subject on the stack against a case of a match."""
+        self.emit(Opcode.DUP_TOP)
+        self._compile(case.condition)
+        if isinstance(case.condition, ItemizedExpressionNode):
+            self.emit(Opcode.CONTAINS, 0, node)
+            orelse = self.emit(Opcode.POP_JUMP_IF_FALSE, 0, node)
+        else:
+            self.emit(Opcode.BINARY_OP, OPERATORS.index('EqualEqual'), node)
+            body = self.emit(Opcode.POP_JUMP_IF_TRUE, 0, node)
+            self.emit(Opcode.DUP_TOP)
+            self._compile(case.condition)
+            self.emit(Opcode.CONTAINS, 0, node)
+            orelse = self.emit(Opcode.POP_JUMP_IF_FALSE, 0, node)
+            self.patch(body)
+        self.emit(Opcode.POP_TOP)
+        self._compile_statement(case.body)
+        ends.append(self.emit(Opcode.JUMP))
+        self.patch(orelse)
+        return None
+
+    def _compile_match_node(self, node: MatchNode) -> None:
+        """Compiles a `MatchNode` into a chain of tests and jumps."""
+        if not node.body.body:
+            self._compile_fallback(node)
+            return None
+        self._compile(node.expression)
+        case, ends = node.body.body[0], []  # type: ignore[var-annotated]
+        while isinstance(case, CaseNode):
+            self._compile_case(node, case, ends)
+            case = case.orelse
+        self.emit(Opcode.POP_TOP)
+        if case is not None:
+            self._compile_statement(case)
+        for end in ends:
+            self.patch(end)
+        self._compile_none()
+        return None
+
+    def _compile_function_definition_node(
+        self,
+        node: FunctionDefinitionNode,
+    ) -> None:
+        """Compiles a `FunctionDefinitionNode`."""
+        self.emit(Opcode.MAKE_FUNCTION, self.constant(node), node)
+        self._compile_variable(Opcode.DECLARE_NAME, node.identifier, node)
+        self._compile_none()
+        return None
+
+    def _compile_return_node(self, node: ReturnNode) -> None:
+        """Compiles a `ReturnNode` into a jump out of the function."""
+        if (
+            self._code.function
+            and isinstance(node.expression, CallNode)
+            and CallNode not in self.fallbacks
+        ):
+            self._compile_call(node.expression, True)
+        elif node.expression is not None:
+            self._compile(node.expression)
+        else:
+            self.emit(
+                Opcode.LOAD_CONST, self.constant(NullObject(), NullObject), node
+            )
+        self.emit(
+            (
+                Opcode.RETURN_VALUE
+                if self._code.function
+                else Opcode.RAISE_RETURN
+            ),
+            0,
+            node,
+        )
+        self._compile_none()
+        return None
+
+
+_FAST_OPCODES = {
+    Opcode.LOAD_NAME: Opcode.LOAD_FAST,
+    Opcode.STORE_NAME: Opcode.STORE_FAST,
+    Opcode.DECLARE_NAME: Opcode.DECLARE_FAST,
+}
+_CONSTANT_ARGUMENTS = frozenset(
+    {Opcode.LOAD_CONST, Opcode.LOAD_STRING, Opcode.STORE_FOR}
+)
+_NODE_ARGUMENTS = frozenset(
+    {
+        Opcode.EVAL,
+        Opcode.MAKE_FUNCTION,
+        Opcode.CALL_WITH_NODE,
+        Opcode.CALL_METHOD_WITH_NODE,
+        Opcode.TAIL_CALL_WITH_NODE,
+    }
+)
+_NAME_ARGUMENTS = frozenset(
+    {
+        Opcode.LOAD_NAME,
+        Opcode.STORE_NAME,
+        Opcode.DECLARE_NAME,
+        Opcode.LOAD_ATTR,
+        Opcode.LOAD_METHOD,
+    }
+)
+_JUMP_ARGUMENTS = frozenset(
+    {
+        Opcode.JUMP,
+        Opcode.POP_JUMP_IF_FALSE,
+        Opcode.POP_JUMP_IF_TRUE,
+        Opcode.JUMP_IF_FALSE_OR_POP,
+        Opcode.JUMP_IF_TRUE_OR_POP,
+        Opcode.FOR_ITER,
+        Opcode.SETUP_LOOP,
+    }
+)
+
+
+def _describe(code: CodeObject, opcode: int, arg: int) -> str:
+    """Explains the argument of an instruction."""
+    if opcode in _CONSTANT_ARGUMENTS:
+        if isinstance(constant := code.constants[arg], tuple):
+            return ', '.join(constant)
+        elif isinstance(constant, (IntegerObject, FloatObject)):
+            return repr(constant.value)
+        elif isinstance(constant, (str, type(None))):
+            return repr(constant)
+        return constant.__class__.__name__
+    elif opcode in _NODE_ARGUMENTS:
+        return code.constants[arg].__class__.__name__
+    elif opcode in _NAME_ARGUMENTS:
+        return code.names[arg]
+    elif opcode in _FAST_OPCODES.values():
+        return code.varnames[arg]
+    elif opcode in _JUMP_ARGUMENTS:
+        return f'to {arg}'
+    elif opcode == Opcode.BINARY_OP:
+        return OPERATORS[arg]
+    elif opcode == Opcode.BUILD_RANGE:
+        return ', '.join(
+            name for flag, name in ((1, 'to'), (2, 'by')) if arg & flag
+        )
+    return ''
+
+
+def disassemble(code: CodeObject) -> str:
+    """Returns a readable listing of the code and the functions it makes."""
+    lines, position = [f'Disassembly of {code.name}:'], None
+    functions: List[FunctionDefinitionNode] = []
+    for offset, ((opcode, arg), node) in enumerate(
+        zip(code.instructions, code.nodes)
+    ):
+        if (
+            isinstance(node, PositionedNode)
+            and (
+                node.row,
+                node.column,
+            )
+            != position
+        ):
+            position = node.row, node.column
+            location = f'{node.row}:{node.column}'
+        else:
+            location = ''
+        if opcode == Opcode.MAKE_FUNCTION:
+            functions.append(code.constants[arg])
+        description = _describe(code, opcode, arg)
+        lines.append(
+            f'{location:>9} {offset:>5} {Opcode(opcode).name:<22}{arg:>4}'
+            + (f' ({description})' if description else '')
+        )
+    for function in functions:
+        lines.append('')
+        lines.append(
+            disassemble(
+                FarrCompiler().compile(
+                    function.body,  # type: ignore[arg-type]
+                    name=function.identifier.value,
+                    function=True,
+                )
+            )
+        )
+    return '\n'.join(lines)
@@ -0,0 +1,229 @@
+# Farr's goal is to give programmers the sense of liberation that comes
+# from the beauty of the code itself, even if it hurts productivity!
+# We understand that beauty is not objective...
+# https://github.com/sheikhartin/farr
+
+from enum import IntEnum, auto
+from dataclasses import dataclass, field
+from typing import Optional, Any, Iterable, Type, List, Tuple, Dict
+
+from farr.parser.nodes import ASTNode
+from farr.interpreter.base import Interpreter
+from farr.interpreter.resolver import Scope
+
+
+class Opcode(IntEnum):
+    """The instructions that the virtual machine understands."""
+
+    POP_TOP = auto()
+    DUP_TOP = auto()
+    LOAD_CONST = auto()
+    LOAD_STRING = auto()
+    LOAD_NAME = auto()
+    STORE_NAME = auto()
+    DECLARE_NAME = auto()
+    LOAD_FAST = auto()
+    STORE_FAST = auto()
+    DECLARE_FAST = auto()
+    LOAD_ATTR = auto()
+    LOAD_METHOD = auto()
+    LOAD_INDEX = auto()
+    BINARY_OP = auto()
+    UNARY_NOT = auto()
+    CONTAINS = auto()
+    BUILD_ITEMS = auto()
+    BUILD_LIST = auto()
+    BUILD_HASH_MAP = auto()
+    BUILD_PAIR = auto()
+    BUILD_RANGE = auto()
+    FORMAT_VALUES = auto()
+    BUILD_STRING = auto()
+    JUMP = auto()
+    POP_JUMP_IF_FALSE = auto()
+    POP_JUMP_IF_TRUE = auto()
+    JUMP_IF_FALSE_OR_POP = auto()
+    JUMP_IF_TRUE_OR_POP = auto()
+    GET_ITER = auto()
+    FOR_ITER = auto()
+    STORE_FOR = auto()
+    SETUP_LOOP = auto()
+    POP_BLOCK = auto()
+    BREAK_LOOP = auto()
+    CONTINUE_LOOP = auto()
+    CALL = auto()
+    CALL_WITH_NODE = auto()
+    CALL_METHOD = auto()
+    CALL_METHOD_WITH_NODE = auto()
+    TAIL_CALL = auto()
+    TAIL_CALL_WITH_NODE = auto()
+    MAKE_FUNCTION = auto()
+    RETURN_VALUE = auto()
+    RAISE_RETURN = auto()
+    EVAL = auto()
+
+
+OPERATORS: Tuple[str, ...] = (
+    'LeftShift',
+    'RightShift',
+    'Add',
+    'Subtract',
+    'Multiply',
+    'Divide',
+    'Modulus',
+    'Power',
+    'EqualEqual',
+    'NotEqual',
+    'LessThan',
+    'GreaterThan',
+    'LessThanOrEqual',
+    'GreaterThanOrEqual',
+    'And',
+    'Or',
+)
+
+
+@dataclass
+class CodeObject:
+    """The bytecode of a node with everything its instructions refer to.
+
+    Attributes:
+        name: A name to recognize the code in disassemblies.
+        instructions: Pairs of opcodes and their arguments.
+        constants: The values that instructions refer to by index.
+        names: The symbols that instructions refer to by index.
+        nodes: The node that each instruction comes from.
+        function: Whether `return!` leaves this code or not.
+        layout: The frame layout that the slots of the instructions belong to.
+        varnames: The name of every slot, for when the frame is not there.
+    """
+
+    name: str = field(kw_only=True)
+    instructions: List[Tuple[int, int]] = field(
+        default_factory=list, kw_only=True
+    )
+    constants: List[Any] = field(default_factory=list, kw_only=True)
+    names: List[str] = field(default_factory=list, kw_only=True)
+    nodes: List[Optional[ASTNode]] = field(default_factory=list, kw_only=True)
+    function: bool = field(default=False, kw_only=True)
+    layout: Optional[Dict[str, int]] = field(default=None, kw_only=True)
+    varnames: List[str] = field(default_factory=list, kw_only=True)
+
+
+class Compiler:
+    """Lowers abstract syntax trees to bytecode.
+
+    Attributes:
+        fallbacks: Node types that are always left to the interpreter.
+        _code: The code object that is being built.
+        _scope: The scope of the function whose body is being built.
+        _constant_indexes: The index of each constant by its key.
+        _name_indexes: The index of each name.
+    """
+
+    def __init__(self, *, fallbacks: Iterable[Type[ASTNode]] = ()) -> None:
+        self.fallbacks = frozenset(fallbacks)
+        self._code = CodeObject(name='<module>')
+        self._scope: Optional[Scope] = None
+        self._constant_indexes: Dict[Any, int] = {}
+        self._name_indexes: Dict[str, int] = {}
+
+    def emit(
+        self,
+        opcode: Opcode,
+        arg: int = 0,
+        node: Optional[ASTNode] = None,
+    ) -> int:
+        """Appends an instruction and returns its offset."""
+        self._code.instructions.append((int(opcode), arg))
+        self._code.nodes.append(node)
+        return len(self._code.instructions) - 1
+
+    def label(self) -> int:
+        """Returns the offset of the next instruction."""
+        return len(self._code.instructions)
+
+    def patch(self, offset: int, target: Optional[int] = None) -> None:
+        """Points a jump to the target, or to the next instruction."""
+        opcode, _ = self._code.instructions[offset]
+        self._code.instructions[offset] = (
+            opcode,
+            target if target is not None else self.label(),
+        )
+        return None
+
+    def constant(self, value: Any, key: Any = None) -> int:
+        """Returns the index of a constant and adds it for the first time."""
+        key = key if key is not None else (value.__class__, id(value))
+        if (index := self._constant_indexes.get(key, None)) is None:
+            index = self._constant_indexes[key] = len(self._code.constants)
+            self._code.constants.append(value)
+        return index
+
+    def name(self, value: str) -> int:
+        """Returns the index of a name and adds it for the first time."""
+        if (index := self._name_indexes.get(value, None)) is None:
+            index = self._name_indexes[value] = len(self._code.names)
+            self._code.names.append(value)
+        return index
+
+    def slot(self, node: ASTNode) -> Optional[int]:
+        """Returns the frame slot that an identifier surely refers to."""
+        if (
+            self._scope is None
+            or (address := self._scope.addresses.get(id(node), None)) is None
+            # Only the frame itself is there when the code runs
+            or address[0] != 0
+        ):
+            return None
+        return address[1]
+
+    def compile(
+        self,
+        node: ASTNode,
+        *,
+        name: str = '<module>',
+        function: bool = False,
+        scope: Optional[Scope] = None,
+    ) -> CodeObject:
+        """Returns the bytecode of the node."""
+        code, self._code = self._code, CodeObject(
+            name=name,
+            function=function,
+            layout=scope.names if scope is not None else None,
+            varnames=list(scope.names) if scope is not None else [],
+        )
+        scope, self._scope = self._scope, scope
+        indexes = self._constant_indexes, self._name_indexes
+        self._constant_indexes, self._name_indexes = {}, {}
+        try:
+            self._compile_root(node)
+            return self._code
+        finally:
+            self._code, self._scope = code, scope
+            self._constant_indexes, self._name_indexes = indexes
+
+    def _compile_root(self, node: ASTNode) -> None:
+        """Compiles the node that the code object is made for."""
+        raise NotImplementedError
+
+    def _compile(self, node: ASTNode) -> None:
+        """Compiles a node so that it leaves exactly one value on the stack."""
+        if (
+            node.__class__ in self.fallbacks
+            or (
+                compiler := getattr(
+                    self,
+                    Interpreter._handler_name(node.__class__, '_compile'),
+                    None,
+                )
+            )
+            is None
+        ):
+            self._compile_fallback(node)
+            return None
+        compiler(node)
+        return None
+
+    def _compile_fallback(self, node: ASTNode) -> None:
+        """Compiles a node that has no instructions of its own."""
+        raise NotImplementedError
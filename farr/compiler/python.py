@@ -0,0 +1,907 @@
+# Farr's goal is to give programmers the sense of liberation that comes
+# from the beauty of the code itself, even if it hurts productivity!
+# We understand that beauty is not objective...
+# https://github.com/sheikhartin/farr
+
+import dataclasses
+from dataclasses import dataclass, field
+from typing import (
+    Optional,
+    Union,
+    Any,
+    Iterable,
+    Iterator,
+    Type,
+    List,
+    Tuple,
+    Dict,
+)
+
+from farr.helpers import plain_string
+from farr.parser.nodes import (
+    ASTNode,
+    ModuleNode,
+    BlockNode,
+    PassNode,
+    NullNode,
+    BinaryNode,
+    OctalNode,
+    HexadecimalNode,
+    IntegerNode,
+    FloatNode,
+    StringNode,
+    InterpolatedStringNode,
+    IdentifierNode,
+    RangeNode,
+    ItemizedExpressionNode,
+    ChainedExpressionsNode,
+    ListNode,
+    HashMapNode,
+    PairNode,
+    ExpandableArgumentNode,
+    CallNode,
+    GroupedExpressionNode,
+    NegationOperationNode,
+    UnaryOperationNode,
+    PreIncrementNode,
+    PreDecrementNode,
+    PostIncrementNode,
+    PostDecrementNode,
+    BinaryOperationNode,
+    ArithmeticOperationNode,
+    RelationalOperationNode,
+    LogicalOperationNode,
+    TernaryOperationNode,
+    VariableDeclarationNode,
+    VariadicParameterDeclarationNode,
+    AssignmentNode,
+    AggregateAssignmentNode,
+    WhileNode,
+    ForNode,
+    BreakNode,
+    ContinueNode,
+    IfNode,
+    CaseNode,
+    MatchNode,
+    FunctionDefinitionNode,
+    ReturnNode,
+)
+from farr.interpreter.base import Interpreter
+
+OPERATORS: Dict[str, str] = {
+    'LeftShift': '<<',
+    'RightShift': '>>',
+    'Add': '+',
+    'Subtract': '-',
+    'Multiply': '*',
+    'Divide': '/',
+    'Modulus': '%',
+    'Power': '**',
+    'EqualEqual': '==',
+    'NotEqual': '!=',
+    'LessThan': '<',
+    'GreaterThan': '>',
+    'LessThanOrEqual': '<=',
+    'GreaterThanOrEqual': '>=',
+}
+
+HEADER = '''\
+# Generated from {source} by `farr compile --target=python`.
+from farr.exceptions import BreakError, ContinueError, ReturnError
+from farr.interpreter.objects import (
+    PassObject,
+    NullObject,
+    BooleanObject,
+    IntegerObject,
+    FloatObject,
+    StringObject,
+    RangeObject,
+    ListObject,
+    HashMapObject,
+    PairObject,
+)
+from farr.interpreter.python import (
+    items,
+    step,
+    store_for,
+)
+
+__farr_source__ = {path}
+
+_pass = PassObject()
+_null = NullObject()
+'''
+
+FOOTER = '''
+if __name__ == '__main__':
+    from farr.interpreter.python import run_python_module
+
+    run_python_module(globals())
+'''
+
+Position = Tuple[int, int, int]
+
+
+@dataclass
+class Fragment:
+    """A piece of generated code that may come from a node.
+
+    Attributes:
+        parts: Texts and smaller fragments in the order they are written.
+        node: The number of the node that the fragment comes from.
+    """
+
+    parts: List[Union[str, 'Fragment']] = field(kw_only=True)
+    node: Optional[int] = field(default=None, kw_only=True)
+
+    def render(self, offset: int, positions: List[Position]) -> str:
+        """Writes the fragment and records where every node ended up."""
+        texts, start = [], offset
+        for part in self.parts:
+            if isinstance(part, Fragment):
+                part = part.render(offset, positions)
+            texts.append(part)
+            offset += len(part)
+        if self.node is not None:
+            positions.append((start, offset, self.node))
+        return ''.join(texts)
+
+
+def number_nodes(module: ModuleNode) -> List[ASTNode]:
+    """Lists the nodes of a tree in an order that only depends on the tree."""
+    nodes: List[ASTNode] = []
+    seen = set()
+    pending: List[Any] = [module]
+    while pending:
+        if isinstance(value := pending.pop(), list):
+            pending.extend(reversed(value))
+        elif isinstance(value, ASTNode) and id(value) not in seen:
+            seen.add(id(value))
+            nodes.append(value)
+            if dataclasses.is_dataclass(value):
+                pending.extend(
+                    reversed(
+                        [
+                            getattr(value, x.name)
+                            for x in dataclasses.fields(value)
+                        ]
+                    )
+                )
+    return nodes
+
+
+class PythonCompiler:
+    """Translates the nodes of Farr to Python source that runs on its objects.
+
+    Names are still kept in the environments of the interpreter, and nodes
+    without a translation, like `try` or `use`, are handed to it by number.
+
+    Attributes:
+        fallbacks: Node types that are always left to the interpreter.
+        _indexes: The number of every node of the module.
+        _constants: The name of every shared constant by its definition.
+        _functions: The generated functions, each as indented fragments.
+        _lines: The function that is being generated.
+        _pending: Function definitions that are waiting for their turn.
+        _loops: How many Python loops surround the current statement.
+        _function: Whether `return!` leaves a Python function or not.
+    """
+
+    def __init__(self, *, fallbacks: Iterable[Type[ASTNode]] = ()) -> None:
+        self.fallbacks = frozenset(fallbacks)
+        self._indexes: Dict[int, int] = {}
+        self._constants: Dict[str, str] = {}
+        self._functions: List[List[Tuple[int, Fragment]]] = []
+        self._lines: List[Tuple[int, Fragment]] = []
+        self._pending: List[FunctionDefinitionNode] = []
+        self._loops = 0
+        self._function = False
+        self._indent = 0
+
+    def compile(self, module: ModuleNode, source: str = '<string>') -> str:
+        """Returns the Python source of a module."""
+        self._indexes = {
+            id(node): index for index, node in enumerate(number_nodes(module))
+        }
+        self._constants, self._functions, self._pending = {}, [], []
+        self._generate('__farr_main__', module, False)
+        while self._pending:
+            definition = self._pending.pop(0)
+            self._generate(
+                f'_f{self._indexes[id(definition)]}', definition.body, True
+            )
+
+        lines = HEADER.format(source=source, path=ascii(source)).splitlines()
+        lines.extend(
+            f'{name} = {definition}'
+            for definition, name in self._constants.items()
+        )
+        positions: Dict[int, Tuple[Position, ...]] = {}
+        for function in self._functions:
+            lines.extend(('', ''))
+            for indent, fragment in function:
+                spans: List[Position] = []
+                lines.append(
+                    ' ' * indent * 4 + fragment.render(indent * 4, spans)
+                )
+                if spans:
+                    positions[len(lines)] = tuple(spans)
+        lines.extend(('', f'__farr_positions__ = {ascii(positions)}'))
+        return '\n'.join(lines) + '\n' + FOOTER
+
+    def _generate(self, name: str, body: Any, function: bool) -> None:
+        """Generates a Python function for a module or a function body."""
+        self._lines, self._loops, self._function = [], 0, function
+        self._line(Fragment(parts=[f'def {name}(rt):']))
+        self._indented(body)
+        self._functions.append(self._lines)
+        return None
+
+    def _line(self, fragment: Fragment) -> None:
+        """Adds a line at the current indentation."""
+        self._lines.append((self._indent, fragment))
+        return None
+
+    def _indented(self, node: Optional[ASTNode]) -> None:
+        """Generates a statement one level deeper, or `pass` for nothing."""
+        self._indent += 1
+        count = len(self._lines)
+        if node is not None:
+            self._statement(node)
+        if len(self._lines) == count:
+            self._line(Fragment(parts=['pass']))
+        self._indent -= 1
+        return None
+
+    def _index(self, node: ASTNode) -> Optional[int]:
+        """Returns the number of a node, if it belongs to the module."""
+        return self._indexes.get(id(node), None)
+
+    def _fragment(
+        self, node: ASTNode, *parts: Union[str, Fragment]
+    ) -> Fragment:
+        """Builds a fragment that comes from a node."""
+        return Fragment(parts=list(parts), node=self._index(node))
+
+    def _constant(self, definition: str) -> str:
+        """Returns the name of a shared constant."""
+        if (name := self._constants.get(definition, None)) is None:
+            name = self._constants[definition] = f'_c{len(self._constants)}'
+        return name
+
+    def _reference(self, node: ASTNode) -> str:
+        """Refers to a node of the module by its number."""
+        if (index := self._index(node)) is None:
+            raise SyntaxError(
+                f'`{node.__class__.__name__}` is not a part of the module!'
+            )
+        return f'_nodes[{index}]'
+
+    def _fallback(self, node: ASTNode) -> Fragment:
+        """Leaves a node to the interpreter."""
+        return self._fragment(node, f'rt._interpret({self._reference(node)})')
+
+    def _expression(self, node: ASTNode) -> Fragment:
+        """Translates a node to an expression."""
+        if (
+            node.__class__ in self.fallbacks
+            or (
+                translator := getattr(
+                    self,
+                    Interpreter._handler_name(node.__class__, '_translate'),
+                    None,
+                )
+            )
+            is None
+        ):
+            return self._fallback(node)
+        return translator(node)
+
+    def _statement(self, node: ASTNode) -> None:
+        """Translates a node to statements."""
+        if (
+            node.__class__ in self.fallbacks
+            or (
+                generator := getattr(
+                    self,
+                    Interpreter._handler_name(node.__class__, '_generate'),
+                    None,
+                )
+            )
+            is None
+        ):
+            self._line(self._expression(node))
+            return None
+        generator(node)
+        return None
+
+    def _join(self, nodes: List[ASTNode]) -> Iterator[Union[str, Fragment]]:
+        """Translates nodes to the arguments of a call."""
+        for i, node in enumerate(nodes):
+            if i:
+                yield ', '
+            yield self._expression(node)
+
+    @staticmethod
+    def _is_plain(args: ItemizedExpressionNode) -> bool:
+        """Checks whether all arguments are positional or not."""
+        return not any(
+            isinstance(x, (AssignmentNode, ExpandableArgumentNode))
+            for x in args.items
+        )
+
+    def _generate_module_node(self, node: ModuleNode) -> None:
+        """Generates the statements of a `ModuleNode`."""
+        for child in node.body:
+            self._statement(child)
+        return None
+
+    _generate_block_node = _generate_module_node
+
+    def _translate_pass_node(self, node: PassNode) -> Fragment:
+        """Translates a `PassNode`."""
+        return self._fragment(node, '_pass')
+
+    def _translate_null_node(self, node: NullNode) -> Fragment:
+        """Translates a `NullNode`."""
+        return self._fragment(node, '_null')
+
+    def _integer(self, node: ASTNode, value: int) -> Fragment:
+        """Translates an integer to a shared constant."""
+        return self._fragment(
+            node, self._constant(f'IntegerObject(value={ascii(value)})')
+        )
+
+    def _translate_binary_node(self, node: BinaryNode) -> Fragment:
+        """Translates a `BinaryNode`."""
+        return self._integer(node, int(node.value, 2))
+
+    def _translate_octal_node(self, node: OctalNode) -> Fragment:
+        """Translates an `OctalNode`."""
+        return self._integer(node, int(node.value, 8))
+
+    def _translate_hexadecimal_node(self, node: HexadecimalNode) -> Fragment:
+        """Translates a `HexadecimalNode`."""
+        return self._integer(node, int(node.value, 16))
+
+    def _translate_integer_node(self, node: IntegerNode) -> Fragment:
+        """Translates an `IntegerNode`."""
+        return self._integer(node, int(node.value))
+
+    def _translate_float_node(self, node: FloatNode) -> Fragment:
+        """Translates a `FloatNode`."""
+        return self._fragment(
+            node,
+            self._constant(
+                f"FloatObject(value=float('{float(node.value)!r}'))"
+            ),
+        )
+
+    def _translate_string_node(self, node: StringNode) -> Fragment:
+        """Translates a `StringNode`, or leaves the invalid interpolations."""
+        if (text := plain_string(node.value)) is None:
+            return self._fallback(node)
+        return self._fragment(node, f'StringObject(value={ascii(text)})')
+
+    def _translate_interpolated_string_node(
+        self,
+        node: InterpolatedStringNode,
+    ) -> Fragment:
+        """Translates an `InterpolatedStringNode`."""
+        *texts, last = node.texts
+        pieces: List[Union[str, Fragment]] = ['StringObject(value=']
+        for text, expressions in zip(texts, node.interpolations):
+            pieces.append(f'{ascii(text)} + ')
+            for i, expression in enumerate(expressions):
+                pieces.extend(
+                    (
+                        "' ' + str(" if i else 'str(',
+                        self._expression(expression),
+                        ') + ',
+                    )
+                )
+        pieces.extend((ascii(last), ')'))
+        return self._fragment(node, *pieces)
+
+    def _translate_identifier_node(self, node: IdentifierNode) -> Fragment:
+        """Translates an `IdentifierNode`."""
+        return self._fragment(
+            node, f'rt.environment.locate({ascii(node.value)})'
+        )
+
+    def _translate_range_node(self, node: RangeNode) -> Fragment:
+        """Translates a `RangeNode`."""
+        return self._fragment(
+            node,
+            'RangeObject(from_=',
+            self._expression(node.from_),
+            ', to=',
+            self._expression(node.to) if node.to is not None else 'None',
+            ', by=',
+            self._expression(node.by) if node.by is not None else 'None',
+            ')',
+        )
+
+    def _translate_itemized_expression_node(
+        self,
+        node: ItemizedExpressionNode,
+    ) -> Fragment:
+        """Translates an `ItemizedExpressionNode`."""
+        return self._fragment(node, 'items(', *self._join(node.items), ')')
+
+    def _translate_chained_expressions_node(
+        self,
+        node: ChainedExpressionsNode,
+    ) -> Fragment:
+        """Translates a `ChainedExpressionsNode` link by link."""
+        first, *links = node.expressions.items
+        result = self._expression(first)
+        for link in links:
+            if isinstance(link, IdentifierNode):
+                result = self._fragment(
+                    node,
+                    'rt._load_attribute(',
+                    result,
+                    f', {ascii(link.value)})',
+                )
+            elif isinstance(link, CallNode) and self._is_plain(link.args):
+                result = self._fragment(
+                    node,
+                    'rt._call_method(',
+                    result,
+                    f', {ascii(link.invoke.value)}, [',
+                    *self._join(link.args.items),
+                    '])',
+                )
+            elif isinstance(link, CallNode):
+                result = self._fragment(
+                    node,
+                    'rt._call_method_with_node(',
+                    result,
+                    f', {ascii(link.invoke.value)}, ',
+                    self._reference(link.args),
+                    ')',
+                )
+            else:
+                result = self._fragment(
+                    node, result, '[', self._expression(link), ']'
+                )
+        return result
+
+    def _translate_list_node(self, node: ListNode) -> Fragment:
+        """Translates a `ListNode`."""
+        return self._fragment(
+            node,
+            'ListObject(elements=items(',
+            *self._join(node.elements.items),
+            '))',
+        )
+
+    def _translate_hash_map_node(self, node: HashMapNode) -> Fragment:
+        """Translates a `HashMapNode`."""
+        return self._fragment(
+            node,
+            'HashMapObject(pairs=items(',
+            *self._join(node.pairs.items if node.pairs is not None else []),
+            '))',
+        )
+
+    def _translate_pair_node(self, node: PairNode) -> Fragment:
+        """Translates a `PairNode`."""
+        return self._fragment(
+            node,
+            'PairObject(key=',
+            self._expression(node.key),
+            ', value=',
+            self._expression(node.value),
+            ')',
+        )
+
+    def _translate_call_node(self, node: CallNode) -> Fragment:
+        """Translates a `CallNode`."""
+        return self._call(node, False)
+
+    def _call(self, node: CallNode, tail: bool) -> Fragment:
+        """Translates a call that may be left to the caller in tail position."""
+        if not self._is_plain(node.args):
+            return self._fragment(
+                node,
+                'rt._call_with_node(',
+                self._expression(node.invoke),
+                f', {self._reference(node.args)}',
+                ', True)' if tail else ')',
+            )
+        return self._fragment(
+            node,
+            'rt._call(',
+            self._expression(node.invoke),
+            ', [',
+            *self._join(node.args.items),
+            '], True)' if tail else '])',
+        )
+
+    def _translate_grouped_expression_node(
+        self,
+        node: GroupedExpressionNode,
+    ) -> Fragment:
+        """Translates a `GroupedExpressionNode`."""
+        return self._fragment(node, '(', self._expression(node.expression), ')')
+
+    def _translate_negation_operation_node(
+        self,
+        node: NegationOperationNode,
+    ) -> Fragment:
+        """Translates a `NegationOperationNode`."""
+        return self._fragment(
+            node,
+            'BooleanObject(value=not ',
+            self._expression(node.operand),
+            ')',
+        )
+
+    def _step(
+        self, node: UnaryOperationNode, sign: str, post: bool
+    ) -> Fragment:
+        """Translates an increment or a decrement of a plain variable."""
+        if len(node.operand.items) != 1 or not isinstance(  # type: ignore[attr-defined]
+            target := node.operand.items[0], IdentifierNode  # type: ignore[attr-defined]
+        ):
+            return self._fallback(node)
+        return self._fragment(
+            node,
+            f'step(rt.environment, {ascii(target.value)}, {ascii(sign)}, {post})',
+        )
+
+    def _translate_pre_increment_node(self, node: PreIncrementNode) -> Fragment:
+        """Translates a `PreIncrementNode`."""
+        return self._step(node, '+', False)
+
+    def _translate_pre_decrement_node(self, node: PreDecrementNode) -> Fragment:
+        """Translates a `PreDecrementNode`."""
+        return self._step(node, '-', False)
+
+    def _translate_post_increment_node(
+        self,
+        node: PostIncrementNode,
+    ) -> Fragment:
+        """Translates a `PostIncrementNode`."""
+        return self._step(node, '+', True)
+
+    def _translate_post_decrement_node(
+        self,
+        node: PostDecrementNode,
+    ) -> Fragment:
+        """Translates a `PostDecrementNode`."""
+        return self._step(node, '-', True)
+
+    def _binary_operation(self, node: BinaryOperationNode) -> Fragment:
+        """Evaluates both sides and then applies the operator."""
+        if node.operator in ('And', 'Or'):
+            return self._fragment(
+                node,
+                '(',
+                self._expression(node.left),
+                f' {node.operator.lower()} ',
+                self._expression(node.right),
+                ')',
+            )
+        elif node.operator not in OPERATORS:
+            return self._fallback(node)
+        return self._fragment(
+            node,
+            '(',
+            self._expression(node.left),
+            f' {OPERATORS[node.operator]} ',
+            self._expression(node.right),
+            ')',
+        )
+
+    def _translate_arithmetic_operation_node(
+        self,
+        node: ArithmeticOperationNode,
+    ) -> Fragment:
+        """Translates an `ArithmeticOperationNode`."""
+        return self._binary_operation(node)
+
+    def _translate_relational_operation_node(
+        self,
+        node: RelationalOperationNode,
+    ) -> Fragment:
+        """Translates a `RelationalOperationNode`."""
+        return self._binary_operation(node)
+
+    def _translate_logical_operation_node(
+        self,
+        node: LogicalOperationNode,
+    ) -> Fragment:
+        """Translates a `LogicalOperationNode`."""
+        return self._binary_operation(node)
+
+    def _translate_ternary_operation_node(
+        self,
+        node: TernaryOperationNode,
+    ) -> Fragment:
+        """Translates a `TernaryOperationNode`."""
+        return self._fragment(
+            node,
+            '(',
+            self._expression(node.then),
+            ' if ',
+            self._expression(node.condition),
+            ' else ',
+            (
+                self._expression(node.orelse)
+                if node.orelse is not None
+                else 'None'
+            ),
+            ')',
+        )
+
+    def _declaration(
+        self, node: VariableDeclarationNode, default: str
+    ) -> Fragment:
+        """Declares a variable with its value or a default one."""
+        return self._fragment(
+            node,
+            f'rt.environment.assign({ascii(node.identifier.value)}, ',
+            (
+                self._expression(node.expression)
+                if node.expression is not None
+                else default
+            ),
+            ')',
+        )
+
+    def _translate_variable_declaration_node(
+        self,
+        node: VariableDeclarationNode,
+    ) -> Fragment:
+        """Translates a `VariableDeclarationNode`."""
+        return self._declaration(node, '_null')
+
+    def _translate_variadic_parameter_declaration_node(
+        self,
+        node: VariadicParameterDeclarationNode,
+    ) -> Fragment:
+        """Translates a `VariadicParameterDeclarationNode`."""
+        return self._declaration(node, 'ListObject(elements=[])')
+
+    def _assignment(
+        self,
+        node: AssignmentNode,
+        operator: Optional[str],
+    ) -> Fragment:
+        """Translates an assignment to a plain variable."""
+        if len(node.references.items) != 1 or not isinstance(
+            target := node.references.items[0], IdentifierNode
+        ):
+            return self._fallback(node)
+        elif operator is None:
+            return self._fragment(
+                node,
+                f'rt.environment.replace({ascii(target.value)}, ',
+                self._expression(node.expression),
+                ')',
+            )
+        return self._fragment(
+            node,
+            f'rt.environment.replace({ascii(target.value)}, ',
+            f'rt.environment.locate({ascii(target.value)}) {operator} ',
+            self._expression(node.expression),
+            ')',
+        )
+
+    def _translate_assignment_node(self, node: AssignmentNode) -> Fragment:
+        """Translates an `AssignmentNode`."""
+        return self._assignment(node, None)
+
+    def _translate_aggregate_assignment(
+        self,
+        node: AggregateAssignmentNode,
+    ) -> Fragment:
+        """Translates an assignment that combines the previous value."""
+        return self._assignment(
+            node,
+            OPERATORS[node.__class__.__name__.removesuffix('AssignmentNode')],
+        )
+
+    _translate_left_shift_assignment_node = _translate_aggregate_assignment
+    _translate_right_shift_assignment_node = _translate_aggregate_assignment
+    _translate_add_assignment_node = _translate_aggregate_assignment
+    _translate_subtract_assignment_node = _translate_aggregate_assignment
+    _translate_multiply_assignment_node = _translate_aggregate_assignment
+    _translate_divide_assignment_node = _translate_aggregate_assignment
+    _translate_modulus_assignment_node = _translate_aggregate_assignment
+    _translate_power_assignment_node = _translate_aggregate_assignment
+
+    def _loop_body(self, node: WhileNode) -> None:
+        """Generates the body of a loop and its else clause.
+
+        The body catches the exceptions of `break!` and `continue!` that come
+        from the functions it calls.
+        """
+        self._indent += 1
+        self._line(Fragment(parts=['try:']))
+        self._loops += 1
+        self._indented(node.body)
+        self._loops -= 1
+        for error, statement in (('Break', 'break'), ('Continue', 'continue')):
+            self._line(Fragment(parts=[f'except {error}Error:']))
+            self._indent += 1
+            self._line(Fragment(parts=[statement]))
+            self._indent -= 1
+        self._indent -= 1
+        if node.orelse is not None:
+            self._line(Fragment(parts=['else:']))
+            self._indented(node.orelse)
+        return None
+
+    def _generate_while_node(self, node: WhileNode) -> None:
+        """Generates a `WhileNode`."""
+        self._line(
+            Fragment(parts=['while ', self._expression(node.condition), ':'])
+        )
+        return self._loop_body(node)
+
+    def _generate_for_node(self, node: ForNode) -> None:
+        """Generates a `ForNode`."""
+        self._statement(node.initial)
+        item = f'_i{self._index(node)}'
+        self._line(
+            Fragment(
+                parts=[
+                    f'for {item} in ',
+                    self._fragment(
+                        node, 'iter(', self._expression(node.condition), ')'
+                    ),
+                    ':',
+                ]
+            )
+        )
+        names = tuple(
+            (
+                variable.value
+                if isinstance(variable, IdentifierNode)
+                else variable.identifier.value  # type: ignore[union-attr]
+            )
+            for variable in node.initial.items
+        )
+        self._indent += 1
+        self._line(
+            self._fragment(
+                node,
+                (
+                    f'rt.environment.assign({ascii(names[0])}, {item})'
+                    # The numbers of a range are never unpacked
+                    if len(names) == 1 and isinstance(node.condition, RangeNode)
+                    else f'store_for(rt.environment, {ascii(names)}, {item})'
+                ),
+            )
+        )
+        self._indent -= 1
+        return self._loop_body(node)
+
+    def _generate_break_node(self, node: BreakNode) -> None:
+        """Generates a `BreakNode`."""
+        self._line(
+            Fragment(
+                parts=[
+                    (
+                        'break'
+                        if self._loops
+                        else "raise BreakError('If there was a loop, "
+                        "it was broken!')"
+                    )
+                ]
+            )
+        )
+        return None
+
+    def _generate_continue_node(self, node: ContinueNode) -> None:
+        """Generates a `ContinueNode`."""
+        self._line(
+            Fragment(
+                parts=[
+                    (
+                        'continue'
+                        if self._loops
+                        else "raise ContinueError('If you can go to the "
+                        "next round!')"
+                    )
+                ]
+            )
+        )
+        return None
+
+    def _generate_if_node(self, node: IfNode) -> None:
+        """Generates an `IfNode`."""
+        self._line(
+            Fragment(parts=['if ', self._expression(node.condition), ':'])
+        )
+        self._indented(node.body)
+        if node.orelse is not None:
+            self._line(Fragment(parts=['else:']))
+            self._indented(node.orelse)
+        return None
+
+    def _case(self, node: MatchNode, case: CaseNode, subject: str) -> Fragment:
+        """Tests the subject of a match against a case."""
+        if isinstance(case.condition, ItemizedExpressionNode):
+            return self._fragment(
+                node, f'{subject} in ', self._expression(case.condition)
+            )
+        return self._fragment(
+            node,
+            f'{subject} == ',
+            self._expression(case.condition),
+            f' or {subject} in ',
+            self._expression(case.condition),
+        )
+
+    def _generate_match_node(self, node: MatchNode) -> None:
+        """Generates a `MatchNode` as a chain of conditions."""
+        if not node.body.body:
+            self._line(self._fallback(node))
+            return None
+        subject = f'_m{self._index(node)}'
+        self._line(
+            Fragment(parts=[f'{subject} = ', self._expression(node.expression)])
+        )
+        case, keyword = node.body.body[0], 'if'
+        while isinstance(case, CaseNode):
+            self._line(
+                Fragment(
+                    parts=[f'{keyword} ', self._case(node, case, subject), ':']
+                )
+            )
+            self._indented(case.body)
+            case, keyword = case.orelse, 'elif'
+        if case is not None:
+            self._line(Fragment(parts=['else:']))
+            self._indented(case)
+        return None
+
+    def _generate_function_definition_node(
+        self,
+        node: FunctionDefinitionNode,
+    ) -> None:
+        """Generates a `FunctionDefinitionNode` and queues its body."""
+        if (index := self._index(node)) is None or not isinstance(
+            node.body, BlockNode
+        ):
+            self._line(self._fallback(node))
+            return None
+        self._pending.append(node)
+        self._line(
+            self._fragment(
+                node,
+                f'rt.environment.assign({ascii(node.identifier.value)}, ',
+                f'rt._define(_nodes[{index}], _f{index}))',
+            )
+        )
+        return None
+
+    def _generate_return_node(self, node: ReturnNode) -> None:
+        """Generates a `ReturnNode`."""
+        expression = (
+            self._call(node.expression, True)
+            if self._function
+            and isinstance(node.expression, CallNode)
+            and CallNode not in self.fallbacks
+            else (
+                self._expression(node.expression)
+                if node.expression is not None
+                else '_null'
+            )
+        )
+        self._line(
+            self._fragment(
+                node,
+                *(
+                    ('return ', expression)
+                    if self._function
+                    else ('raise ReturnError(expression=', expression, ')')
+                ),
+            )
+        )
+        return None
@@ -8,3 +8,9 @@ RESOURCES_ROOT_PATH = 'FARRPATH'  # Get from environment variables
 FILE_EXTENSION = 'farr'
 
 LIBRARY_INITIALIZER_FILE = f'funda.{FILE_EXTENSION}'
+
+CACHE_DIRECTORY = '__farrcache__'
+
+CACHE_DISABLER = 'FARRNOCACHE'  # Set to anything to skip the cache
+
+TAIL_CALLS_DISABLER = 'FARRNOTAILCALLS'  # Set to anything to keep every call
@@ -3,8 +3,28 @@
 # We understand that beauty is not objective...
 # https://github.com/sheikhartin/farr
 
+import dataclasses
 from dataclasses import dataclass, field
-from typing import Optional, Any
+from typing import Optional, Any, List, Tuple
+
+from farr.parser.nodes import ASTNode, PositionedNode
+
+
+def position(node: Optional[ASTNode]) -> Optional[Tuple[int, int]]:
+    """Finds the row and column of the first positioned node in a tree."""
+    pending: List[Any] = [node]
+    while pending:
+        if isinstance(value := pending.pop(), list):
+            pending.extend(reversed(value))
+        elif isinstance(value, PositionedNode):
+            return value.row, value.column
+        elif isinstance(value, ASTNode) and dataclasses.is_dataclass(value):
+            pending.extend(
+                reversed(
+                    [getattr(value, x.name) for x in dataclasses.fields(value)]
+                )
+            )
+    return None
 
 
 class BreakError(Exception):
@@ -24,7 +44,39 @@ class ReturnError(Exception):
 
 @dataclass
 class InterpretError(Exception):
-    """Exception to keep the error and the node that caused it cleaner."""
+    """Exception to keep the error and the node that caused it cleaner.
+
+    The nodes are only turned into locations when the error is reported, so
+    errors that are caught by the program cost almost nothing.
+
+    Attributes:
+        error: The original error.
+        origin: The innermost node that the error comes from.
+        calls: The calls that the error has come out of, from the innermost
+            one. A missing node is a call whose node is not known yet.
+    """
 
     error: BaseException = field(kw_only=True)
-    origin: str = field(kw_only=True)
+    origin: Optional[ASTNode] = field(default=None, kw_only=True)
+    calls: List[Optional[ASTNode]] = field(default_factory=list, kw_only=True)
+
+    def leave(self) -> None:
+        """Marks that the error is leaving the body of a function."""
+        self.calls.append(None)
+        return None
+
+    def passed(self, node: Optional[ASTNode]) -> None:
+        """Takes the node as the call that the error has just left."""
+        if self.calls and self.calls[-1] is None:
+            self.calls[-1] = node
+        return None
+
+    @property
+    def location(self) -> Optional[Tuple[int, int]]:
+        """Returns the row and column that the error comes from."""
+        return position(self.origin)
+
+    @property
+    def traceback(self) -> List[Tuple[int, int]]:
+        """Returns the row and column of the calls, from the innermost one."""
+        return [x for x in map(position, self.calls) if x is not None]
@@ -4,7 +4,9 @@
 # https://github.com/sheikhartin/farr
 
 import re
-from typing import Callable, Sequence, Any, List, Tuple
+from typing import Optional, Callable, Sequence, Any, List, Tuple
+
+INTERPOLATION = re.compile(r'(?<!\\)\$\{(.*?)\}')
 
 
 def partition_a_sequence(
@@ -30,3 +32,62 @@ def normalize_identifier(identifier: str) -> str:
         .replace('!', 'e')
         .replace('?', 'q')
     )
+
+
+def unescape_string(value: str) -> str:
+    """Removes the quotes of a string literal and handles its escapes."""
+    return (
+        cleaned_value.translate(
+            str.maketrans(
+                {  # type: ignore[arg-type]
+                    '\n': r'\\n',
+                    '\t': r'\\t',
+                    '\b': r'\\b',
+                    '\r': r'\\r',
+                    '\"': r'\\\"',
+                    '\\': r'\\\\',
+                }
+            )
+        )
+        if (
+            (cleaned_value := re.sub(r'^r?"|"$', '', value))
+            and value.startswith('r')
+        )
+        else re.sub(
+            r'\\([ntrb"\\])',
+            lambda match_: {  # type: ignore[return-value]
+                'n': '\n',
+                't': '\t',
+                'r': '\r',
+                'b': '\b',
+                '"': '"',
+                '\\': '\\',
+            }.get(
+                match_.group(1), None  # type: ignore[arg-type]
+            ),
+            cleaned_value,
+        )
+    )
+
+
+def split_interpolations(value: str) -> List[str]:
+    """Unescapes a string literal and splits it around its interpolations.
+
+    The texts are at the even indices and the sources of the interpolations
+    between them, so a string without any is a single text.
+    """
+    return INTERPOLATION.split(unescape_string(value))
+
+
+def plain_string(value: str) -> Optional[str]:
+    """Returns the text of a string literal without interpolations."""
+    *parts, last = split_interpolations(value)
+    return None if parts else last
+
+
+def substitute_interpolations(
+    text: str,
+    interpolate: Callable[[re.Match], str],
+) -> str:
+    """Replaces the interpolations that are left in an unescaped text."""
+    return INTERPOLATION.sub(interpolate, text) if '${' in text else text
@@ -6,21 +6,27 @@
 import re
 import os
 import pathlib
-from functools import reduce
-from typing import types, Optional, Union, Any, Sequence, List, Tuple  # type: ignore[attr-defined]
+from functools import partial, reduce
+from typing import types, Optional, Union, Any, Callable, Sequence, List, Tuple, Dict  # type: ignore[attr-defined]
 
 from farr.constants import (
     RESOURCES_ROOT_PATH,
     FILE_EXTENSION,
     LIBRARY_INITIALIZER_FILE,
+    TAIL_CALLS_DISABLER,
+)
+from farr.helpers import (
+    partition_a_sequence,
+    unescape_string,
+    substitute_interpolations,
 )
-from farr.helpers import partition_a_sequence
 from farr.exceptions import (
     BreakError,
     ContinueError,
     ReturnError,
     InterpretError,
 )
+from farr.cache import load_module
 from farr.lexer import FarrRegexLexer
 from farr.parser import FarrParser
 from farr.parser.nodes import (
@@ -35,6 +41,7 @@ from farr.parser.nodes import (
     IntegerNode,
     FloatNode,
     StringNode,
+    InterpolatedStringNode,
     IdentifierNode,
     RangeNode,
     ItemizedExpressionNode,
@@ -78,7 +85,16 @@ from farr.parser.nodes import (
     StructDefinitionNode,
     ReturnNode,
 )
-from farr.interpreter.base import Environment, Interpreter
+from farr.interpreter.base import (
+    Environment,
+    Frame,
+    Completion,
+    ReturnCompletion,
+    BREAK,
+    CONTINUE,
+    TailCall,
+    Interpreter,
+)
 from farr.interpreter.objects import (
     FarrObject,
     PassObject,
@@ -100,6 +116,9 @@ from farr.interpreter.objects import (
     PythonNativePanicObject,
     PythonNativeAssertObject,
     PythonNativeExitObject,
+    PythonNativeSetObject,
+    PythonNativeDequeObject,
+    PythonNativeHeapObject,
     PythonNativeTypeOfObject,
     PythonNativeSimilarTypesObject,
     PythonNativeShellExecutionObject,
@@ -125,6 +144,8 @@ from farr.interpreter.objects import (
     FunctionDefinitionObject,
     StructDefinitionObject,
 )
+from farr.interpreter.registry import modules
+from farr.interpreter.resolver import Scope, Signature, Resolver, sign
 
 
 class FarrInterpreter(Interpreter):
@@ -138,6 +159,9 @@ class FarrInterpreter(Interpreter):
         'panic_eq': PythonNativePanicObject(),
         'assert_e': PythonNativeAssertObject(),
         'exit_e': PythonNativeExitObject(),
+        'set': PythonNativeSetObject(),
+        'deque': PythonNativeDequeObject(),
+        'heap': PythonNativeHeapObject(),
         'typeof_q': PythonNativeTypeOfObject(),
         'similartypes_q': PythonNativeSimilarTypesObject(),
         'cmd_eq': PythonNativeShellExecutionObject(),
@@ -158,16 +182,46 @@ class FarrInterpreter(Interpreter):
         'DeprecatedError': PythonNativeDeprecatedErrorObject,
     }
 
+    def __init__(
+        self,
+        *,
+        environment: Optional[Environment] = None,
+        tail_calls: Optional[bool] = None,
+        cache: Optional[bool] = None,
+    ) -> None:
+        super().__init__(environment=environment)
+        # Unless told otherwise, the environment variables have the last word
+        self.tail_calls = (
+            not os.getenv(TAIL_CALLS_DISABLER)
+            if tail_calls is None
+            else tail_calls
+        )
+        self.cache = cache
+
+    def _builtins(self) -> Dict[str, Any]:
+        """Returns the builtins with the heap bound to run our functions."""
+        # The keys of a heap may be functions that only we can run
+        return {
+            name: (
+                builtin.bind(self._invoke_non_python_native_object)
+                if isinstance(builtin, PythonNativeHeapObject)
+                else builtin
+            )
+            for name, builtin in self.builtin_symbols.items()
+        }
+
     def _interpret_module_node(self, node: ModuleNode) -> None:
         """Interprets a `ModuleNode`."""
         for child in node.body:
-            self._interpret(child)
+            if isinstance(result := self._interpret(child), Completion):
+                raise result.error()
         return None
 
-    def _interpret_block_node(self, node: BlockNode) -> None:
-        """Interprets a `BlockNode`."""
+    def _interpret_block_node(self, node: BlockNode) -> Optional[Completion]:
+        """Interprets a `BlockNode` and stops at the first completion."""
         for child in node.body:
-            self._interpret(child)
+            if isinstance(result := self._interpret(child), Completion):
+                return result
         return None
 
     def _interpret_pass_node(self, node: PassNode) -> PassObject:
@@ -179,33 +233,43 @@ class FarrInterpreter(Interpreter):
         return NullObject()
 
     def _interpret_binary_node(self, node: BinaryNode) -> IntegerObject:
-        """Converts a `BinaryNode` to a `IntegerObject`."""
-        return IntegerObject(value=int(node.value, 2))
+        """Converts a `BinaryNode` to a `IntegerObject` once."""
+        if (result := node._constant) is None:
+            result = node._constant = IntegerObject(value=int(node.value, 2))
+        return result
 
     def _interpret_octal_node(self, node: OctalNode) -> IntegerObject:
-        """Converts an `OctalNode` to an `IntegerObject`."""
-        return IntegerObject(value=int(node.value, 8))
+        """Converts an `OctalNode` to an `IntegerObject` once."""
+        if (result := node._constant) is None:
+            result = node._constant = IntegerObject(value=int(node.value, 8))
+        return result
 
     def _interpret_hexadecimal_node(
         self,
         node: HexadecimalNode,
     ) -> IntegerObject:
-        """Converts a `HexadecimalNode` to a `IntegerObject`."""
-        return IntegerObject(value=int(node.value, 16))
+        """Converts a `HexadecimalNode` to a `IntegerObject` once."""
+        if (result := node._constant) is None:
+            result = node._constant = IntegerObject(value=int(node.value, 16))
+        return result
 
     def _interpret_integer_node(self, node: IntegerNode) -> IntegerObject:
-        """Converts an `IntegerNode` to an `IntegerObject`."""
-        return IntegerObject(value=int(node.value))
+        """Converts an `IntegerNode` to an `IntegerObject` once."""
+        if (result := node._constant) is None:
+            result = node._constant = IntegerObject(value=int(node.value))
+        return result
 
     def _interpret_float_node(self, node: FloatNode) -> FloatObject:
-        """Converts a `FloatNode` to a `FloatObject`."""
-        return FloatObject(value=float(node.value))
+        """Converts a `FloatNode` to a `FloatObject` once."""
+        if (result := node._constant) is None:
+            result = node._constant = FloatObject(value=float(node.value))
+        return result
 
     def _interpolate(self, match_: re.Match) -> str:
         """Interpolates and executes a match."""
         return ' '.join(
             map(
-                lambda x: str(self._interpret(x)),
+                lambda x: str(self._settle(self._interpret(x))),
                 FarrParser()
                 .parse(FarrRegexLexer().tokenize(f'{match_.group(1)};'))
                 .body,
@@ -213,44 +277,31 @@ class FarrInterpreter(Interpreter):
         )
 
     def _interpret_string_node(self, node: StringNode) -> StringObject:
-        """Converts a `StringNode` to a `StringObject`."""
+        """Converts a `StringNode` to a `StringObject`.
+
+        Only the text is kept, as strings keep their place while they are
+        iterated over.
+        """
+        if (text := node._constant) is None:
+            text = node._constant = unescape_string(node.value)
         return StringObject(
-            value=re.sub(
-                r'(?<!\\)\$\{(.*?)\}',
-                self._interpolate,
-                (
-                    cleaned_value.translate(
-                        str.maketrans(
-                            {  # type: ignore[arg-type]
-                                '\n': r'\\n',
-                                '\t': r'\\t',
-                                '\b': r'\\b',
-                                '\r': r'\\r',
-                                '\"': r'\\\"',
-                                '\\': r'\\\\',
-                            }
-                        )
-                    )
-                    if (
-                        (cleaned_value := re.sub(r'^r?"|"$', '', node.value))
-                        and node.value.startswith('r')
-                    )
-                    else re.sub(
-                        r'\\([ntrb"\\])',
-                        lambda match_: {
-                            'n': '\n',
-                            't': '\t',
-                            'r': '\r',
-                            'b': '\b',
-                            '"': '"',
-                            '\\': '\\',
-                        }.get(
-                            match_.group(1), None  # type: ignore[arg-type]
-                        ),
-                        cleaned_value,
-                    )
-                ),
+            value=substitute_interpolations(text, self._interpolate)
+        )
+
+    def _interpret_interpolated_string_node(
+        self,
+        node: InterpolatedStringNode,
+    ) -> StringObject:
+        """Joins the texts of a string with its evaluated interpolations."""
+        return StringObject(
+            value=''.join(
+                text
+                + ' '.join(
+                    str(self._settle(self._interpret(x))) for x in expressions
+                )
+                for text, expressions in zip(node.texts, node.interpolations)
             )
+            + node.texts[-1]
         )
 
     def _interpret_identifier_node(self, node: IdentifierNode) -> Any:
@@ -306,6 +357,18 @@ class FarrInterpreter(Interpreter):
             )
         return result[self._interpret(y)]
 
+    def _load_attribute(self, result: Any, name: str) -> Any:
+        """Follows a name in a chain whose previous link is evaluated."""
+        if not result:
+            return result[self.environment.locate(name)]
+        elif isinstance(target := getattr(result, name), NonPythonNativeObject):
+            target.environment = result.environment
+        return (
+            PythonNativeClassMethodObject(method=target)
+            if isinstance(target, types.MethodType)
+            else target
+        )
+
     def _interpret_chained_expressions_node(
         self,
         node: ChainedExpressionsNode,
@@ -332,175 +395,242 @@ class FarrInterpreter(Interpreter):
             value=self._interpret(node.value),
         )
 
-    def _populate_params(
+    def _bind(
         self,
-        params: ItemizedExpressionNode,
-        args: ItemizedExpressionNode,
+        signature: Signature,
+        args: List[Any],
+        expandables: Sequence[Any] = (),
+        keywords: Sequence[Tuple[str, str, Any]] = (),
     ) -> None:
-        """Tries to assign arguments to parameters."""
-        required, optional = partition_a_sequence(
-            params.items, lambda x: x.expression is None
-        )
-        required, variadic = partition_a_sequence(
-            required,
-            lambda x: not isinstance(x, VariadicParameterDeclarationNode),
-        )
-        args_, kwargs = partition_a_sequence(
-            args.items, lambda x: not isinstance(x, AssignmentNode)
-        )
-        args_, exp_args = partition_a_sequence(
-            args_, lambda x: not isinstance(x, ExpandableArgumentNode)
-        )
-        if len(args.items) > len(params.items) and not variadic:
-            raise TypeError(
-                'Too many arguments provided. '
-                'Please check the function definition.'
-            )
-        elif len(args.items) < len(required) and not variadic and not exp_args:
-            raise TypeError(
-                'Not enough arguments provided for the required parameters.'
-            )
-        elif len(args_) > len(required) and not variadic:
-            raise TypeError(
-                'Provided more positional arguments than the function accepts.'
-            )
-        elif not args_ and not exp_args and required:
-            raise TypeError('Required parameters are missing arguments.')
-        elif (args_ or exp_args) and not required and optional:
+        """Assigns the arguments to the parameters in a single pass."""
+        if expandables:
+            args = [*args, *(x for expanded in expandables for x in expanded)]
+        positional, rest = signature.positional, signature.rest
+        if args and not positional and signature.keywords:
             raise TypeError(
                 'Positional arguments provided but the function expects '
                 'only keyword arguments.'
             )
-        elif kwargs and not optional:
+        elif len(args) > len(positional) and rest is None:
             raise TypeError(
-                'Keyword arguments provided but the function does not accept them.'
+                'Provided more positional arguments than the function '
+                'accepts.'
             )
-        elif kwargs and set(
-            map(lambda x: x.references.items[0].value, kwargs)
-        ).isdisjoint(map(lambda x: x.identifier.value, optional)):
+        elif len(args) < len(positional):
             raise TypeError(
-                'Provided keyword arguments do not correspond to any optional '
-                'parameters. Please check the function definition for valid '
-                'parameter names.'
+                'Not enough arguments provided for the required parameters.'
+                if args
+                else 'Required parameters are missing arguments.'
             )
-        elif len(variadic) > 1:
+        elif keywords and not signature.keywords:
             raise TypeError(
-                'Multiple variadic parameters defined. '
-                'A function can only have one variadic parameter.'
+                'Keyword arguments provided but the function does not '
+                'accept them.'
             )
 
-        for param, arg in zip(required.copy(), args_.copy()):
-            required.pop(0)
-            args_.pop(0)
-            self.environment.assign(param.identifier.value, arg)
-        if (
-            exp_args
-            and (exp_args := exp_args.pop(0).expression)
-            and variadic
-            and not required
-        ):
-            self.environment.assign(variadic.pop(0).identifier.value, exp_args)
-        elif (
-            exp_args
-            and len(exp_args.elements) == len(required)  # type: ignore[attr-defined]
-            and not variadic
-        ):
-            for param, arg in zip(required, exp_args):
-                self.environment.assign(param.identifier.value, arg)
-        elif exp_args and required:
-            for param, arg in zip(required.copy(), exp_args.elements.copy()):  # type: ignore[attr-defined]
-                required.pop(0)
-                exp_args.elements.pop(0)  # type: ignore[attr-defined]
-                self.environment.assign(param.identifier.value, arg)
-            if exp_args and not variadic:
+        bound = list(zip(positional, args))
+        if rest is not None:
+            bound.append(
+                (rest, ListObject(elements=list(args[len(positional) :])))
+            )
+        for _, name, arg in keywords:
+            if (index := signature.keywords.get(name, None)) is None:
+                if name not in signature.names:
+                    raise NameError(f'There is no parameter name `{name}`!')
                 raise TypeError(
-                    'Extra arguments remain after unpacking, but no variadic '
-                    'parameter is available to receive them.'
+                    'Provided keyword arguments do not correspond to any '
+                    'optional parameters. Please check the function '
+                    'definition for valid parameter names.'
                 )
-            variadic_ = self.environment.locate(
-                variadic.pop(0).identifier.value
-            )
-            variadic_.elements.extend(exp_args)
-        elif args_ and variadic:
-            variadic_ = self.environment.locate(
-                variadic.pop(0).identifier.value
-            )
-            variadic_.elements.extend(args_)
-        for kwarg in kwargs:
-            if not self.environment.exists(
-                name := kwarg.references.items.copy().pop().value, 0
-            ):
-                raise NameError(f'There is no parameter name `{name}`!')
-            self.environment.assign(name, kwarg.expression)
+            bound.append((index, arg))
+        if isinstance(environment := self.environment, Frame):
+            slots, targets = environment.slots, signature.slots
+            for index, arg in bound:
+                slots[targets[index]] = arg
+        else:
+            declarations = signature.declarations
+            for index, arg in bound:
+                environment.assign(declarations[index][0], arg)
         return None
 
     def _call_non_python_native_object(
         self,
         invoke: NonPythonNativeObject,
         args: ItemizedExpressionNode,
+        tail: bool = False,
     ) -> FarrObject:
         """Calls native objects of our language."""
-        args_, kwargs = partition_a_sequence(
-            args.items, lambda x: not isinstance(x, AssignmentNode)
+        return (
+            self._tail_call if tail else self._invoke_non_python_native_object
+        )(invoke, *self._evaluate_arguments(args))
+
+    def _evaluate_arguments(
+        self,
+        args: ItemizedExpressionNode,
+    ) -> Tuple[List[Any], List[Any], List[Tuple[str, str, Any]]]:
+        """Evaluates the positional, expanded and keyword arguments."""
+        args_, expandables, keywords = [], [], []
+        for arg in args.items:
+            if isinstance(arg, AssignmentNode):
+                keywords.append(arg)
+            elif isinstance(arg, ExpandableArgumentNode):
+                expandables.append(arg)
+            else:
+                args_.append(self._interpret(arg))
+        return (
+            args_,
+            [self._interpret(x.expression) for x in expandables],
+            [
+                (
+                    x.references.items[0].value,  # type: ignore[union-attr]
+                    x.references.items[-1].value,  # type: ignore[union-attr]
+                    self._interpret(x.expression),
+                )
+                for x in keywords
+            ],
         )
-        args_, exp_args = partition_a_sequence(
-            args_, lambda x: not isinstance(x, ExpandableArgumentNode)
+
+    def _invoke_non_python_native_object(
+        self,
+        invoke: NonPythonNativeObject,
+        args: List[Any],
+        expandables: Sequence[Any] = (),
+        keywords: Sequence[Tuple[str, str, Any]] = (),
+    ) -> FarrObject:
+        """Runs a function or a struct with the evaluated arguments."""
+        return self._enter(
+            invoke, self._prepare(invoke, args, expandables, keywords)
         )
-        args_ = list(map(self._interpret, args_))
-        exp_args = list(
-            map(
-                lambda x: ExpandableArgumentNode(
-                    expression=self._interpret(x.expression)
-                ),
-                exp_args,
+
+    def _tail_call(
+        self,
+        invoke: NonPythonNativeObject,
+        args: List[Any],
+        expandables: Sequence[Any] = (),
+        keywords: Sequence[Tuple[str, str, Any]] = (),
+    ) -> Union[FarrObject, TailCall]:
+        """Leaves a call in tail position for the caller to make.
+
+        The Python frames of the caller are gone before the callee runs, so
+        recursion in tail position does not grow the Python stack. The frame
+        of the caller stays the parent of the callee as in any other call.
+        Calls inside a `try` body are made at once to keep them guarded.
+        """
+        if not self._leaves_tail_calls():
+            return self._invoke_non_python_native_object(
+                invoke, args, expandables, keywords
             )
+        return TailCall(
+            invoke=invoke,
+            environment=self._prepare(invoke, args, expandables, keywords),
         )
-        kwargs = list(
-            map(
-                lambda x: AssignmentNode(
-                    references=x.references,
-                    expression=self._interpret(x.expression),
-                ),
-                kwargs,
-            )
+
+    def _leaves_tail_calls(self) -> bool:
+        """Checks if a call in tail position can be left for the caller."""
+        return (
+            self.tail_calls
+            and isinstance(environment := self.environment, Frame)
+            and not environment.guards
         )
 
-        environment_backup = self.environment
-        self.environment = Environment(
-            parent=(
-                invoke.environment
-                if invoke.environment is not None
-                else self.environment
-            )
+    def _prepare(
+        self,
+        invoke: NonPythonNativeObject,
+        args: List[Any],
+        expandables: Sequence[Any] = (),
+        keywords: Sequence[Tuple[str, str, Any]] = (),
+    ) -> Environment:
+        """Makes the environment of a call and binds the arguments in it."""
+        caller = self.environment
+        parent = (
+            invoke.environment if invoke.environment is not None else caller
         )
-        self._interpret(
+        self.environment = (
+            Frame(layout=self._scope(invoke).names, parent=parent)
+            if isinstance(invoke, FunctionDefinitionObject)
+            else Environment(parent=parent)
+        )
+        signature = self._signature(
             invoke.params
             if isinstance(invoke, FunctionDefinitionObject)
             else invoke.attributes  # type: ignore[attr-defined]
         )
-        self._populate_params(
-            (
-                invoke.params
-                if isinstance(
-                    invoke,
-                    FunctionDefinitionObject,
+        try:
+            for name, default, variadic in signature.declarations:
+                self.environment.assign(
+                    name,
+                    (
+                        self._interpret(default)
+                        if default is not None
+                        else (
+                            ListObject(elements=[])
+                            if variadic
+                            else NullObject()
+                        )
+                    ),
                 )
-                else invoke.attributes  # type: ignore[attr-defined]
-            ),
-            ItemizedExpressionNode(items=sum([args_, exp_args, kwargs], [])),
-        )
+            self._bind(signature, args, expandables, keywords)
+        except InterpretError as e:
+            e.leave()
+            raise
+        finally:
+            environment, self.environment = self.environment, caller
+        return environment
+
+    def _enter(
+        self,
+        invoke: NonPythonNativeObject,
+        environment: Environment,
+    ) -> FarrObject:
+        """Runs a prepared call and then the calls it leaves in tail position."""
+        environment_backup = self.environment
         try:
-            self._interpret(invoke.body)
-        except ReturnError as e:
-            result = e.expression
-        else:
+            while True:
+                self.environment = environment
+                if not isinstance(
+                    result := self._execute_body(invoke.body), TailCall
+                ):
+                    break
+                invoke, environment = result.invoke, result.environment
+        except InterpretError as e:
+            e.leave()
+            raise
+        if result is None:
             result = (
                 StructInstanceObject(environment=self.environment.copy())
                 if isinstance(invoke, StructDefinitionObject)
                 else NullObject()
             )
         self.environment = environment_backup
-        return result  # type: ignore[return-value]
+        return result
+
+    @staticmethod
+    def _signature(params: ItemizedExpressionNode) -> Signature:
+        """Returns the binding plan of some parameters and makes it once."""
+        if (signature := params._signature) is None:
+            signature = params._signature = sign(params)
+        return signature
+
+    def _scope(self, invoke: FunctionDefinitionObject) -> Scope:
+        """Returns the frame layout of a function and resolves it once."""
+        if (scope := invoke.body._scope) is None:
+            scope = invoke.body._scope = Resolver().resolve(
+                invoke.params, invoke.body
+            )
+        return scope
+
+    def _execute_body(self, body: BlockNode) -> Optional[FarrObject]:
+        """Returns the returned value of a body, if there is any."""
+        try:
+            result = self._interpret(body)
+        except ReturnError as e:
+            return e.expression
+        if isinstance(result, ReturnCompletion):
+            return result.expression
+        elif isinstance(result, Completion):
+            # `break!` and `continue!` can leave a function for the caller's loop
+            raise result.error()
+        return None
 
     def _call_python_native_object(
         self,
@@ -534,6 +664,22 @@ class FarrInterpreter(Interpreter):
             else self._call_python_native_object(invoke, node.args)
         )
 
+    def _interpret_tail_call(self, node: CallNode) -> Any:
+        """Interprets a call in tail position like any other call node."""
+        if not isinstance(
+            invoke := self._interpret(node.invoke), NonPythonNativeObject
+        ):
+            return self._interpret(node)
+        try:
+            return self._call_non_python_native_object(invoke, node.args, True)
+        except (BreakError, ContinueError, ReturnError):
+            raise
+        except InterpretError as e:
+            e.passed(node)
+            raise
+        except BaseException as e:
+            raise InterpretError(error=e, origin=node)
+
     def _interpret_grouped_expression_node(
         self,
         node: GroupedExpressionNode,
@@ -736,15 +882,14 @@ class FarrInterpreter(Interpreter):
         self,
         node: LogicalOperationNode,
     ) -> FarrObject:
-        """Interprets logical operations."""
+        """Interprets logical operations without evaluating needless sides."""
         left = self._interpret(node.left)
-        right = self._interpret(node.right)
 
         match node.operator:
             case 'And':
-                return left and right
+                return left and self._interpret(node.right)
             case 'Or':
-                return left or right
+                return left or self._interpret(node.right)
         return None  # type: ignore[return-value]
 
     def _interpret_ternary_operation_node(
@@ -797,20 +942,44 @@ class FarrInterpreter(Interpreter):
             else target.with_suffix(f'.{FILE_EXTENSION}')
         )
 
+    def parse_file(self, file_path: pathlib.Path) -> ModuleNode:
+        """Returns the syntax tree of a file."""
+        return load_module(file_path, self.cache)
+
     def _create_module_environment(
         self,
         file_path: pathlib.Path,
     ) -> Environment:
         """Returns the environment of the interpreted module."""
-        interpreter = FarrInterpreter()
-        interpreter._interpret(
-            (
-                FarrParser().parse(
-                    FarrRegexLexer().tokenize(file_path.read_text())
-                )
-            )
+        interpreter = self.__class__(
+            tail_calls=self.tail_calls, cache=self.cache
+        )
+        interpreter._interpret(interpreter.parse_file(file_path))
+        return interpreter.environment
+
+    def _load_module(self, file_path: pathlib.Path) -> ModuleObject:
+        """Returns the module of the file, interpreting it only once."""
+        return modules.load(  # type: ignore[return-value]
+            file_path,
+            lambda: ModuleObject(
+                environment=self._create_module_environment(file_path)
+            ),
         )
-        return interpreter.environment.copy()
+
+    def _create_library(
+        self,
+        library_initializer: pathlib.Path,
+        modules_path: List[pathlib.Path],
+    ) -> LibraryObject:
+        """Gathers the modules of a library around its initializer."""
+        library_environment = self._create_module_environment(
+            library_initializer
+        )
+        for module_path in modules_path:
+            library_environment.assign(
+                module_path.stem, self._load_module(module_path)
+            )
+        return LibraryObject(environment=library_environment)
 
     def _interpret_use_node(self, node: UseNode) -> None:
         """Handles the import of a library or module."""
@@ -820,27 +989,20 @@ class FarrInterpreter(Interpreter):
         ):
             self.environment.assign(
                 resolved_path.stem,
-                ModuleObject(
-                    environment=self._create_module_environment(resolved_path)
-                ),
+                self._load_module(resolved_path),  # type: ignore[arg-type]
             )
             return None
         (library_initializer, *_), modules_path = partition_a_sequence(
             resolved_path, lambda x: x.name == LIBRARY_INITIALIZER_FILE
         )
-        library_environment = self._create_module_environment(
-            library_initializer
-        )
-        for module_path in modules_path:
-            library_environment.assign(
-                module_path.stem,
-                ModuleObject(
-                    environment=self._create_module_environment(module_path)
-                ),
-            )
         self.environment.assign(
             library_initializer.parent.stem,
-            LibraryObject(environment=library_environment),
+            modules.load(
+                library_initializer.parent,
+                partial(
+                    self._create_library, library_initializer, modules_path
+                ),
+            ),
         )
 
     def _interpret_variable_declaration_node(
@@ -1128,86 +1290,126 @@ class FarrInterpreter(Interpreter):
             ** self._interpret(node.expression),
         )
 
-    def _interpret_while_node(self, node: WhileNode) -> None:
+    def _interpret_while_node(self, node: WhileNode) -> Optional[Completion]:
         """Interprets a `WhileNode`."""
         while self._interpret(node.condition):
             try:
-                self._interpret(node.body)
+                result = self._interpret(node.body)
             except BreakError:
                 break
             except ContinueError:
                 continue
+            if result is BREAK:
+                break
+            elif isinstance(result, ReturnCompletion):
+                return result
         else:
             if node.orelse is not None:
-                self._interpret(node.orelse)
+                return self._interpret(node.orelse)
         return None
 
-    def _interpret_for_node(self, node: ForNode) -> None:
+    def _interpret_for_node(self, node: ForNode) -> Optional[Completion]:
         """Interprets a `ForNode`."""
         self._interpret(node.initial)
-        for iteration in self._interpret(node.condition):
-            for variable, value in zip(
-                node.initial.items,
-                iteration if isinstance(iteration, Sequence) else (iteration,),
-            ):
-                self.environment.assign(
-                    (
-                        variable.value
-                        if isinstance(variable, IdentifierNode)
-                        else variable.identifier.value  # type: ignore[union-attr]
-                    ),
-                    value,
+        bind = self._binder(
+            [
+                (
+                    variable.value
+                    if isinstance(variable, IdentifierNode)
+                    else variable.identifier.value  # type: ignore[union-attr]
                 )
+                for variable in node.initial.items
+            ]
+        )
+        for iteration in self._interpret(node.condition):
+            bind(iteration)
             try:
-                self._interpret(node.body)
+                result = self._interpret(node.body)
             except BreakError:
                 break
             except ContinueError:
                 continue
+            if result is BREAK:
+                break
+            elif isinstance(result, ReturnCompletion):
+                return result
         else:
             if node.orelse is not None:
-                self._interpret(node.orelse)
+                return self._interpret(node.orelse)
         return None
 
-    def _interpret_break_node(self, node: BreakNode) -> None:
-        """Throws a `BreakError` exception."""
-        raise BreakError('If there was a loop, it was broken!')
+    def _binder(self, names: List[str]) -> Callable[[Any], None]:
+        """Returns what assigns each round of a loop to its variables.
+
+        A single variable is bound straight to its slot or symbol when the
+        round is not a sequence, like the numbers of a native range.
+        """
+        environment = self.environment
+
+        def unpack(iteration: Any) -> None:
+            for name, value in zip(
+                names,
+                iteration if isinstance(iteration, Sequence) else (iteration,),
+            ):
+                environment.assign(name, value)
+            return None
+
+        if len(names) != 1:
+            return unpack
+        elif (
+            isinstance(environment, Frame)
+            and (slot := environment.layout.get(names[0], None)) is not None
+        ):
+            assign = partial(environment.slots.__setitem__, slot)
+        else:
+            assign = partial(environment.assign, names[0])
+
+        def bind(iteration: Any) -> None:
+            if isinstance(iteration, Sequence):
+                return unpack(iteration)
+            return assign(iteration)
+
+        return bind
 
-    def _interpret_continue_node(self, node: ContinueNode) -> None:
-        """Throws a `ContinueError` exception."""
-        raise ContinueError('If you can go to the next round!')
+    def _interpret_break_node(self, node: BreakNode) -> Completion:
+        """Breaks the loop around it without raising."""
+        return BREAK
 
-    def _interpret_if_node(self, node: IfNode) -> None:
+    def _interpret_continue_node(self, node: ContinueNode) -> Completion:
+        """Goes to the next round of the loop around it without raising."""
+        return CONTINUE
+
+    def _interpret_if_node(self, node: IfNode) -> Optional[Completion]:
         """Interprets an `IfNode`."""
         if self._interpret(node.condition):
-            self._interpret(node.body)
+            return self._interpret(node.body)
         elif node.orelse is not None:
-            self._interpret(node.orelse)
+            return self._interpret(node.orelse)
         return None
 
-    def _interpret_match_node(self, node: MatchNode) -> None:
+    def _interpret_match_node(self, node: MatchNode) -> Optional[Completion]:
         """Interprets a match-for statement."""
         result = self._interpret(node.expression)
-        case = node.body.body.pop(0)
+        case = node.body.body[0] if node.body.body else None
         while case is not None:
             if isinstance(case, BlockNode):
-                self._interpret(case)
-                return None
+                return self._interpret(case)
             elif (
                 not isinstance(case.condition, ItemizedExpressionNode)  # type: ignore[union-attr]
                 and result == self._interpret(case.condition)  # type: ignore[union-attr]
             ) or result in self._interpret(
                 case.condition  # type: ignore[union-attr]
             ):
-                self._interpret(case.body)  # type: ignore[union-attr]
-                return None
+                return self._interpret(case.body)  # type: ignore[union-attr]
             case = case.orelse  # type: ignore[union-attr]
         return None
 
-    def _interpret_try_node(self, node: TryNode) -> None:
+    def _interpret_try_node(self, node: TryNode) -> Optional[Completion]:
         """Manages trial and error."""
+        if isinstance(frame := self.environment, Frame):
+            frame.guards += 1
         try:
-            self._interpret(node.body)
+            return self._interpret(node.body)
         except InterpretError as e:  # noqa: F841
             catch = node.catch
             while catch is not None:
@@ -1226,13 +1428,16 @@ class FarrInterpreter(Interpreter):
                     self.environment = Environment(parent=self.environment)
                     if catch.as_ is not None:
                         self.environment.assign(catch.as_.value, matches.pop(0))
-                    self._interpret(catch.body)
+                    result = self._interpret(catch.body)
                     self.environment = self.environment.parent  # type: ignore[assignment]
-                    break
+                    return result
                 catch = catch.orelse
             else:
                 if node.catch is not None:
                     raise
+        finally:
+            if isinstance(frame, Frame):
+                frame.guards -= 1
         return None
 
     def _interpret_function_definition_node(
@@ -1240,6 +1445,7 @@ class FarrInterpreter(Interpreter):
         node: FunctionDefinitionNode,
     ) -> None:
         """Defines a `FunctionDefinitionObject` in the environment."""
+        self._signature(node.params)  # type: ignore[arg-type]
         self.environment.assign(
             node.identifier.value,
             FunctionDefinitionObject(
@@ -1285,6 +1491,8 @@ class FarrInterpreter(Interpreter):
     ) -> None:
         """Defines a `StructDefinitionObject` in the environment."""
         body, attributes = self._populate_on_parents(node.body, node.parents)  # type: ignore[arg-type]
+        # The parents may have changed the attributes since the last time
+        attributes._signature = sign(attributes)
         self.environment.assign(
             node.identifier.value,
             StructDefinitionObject(
@@ -1293,9 +1501,18 @@ class FarrInterpreter(Interpreter):
             ),
         )
 
-    def _interpret_return_node(self, node: ReturnNode) -> None:
-        """Throws a `ReturnError` exception."""
-        raise ReturnError(
+    def _interpret_return_node(self, node: ReturnNode) -> Completion:
+        """Leaves the function with a value without raising."""
+        if (
+            isinstance(call := node.expression, CallNode)
+            and (
+                self._handlers.get(CallNode, None)
+                or self._resolve_handler(CallNode)
+            )
+            is FarrInterpreter._interpret_call_node
+        ):
+            return ReturnCompletion(expression=self._interpret_tail_call(call))
+        return ReturnCompletion(
             expression=(
                 self._interpret(node.expression)
                 if node.expression is not None
@@ -7,7 +7,7 @@ import sys
 import re
 from copy import deepcopy
 from dataclasses import dataclass, field
-from typing import Optional, Any, Dict
+from typing import Optional, Any, Callable, Type, List, Dict
 
 from farr.exceptions import (
     BreakError,
@@ -65,36 +65,279 @@ class Environment:
             return self.parent.locate(name)
         raise NameError(f'Nothing was found with the name `{name}`!')
 
+    def holds(self, name: str) -> bool:
+        """Checks if the symbol is in this environment itself."""
+        return name in self.symbols  # type: ignore[operator]
+
+    def get(self, name: str) -> Any:
+        """Returns the value of the symbol in this environment itself."""
+        return self.symbols.get(name, None)  # type: ignore[union-attr]
+
     def exists(self, name: str, depth: Optional[int] = 0) -> bool:
         """Checks if the symbol exists at the specified depth or not."""
         environment = self
         while depth > 0 and environment.parent is not None:  # type: ignore[operator]
             environment = environment.parent
             depth -= 1  # type: ignore[operator]
-        return depth == 0 and name in environment.symbols  # type: ignore[operator]
+        return depth == 0 and environment.holds(name)
 
     def copy(self) -> 'Environment':
         """Helps to copy the environment more easily."""
         return deepcopy(self)
 
 
+UNBOUND = object()
+
+
+@dataclass
+class Frame(Environment):
+    """An environment whose declared names live in a fixed-size list.
+
+    The environments above a frame only change while their own code runs,
+    and that never happens before the frame is left. So the first lookup of
+    a name through the frame finds its holder once for the whole call.
+
+    Attributes:
+        layout: The slot of every name that is declared ahead.
+        slots: The values of the declared names, `UNBOUND` until assigned.
+        guards: How many `try` bodies of the frame are running.
+        _holders: The environment above that holds each looked up name.
+    """
+
+    layout: Dict[str, int] = field(default_factory=dict, kw_only=True)
+    slots: List[Any] = field(init=False, repr=False)
+    guards: int = field(default=0, init=False, repr=False, compare=False)
+    _holders: Optional[Dict[str, Optional[Environment]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        self.slots = [UNBOUND] * len(self.layout)
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> 'Frame':
+        """Returns a deep copy of the frame."""
+        if id(self) in memo:
+            return memo[id(self)]
+        copied_frame = self.__class__(
+            symbols=self.symbols.copy(), layout=self.layout  # type: ignore[union-attr]
+        )
+        copied_frame.slots = self.slots.copy()
+        memo[id(self)] = copied_frame
+        if self.parent is not None:
+            copied_frame.parent = deepcopy(self.parent, memo)
+        return copied_frame
+
+    def _holder_above(self, name: str) -> Optional[Environment]:
+        """Finds the holder of a symbol above the frame once.
+
+        The frames on the way remember the holder too, so the next frame
+        that is called from them stops there.
+        """
+        if self._holders is not None and name in self._holders:
+            return self._holders[name]
+        frames, environment, holder = [self], self.parent, None
+        while environment is not None:
+            if environment.holds(name):
+                holder = environment
+                break
+            elif isinstance(environment, Frame):
+                if (
+                    environment._holders is not None
+                    and name in environment._holders
+                ):
+                    holder = environment._holders[name]
+                    break
+                frames.append(environment)
+            environment = environment.parent
+        for frame in frames:
+            if frame._holders is None:
+                frame._holders = {}
+            frame._holders[name] = holder
+        return holder
+
+    def holds(self, name: str) -> bool:
+        """Checks if the symbol is in this frame itself."""
+        if (slot := self.layout.get(name, None)) is not None:
+            return self.slots[slot] is not UNBOUND
+        return name in self.symbols  # type: ignore[operator]
+
+    def get(self, name: str) -> Any:
+        """Returns the value of the symbol in this frame itself."""
+        if (slot := self.layout.get(name, None)) is not None:
+            return value if (value := self.slots[slot]) is not UNBOUND else None
+        return self.symbols.get(name, None)  # type: ignore[union-attr]
+
+    def assign(self, name: str, value: Any) -> None:
+        """Assigns a value to a symbol in the frame."""
+        if (slot := self.layout.get(name, None)) is not None:
+            self.slots[slot] = value
+            return None
+        self.symbols.update({name: value})  # type: ignore[union-attr]
+
+    def replace(self, name: str, value: Any) -> None:
+        """Updates the symbol if it exists."""
+        if (
+            holder := self if self.holds(name) else self._holder_above(name)
+        ) is None:
+            raise NameError(f'Nothing was found with the name `{name}`!')
+        holder.assign(name, value)
+        return None
+
+    def locate(self, name: str) -> Any:
+        """Tries to find the requested symbol."""
+        if (value := self.get(name)) is not None:
+            return value
+        elif (holder := self._holder_above(name)) is not None:
+            if (value := holder.get(name)) is not None:
+                return value
+            elif holder.parent is not None:
+                return holder.parent.locate(name)
+        raise NameError(f'Nothing was found with the name `{name}`!')
+
+
+class Completion:
+    """Ends the bodies around a statement early without raising."""
+
+    def error(self) -> BaseException:
+        """Returns the exception that carries the completion further."""
+        raise NotImplementedError
+
+
+class BreakCompletion(Completion):
+    """Completion of `break!`."""
+
+    def error(self) -> BaseException:
+        """Returns a `BreakError`."""
+        return BreakError('If there was a loop, it was broken!')
+
+
+class ContinueCompletion(Completion):
+    """Completion of `continue!`."""
+
+    def error(self) -> BaseException:
+        """Returns a `ContinueError`."""
+        return ContinueError('If you can go to the next round!')
+
+
+@dataclass
+class ReturnCompletion(Completion):
+    """Completion of `return!` with its value.
+
+    Attributes:
+        expression: The returned value.
+    """
+
+    expression: Optional[Any] = field(kw_only=True)
+
+    def error(self) -> BaseException:
+        """Returns a `ReturnError`."""
+        return ReturnError(expression=self.expression)
+
+
+BREAK, CONTINUE = BreakCompletion(), ContinueCompletion()
+
+
+@dataclass
+class TailCall:
+    """A call in tail position that is made after its caller returns.
+
+    Attributes:
+        invoke: The function or struct to run.
+        environment: The environment with the arguments already bound.
+    """
+
+    invoke: Any = field(kw_only=True)
+    environment: Environment = field(kw_only=True)
+
+
 class Interpreter:
     """To walk on abstract syntax trees and execute their nodes.
 
     Attributes:
         builtin_symbols: A dictionary that includes the natives of the language.
         environment: An instance of `Environment`.
+        _registered: Handlers that are registered for node types by hand.
+        _handlers: The handler of every node type that is seen so far.
     """
 
     builtin_symbols: Dict[str, Any]
+    _registered: Dict[Type[ASTNode], Callable[[Any, Any], Any]] = {}
+    _handlers: Dict[Type[ASTNode], Callable[[Any, Any], Any]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Gives every interpreter its own handlers."""
+        super().__init_subclass__(**kwargs)
+        cls._registered, cls._handlers = {}, {}
+
+    @classmethod
+    def register(
+        cls,
+        node_type: Type[ASTNode],
+        handler: Callable[[Any, Any], Any],
+    ) -> None:
+        """Handles a node type with a function instead of a named method."""
+        cls._registered[node_type] = handler
+        for interpreter in cls._family():
+            interpreter._handlers.clear()
+        return None
+
+    @classmethod
+    def _family(cls) -> List[Type['Interpreter']]:
+        """Returns the class and all of its subclasses."""
+        return [cls] + [x for y in cls.__subclasses__() for x in y._family()]
+
+    @staticmethod
+    def _handler_name(
+        node_type: Type[ASTNode],
+        prefix: str = '_interpret',
+    ) -> str:
+        """Builds a method name like `_interpret_if_node` for a node type."""
+        return '{}_{}'.format(
+            prefix,
+            '_'.join(
+                map(
+                    str.lower,
+                    filter(
+                        lambda x: x,
+                        re.split(r'([A-Z][a-z]*)', node_type.__name__),
+                    ),
+                )
+            ),
+        )
+
+    @classmethod
+    def _resolve_handler(
+        cls,
+        node_type: Type[ASTNode],
+    ) -> Callable[[Any, Any], Any]:
+        """Finds the handler of a node type once and remembers it."""
+        for interpreter in cls.__mro__:
+            if node_type in (
+                registered := vars(interpreter).get('_registered', {})
+            ):
+                handler = registered[node_type]
+                break
+        else:
+            handler_name = cls._handler_name(node_type)
+            if (handler := getattr(cls, handler_name, None)) is None:
+                raise AttributeError(
+                    f'Implement the `{handler_name}` method in the '
+                    f'`{cls.__name__}` class...'
+                )
+        cls._handlers[node_type] = handler
+        return handler
 
     def __init__(self, *, environment: Optional[Environment] = None) -> None:
         self.environment = (
             environment
             if environment is not None
-            else Environment(symbols=self.builtin_symbols.copy())
+            else Environment(symbols=self._builtins())
         )
 
+    def _builtins(self) -> Dict[str, Any]:
+        """Returns the symbols that a new environment starts with."""
+        return self.builtin_symbols.copy()
+
     def __deepcopy__(self, memo: Dict[int, Any]) -> 'Interpreter':
         """Returns a deep copy of the interpreter."""
         if id(self) in memo:
@@ -106,35 +349,26 @@ class Interpreter:
 
     def _interpret(self, node: ASTNode) -> Any:
         """Interprets the given AST node."""
-        handler_name = '_interpret_{}'.format(
-            '_'.join(
-                map(
-                    str.lower,
-                    filter(
-                        lambda x: x,
-                        re.split(
-                            r'([A-Z][a-z]*)',
-                            node.__class__.__name__,
-                        ),
-                    ),
-                )
-            )
-        )
-        if (interpreter_method := getattr(self, handler_name, None)) is None:
-            raise AttributeError(
-                f'Implement the `{handler_name}` method in the '
-                f'`{self.__class__.__name__}` class...'
-            )
+        if (
+            interpreter_method := self._handlers.get(node.__class__, None)
+        ) is None:
+            interpreter_method = self._resolve_handler(node.__class__)
         try:
-            return interpreter_method(node)
+            return interpreter_method(self, node)
         except (BreakError, ContinueError, ReturnError):
             raise
         except InterpretError as e:
-            raise InterpretError(
-                error=e.error, origin=e.origin  # To avoid nesting errors
-            )
+            e.passed(node)
+            raise
         except BaseException as e:
-            raise InterpretError(error=e, origin=str(node))
+            raise InterpretError(error=e, origin=node)
+
+    @staticmethod
+    def _settle(value: Any) -> Any:
+        """Raises a completion that reaches code which cannot pass it on."""
+        if isinstance(value, Completion):
+            raise value.error()
+        return value
 
     def interpret(self, node: ModuleNode) -> None:
         """Tries to start the interpretation with caution."""
@@ -144,13 +378,16 @@ class Interpreter:
             error_details = (
                 str(e.error).rstrip('!.') or 'No additional error details'
             )
-            (first_row, first_column), *_ = re.findall(
-                r'row=(\d+), column=(\d+)', e.origin
-            )
             print(
-                f'{e.error.__class__.__name__}: {error_details}! '
-                f'Around line {first_row}, column {first_column}.'
+                f'{e.error.__class__.__name__}: {error_details}!'
+                + (
+                    ' Around line {}, column {}.'.format(*location)
+                    if (location := e.location) is not None
+                    else ''
+                )
             )
+            for row, column in e.traceback:
+                print(f'Called around line {row}, column {column}.')
             sys.exit(1)
 
     def copy(self) -> 'Interpreter':
@@ -0,0 +1,646 @@
+# Farr's goal is to give programmers the sense of liberation that comes
+# from the beauty of the code itself, even if it hurts productivity!
+# We understand that beauty is not objective...
+# https://github.com/sheikhartin/farr
+
+import operator
+from typing import Optional, Any, Callable, Type, Dict
+
+from farr.helpers import plain_string
+from farr.exceptions import (
+    BreakError,
+    ContinueError,
+    ReturnError,
+    InterpretError,
+)
+from farr.parser.nodes import (
+    ASTNode,
+    ModuleNode,
+    BlockNode,
+    PassNode,
+    NullNode,
+    BinaryNode,
+    OctalNode,
+    HexadecimalNode,
+    IntegerNode,
+    FloatNode,
+    StringNode,
+    InterpolatedStringNode,
+    IdentifierNode,
+    ItemizedExpressionNode,
+    ListNode,
+    ExpandableArgumentNode,
+    CallNode,
+    GroupedExpressionNode,
+    NegationOperationNode,
+    PreIncrementNode,
+    PreDecrementNode,
+    PostIncrementNode,
+    PostDecrementNode,
+    ArithmeticOperationNode,
+    RelationalOperationNode,
+    LogicalOperationNode,
+    TernaryOperationNode,
+    VariableDeclarationNode,
+    AssignmentNode,
+    AggregateAssignmentNode,
+    LeftShiftAssignmentNode,
+    RightShiftAssignmentNode,
+    AddAssignmentNode,
+    SubtractAssignmentNode,
+    MultiplyAssignmentNode,
+    DivideAssignmentNode,
+    ModulusAssignmentNode,
+    PowerAssignmentNode,
+    WhileNode,
+    ForNode,
+    BreakNode,
+    ContinueNode,
+    IfNode,
+    ReturnNode,
+)
+from farr.interpreter import FarrInterpreter
+from farr.interpreter.base import Interpreter
+from farr.interpreter.objects import (
+    PassObject,
+    NullObject,
+    BooleanObject,
+    IntegerObject,
+    FloatObject,
+    StringObject,
+    ListObject,
+    NonPythonNativeObject,
+)
+
+Closure = Callable[['ClosureInterpreter'], Any]
+
+_PASSING = (BreakError, ContinueError, ReturnError)
+
+_OPERATORS: Dict[str, Callable[[Any, Any], Any]] = {
+    'LeftShift': operator.lshift,
+    'RightShift': operator.rshift,
+    'Add': operator.add,
+    'Subtract': operator.sub,
+    'Multiply': operator.mul,
+    'Divide': operator.truediv,
+    'Modulus': operator.mod,
+    'Power': operator.pow,
+    'EqualEqual': operator.eq,
+    'NotEqual': operator.ne,
+    'LessThan': operator.lt,
+    'GreaterThan': operator.gt,
+    'LessThanOrEqual': operator.le,
+    'GreaterThanOrEqual': operator.ge,
+}
+
+_AGGREGATE_OPERATORS: Dict[type, Callable[[Any, Any], Any]] = {
+    LeftShiftAssignmentNode: operator.lshift,
+    RightShiftAssignmentNode: operator.rshift,
+    AddAssignmentNode: operator.add,
+    SubtractAssignmentNode: operator.sub,
+    MultiplyAssignmentNode: operator.mul,
+    DivideAssignmentNode: operator.truediv,
+    ModulusAssignmentNode: operator.mod,
+    PowerAssignmentNode: operator.pow,
+}
+
+
+def _guarded(node: ASTNode, fn: Closure) -> Closure:
+    """Attaches the node to the errors of a closure like the tree-walker."""
+
+    def closure(interpreter: 'ClosureInterpreter') -> Any:
+        try:
+            return fn(interpreter)
+        except InterpretError as e:
+            e.passed(node)
+            raise
+        except _PASSING:
+            raise
+        except BaseException as e:
+            raise InterpretError(error=e, origin=node)
+
+    return closure
+
+
+class ClosureInterpreter(FarrInterpreter):
+    """Compiles every node once into a Python closure and then runs that.
+
+    Nodes without a specialized compiler are wrapped around their handler in
+    `FarrInterpreter`, so both engines always agree.
+
+    Attributes:
+        _generation: The token that the closures kept on the nodes must
+            carry to be used by this interpreter.
+    """
+
+    _generation: object = object()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Gives every interpreter its own closures."""
+        super().__init_subclass__(**kwargs)
+        cls._generation = object()
+
+    @classmethod
+    def register(
+        cls,
+        node_type: Type[ASTNode],
+        handler: Callable[[Any, Any], Any],
+    ) -> None:
+        """Registers the handler and forgets the closures built without it."""
+        super().register(node_type, handler)
+        for interpreter in cls._family():
+            interpreter._generation = object()  # type: ignore[attr-defined]
+        return None
+
+    def _interpret(self, node: ASTNode) -> Any:
+        """Runs the closure of the node and compiles it if needed."""
+        if (compiled := node._closure) is None or (
+            compiled[0] is not self._generation
+        ):
+            return self._compile(node)(self)
+        return compiled[1](self)
+
+    def _compile(self, node: ASTNode) -> Closure:
+        """Returns the closure of a node."""
+        if (
+            compiled := node._closure
+        ) is not None and compiled[0] is self._generation:
+            return compiled[1]
+        if (
+            any(
+                node.__class__ in vars(x).get('_registered', {})
+                for x in self.__class__.__mro__
+            )
+            or (
+                compiler := getattr(
+                    self, self._handler_name(node.__class__, '_compile'), None
+                )
+            )
+            is None
+            or (closure := compiler(node)) is None
+        ):
+            # The tree-walker handles the node and comes back for its children
+            closure = lambda x: x._settle(  # noqa: E731
+                Interpreter._interpret(x, node)
+            )
+        node._closure = (self._generation, closure)
+        return closure
+
+    def _compile_optional(self, node: Optional[ASTNode]) -> Optional[Closure]:
+        """Compiles a node that may not exist."""
+        return self._compile(node) if node is not None else None
+
+    def _compile_body(self, node: BlockNode) -> Closure:
+        """Runs the children one by one and follows later changes in them."""
+        body, children = node.body, list(map(self._compile, node.body))
+
+        def block(interpreter: ClosureInterpreter) -> None:
+            nonlocal body, children
+            if node.body is not body or len(body) != len(children):
+                body, children = node.body, list(map(self._compile, node.body))
+            for child in children:
+                child(interpreter)
+            return None
+
+        return block
+
+    def _compile_module_node(self, node: ModuleNode) -> Closure:
+        """Compiles a `ModuleNode`."""
+        return self._compile_body(node)
+
+    def _compile_block_node(self, node: BlockNode) -> Closure:
+        """Compiles a `BlockNode`."""
+        return self._compile_body(node)
+
+    def _compile_pass_node(self, node: PassNode) -> Closure:
+        """Compiles a `PassNode`."""
+        return lambda _: PassObject()
+
+    def _compile_null_node(self, node: NullNode) -> Closure:
+        """Compiles a `NullNode`."""
+        return lambda _: NullObject()
+
+    def _compile_integer(self, base: int, value: str) -> Closure:
+        """Converts the literal once and returns the same object."""
+        converted = IntegerObject(value=int(value, base))
+        return lambda _: converted
+
+    def _compile_binary_node(self, node: BinaryNode) -> Closure:
+        """Compiles a `BinaryNode`."""
+        return self._compile_integer(2, node.value)
+
+    def _compile_octal_node(self, node: OctalNode) -> Closure:
+        """Compiles an `OctalNode`."""
+        return self._compile_integer(8, node.value)
+
+    def _compile_hexadecimal_node(self, node: HexadecimalNode) -> Closure:
+        """Compiles a `HexadecimalNode`."""
+        return self._compile_integer(16, node.value)
+
+    def _compile_integer_node(self, node: IntegerNode) -> Closure:
+        """Compiles an `IntegerNode`."""
+        return self._compile_integer(10, node.value)
+
+    def _compile_float_node(self, node: FloatNode) -> Closure:
+        """Compiles a `FloatNode`."""
+        converted = FloatObject(value=float(node.value))
+        return lambda _: converted
+
+    def _compile_string_node(self, node: StringNode) -> Optional[Closure]:
+        """Compiles a `StringNode`, or leaves the invalid interpolations."""
+        if (text := plain_string(node.value)) is not None:
+            return lambda _: StringObject(value=text)
+        return None
+
+    def _compile_interpolated_string_node(
+        self,
+        node: InterpolatedStringNode,
+    ) -> Closure:
+        """Compiles an `InterpolatedStringNode`."""
+        *texts, last = node.texts
+        interpolations = [
+            list(map(self._compile, expressions))
+            for expressions in node.interpolations
+        ]
+
+        def string(interpreter: ClosureInterpreter) -> StringObject:
+            return StringObject(
+                value=''.join(
+                    text
+                    + ' '.join(str(expression(interpreter)) for expression in y)
+                    for text, y in zip(texts, interpolations)
+                )
+                + last
+            )
+
+        return string
+
+    def _compile_identifier_node(self, node: IdentifierNode) -> Closure:
+        """Compiles an `IdentifierNode`."""
+        name = node.value
+
+        def identifier(interpreter: ClosureInterpreter) -> Any:
+            try:
+                return interpreter.environment.locate(name)
+            except BaseException as e:
+                raise InterpretError(error=e, origin=node)
+
+        return identifier
+
+    def _compile_itemized_expression_node(
+        self,
+        node: ItemizedExpressionNode,
+    ) -> Closure:
+        """Compiles an `ItemizedExpressionNode`."""
+        items = list(map(self._compile, node.items))
+        return lambda x: [
+            result for item in items if (result := item(x)) is not None
+        ]
+
+    def _compile_list_node(self, node: ListNode) -> Closure:
+        """Compiles a `ListNode`."""
+        elements = self._compile(node.elements)
+        return _guarded(node, lambda x: ListObject(elements=elements(x)))
+
+    def _compile_call_node(self, node: CallNode) -> Closure:
+        """Compiles a `CallNode` and passes plain arguments directly."""
+        return self._compile_call(node, False)
+
+    def _compile_call(self, node: CallNode, tail: bool) -> Closure:
+        """Compiles a call that may be left to the caller in tail position."""
+        invoke, args = self._compile(node.invoke), node.args
+        plain = not any(
+            isinstance(x, (AssignmentNode, ExpandableArgumentNode))
+            for x in args.items
+        )
+        args_ = list(map(self._compile, args.items)) if plain else []
+
+        def call(interpreter: ClosureInterpreter) -> Any:
+            try:
+                if isinstance(
+                    callee := invoke(interpreter), NonPythonNativeObject
+                ):
+                    return interpreter._call_non_python_native_object(
+                        callee, args, tail
+                    )
+                elif plain:
+                    return callee(*[arg(interpreter) for arg in args_])
+                return interpreter._call_python_native_object(callee, args)
+            except InterpretError as e:
+                e.passed(node)
+                raise
+            except _PASSING:
+                raise
+            except BaseException as e:
+                raise InterpretError(error=e, origin=node)
+
+        return call
+
+    def _compile_grouped_expression_node(
+        self,
+        node: GroupedExpressionNode,
+    ) -> Closure:
+        """Compiles a `GroupedExpressionNode` into its expression."""
+        return self._compile(node.expression)
+
+    def _compile_negation_operation_node(
+        self,
+        node: NegationOperationNode,
+    ) -> Closure:
+        """Compiles a `NegationOperationNode`."""
+        operand = self._compile(node.operand)
+        return _guarded(node, lambda x: BooleanObject(value=not operand(x)))
+
+    def _compile_step(
+        self,
+        node: ASTNode,
+        operand: ItemizedExpressionNode,
+        fn: Callable[[Any, Any], Any],
+        post: bool,
+    ) -> Optional[Closure]:
+        """Compiles an increment or a decrement of a plain variable."""
+        if len(operand.items) != 1 or not isinstance(
+            target := operand.items[0], IdentifierNode
+        ):
+            return None
+        name = target.value
+
+        def step(interpreter: ClosureInterpreter) -> Any:
+            environment = interpreter.environment
+            result = fn(
+                previous := environment.locate(name), IntegerObject(value=1)
+            )
+            environment.replace(name, result)
+            return previous if post else result
+
+        return _guarded(node, step)
+
+    def _compile_pre_increment_node(
+        self,
+        node: PreIncrementNode,
+    ) -> Optional[Closure]:
+        """Compiles a `PreIncrementNode`."""
+        return self._compile_step(node, node.operand, operator.add, False)  # type: ignore[arg-type]
+
+    def _compile_pre_decrement_node(
+        self,
+        node: PreDecrementNode,
+    ) -> Optional[Closure]:
+        """Compiles a `PreDecrementNode`."""
+        return self._compile_step(node, node.operand, operator.sub, False)  # type: ignore[arg-type]
+
+    def _compile_post_increment_node(
+        self,
+        node: PostIncrementNode,
+    ) -> Optional[Closure]:
+        """Compiles a `PostIncrementNode`."""
+        return self._compile_step(node, node.operand, operator.add, True)  # type: ignore[arg-type]
+
+    def _compile_post_decrement_node(
+        self,
+        node: PostDecrementNode,
+    ) -> Optional[Closure]:
+        """Compiles a `PostDecrementNode`."""
+        return self._compile_step(node, node.operand, operator.sub, True)  # type: ignore[arg-type]
+
+    def _compile_binary_operation(
+        self,
+        node: ArithmeticOperationNode | RelationalOperationNode,
+    ) -> Optional[Closure]:
+        """Compiles an operation that evaluates both sides and then applies."""
+        if (fn := _OPERATORS.get(node.operator, None)) is None:  # type: ignore[arg-type]
+            return None
+        left, right = self._compile(node.left), self._compile(node.right)
+
+        def operation(interpreter: ClosureInterpreter) -> Any:
+            try:
+                return fn(left(interpreter), right(interpreter))
+            except InterpretError as e:
+                e.passed(node)
+                raise
+            except _PASSING:
+                raise
+            except BaseException as e:
+                raise InterpretError(error=e, origin=node)
+
+        return operation
+
+    def _compile_arithmetic_operation_node(
+        self,
+        node: ArithmeticOperationNode,
+    ) -> Optional[Closure]:
+        """Compiles an `ArithmeticOperationNode`."""
+        return self._compile_binary_operation(node)
+
+    def _compile_relational_operation_node(
+        self,
+        node: RelationalOperationNode,
+    ) -> Optional[Closure]:
+        """Compiles a `RelationalOperationNode`."""
+        return self._compile_binary_operation(node)
+
+    def _compile_logical_operation_node(
+        self,
+        node: LogicalOperationNode,
+    ) -> Optional[Closure]:
+        """Compiles a `LogicalOperationNode` that short-circuits."""
+        if node.operator not in ('And', 'Or'):
+            return None
+        left, right = self._compile(node.left), self._compile(node.right)
+
+        if node.operator == 'And':
+            return lambda x: left(x) and right(x)
+        return lambda x: left(x) or right(x)
+
+    def _compile_ternary_operation_node(
+        self,
+        node: TernaryOperationNode,
+    ) -> Closure:
+        """Compiles a `TernaryOperationNode`."""
+        then, condition = self._compile(node.then), self._compile(
+            node.condition
+        )
+        orelse = self._compile_optional(node.orelse)
+        return _guarded(
+            node,
+            lambda x: (
+                then(x)
+                if condition(x)
+                else (orelse(x) if orelse is not None else None)
+            ),
+        )
+
+    def _compile_variable_declaration_node(
+        self,
+        node: VariableDeclarationNode,
+    ) -> Closure:
+        """Compiles a `VariableDeclarationNode`."""
+        name = node.identifier.value
+        expression = self._compile_optional(node.expression)
+        return _guarded(
+            node,
+            lambda x: x.environment.assign(
+                name,
+                expression(x) if expression is not None else NullObject(),
+            ),
+        )
+
+    def _compile_assignment(
+        self,
+        node: AssignmentNode,
+        fn: Optional[Callable[[Any, Any], Any]],
+    ) -> Optional[Closure]:
+        """Compiles an assignment to a plain variable."""
+        if len(node.references.items) != 1 or not isinstance(
+            target := node.references.items[0], IdentifierNode
+        ):
+            return None
+        name, expression = target.value, self._compile(node.expression)
+
+        def assignment(interpreter: ClosureInterpreter) -> None:
+            environment = interpreter.environment
+            if fn is None:
+                environment.replace(name, expression(interpreter))
+            else:
+                environment.replace(
+                    name, fn(environment.locate(name), expression(interpreter))
+                )
+            return None
+
+        return _guarded(node, assignment)
+
+    def _compile_assignment_node(
+        self, node: AssignmentNode
+    ) -> Optional[Closure]:
+        """Compiles an `AssignmentNode`."""
+        return self._compile_assignment(node, None)
+
+    def _compile_aggregate_assignment(
+        self,
+        node: AggregateAssignmentNode,
+    ) -> Optional[Closure]:
+        """Compiles an assignment that combines the previous value."""
+        return self._compile_assignment(
+            node, _AGGREGATE_OPERATORS[node.__class__]
+        )
+
+    _compile_left_shift_assignment_node = _compile_aggregate_assignment
+    _compile_right_shift_assignment_node = _compile_aggregate_assignment
+    _compile_add_assignment_node = _compile_aggregate_assignment
+    _compile_subtract_assignment_node = _compile_aggregate_assignment
+    _compile_multiply_assignment_node = _compile_aggregate_assignment
+    _compile_divide_assignment_node = _compile_aggregate_assignment
+    _compile_modulus_assignment_node = _compile_aggregate_assignment
+    _compile_power_assignment_node = _compile_aggregate_assignment
+
+    def _compile_while_node(self, node: WhileNode) -> Closure:
+        """Compiles a `WhileNode`."""
+        condition, body = self._compile(node.condition), self._compile(
+            node.body
+        )
+        orelse = self._compile_optional(node.orelse)
+
+        def while_(interpreter: ClosureInterpreter) -> None:
+            while condition(interpreter):
+                try:
+                    body(interpreter)
+                except BreakError:
+                    break
+                except ContinueError:
+                    continue
+            else:
+                if orelse is not None:
+                    orelse(interpreter)
+            return None
+
+        return _guarded(node, while_)
+
+    def _compile_for_node(self, node: ForNode) -> Closure:
+        """Compiles a `ForNode`."""
+        initial, condition = self._compile(node.initial), self._compile(
+            node.condition
+        )
+        body, orelse = self._compile(node.body), self._compile_optional(
+            node.orelse
+        )
+        names = [
+            (
+                variable.value
+                if isinstance(variable, IdentifierNode)
+                else variable.identifier.value  # type: ignore[union-attr]
+            )
+            for variable in node.initial.items
+        ]
+
+        def for_(interpreter: ClosureInterpreter) -> None:
+            initial(interpreter)
+            bind = interpreter._binder(names)
+            for iteration in condition(interpreter):
+                bind(iteration)
+                try:
+                    body(interpreter)
+                except BreakError:
+                    break
+                except ContinueError:
+                    continue
+            else:
+                if orelse is not None:
+                    orelse(interpreter)
+            return None
+
+        return _guarded(node, for_)
+
+    def _compile_break_node(self, node: BreakNode) -> Closure:
+        """Compiles a `BreakNode`."""
+
+        def break_(interpreter: ClosureInterpreter) -> None:
+            raise BreakError('If there was a loop, it was broken!')
+
+        return break_
+
+    def _compile_continue_node(self, node: ContinueNode) -> Closure:
+        """Compiles a `ContinueNode`."""
+
+        def continue_(interpreter: ClosureInterpreter) -> None:
+            raise ContinueError('If you can go to the next round!')
+
+        return continue_
+
+    def _compile_if_node(self, node: IfNode) -> Closure:
+        """Compiles an `IfNode`."""
+        condition, body = self._compile(node.condition), self._compile(
+            node.body
+        )
+        orelse = self._compile_optional(node.orelse)
+
+        def if_(interpreter: ClosureInterpreter) -> None:
+            if condition(interpreter):
+                body(interpreter)
+            elif orelse is not None:
+                orelse(interpreter)
+            return None
+
+        return _guarded(node, if_)
+
+    def _compile_return_node(self, node: ReturnNode) -> Closure:
+        """Compiles a `ReturnNode`."""
+        expression = (
+            self._compile_call(node.expression, True)
+            if isinstance(node.expression, CallNode)
+            and not any(
+                CallNode in vars(x).get('_registered', {})
+                for x in self.__class__.__mro__
+            )
+            else self._compile_optional(node.expression)
+        )
+
+        def return_(interpreter: ClosureInterpreter) -> None:
+            raise ReturnError(
+                expression=(
+                    expression(interpreter)
+                    if expression is not None
+                    else NullObject()
+                )
+            )
+
+        return _guarded(node, return_)
@@ -6,8 +6,11 @@
 import sys
 import subprocess
 import random
-from dataclasses import dataclass, field
-from typing import types, Optional, Union, Any, List, Tuple, Dict  # type: ignore[attr-defined]
+import heapq
+from collections import deque
+from itertools import count, islice
+from dataclasses import dataclass, field, replace, InitVar
+from typing import types, Optional, Union, Any, Callable, Iterator, Deque, List, Tuple, Dict  # type: ignore[attr-defined]
 
 from farr.parser.nodes import BlockNode, ItemizedExpressionNode
 from farr.interpreter.base import Environment
@@ -444,11 +447,31 @@ class RangeObject(ExpressionObject):
         """Calculates the hash of the object."""
         return hash((self.from_, self.to, self.by))
 
-    def __iter__(self) -> 'RangeObject':
+    def __iter__(self) -> Union['RangeObject', Iterator[IntegerObject]]:
         """Iterates over the range defined by the object."""
+        if (numbers := self.native()) is not None:
+            return map(lambda x: IntegerObject(value=x), numbers)
         self._number = self.from_
         return self
 
+    def native(self) -> Optional[range]:
+        """Returns the Python range of an upward range between two integers."""
+        if (
+            isinstance(self.from_, IntegerObject)
+            and isinstance(self.to, IntegerObject)
+            and (
+                self.by is None
+                or isinstance(self.by, IntegerObject)
+                and self.by.value > 0
+            )
+        ):
+            return range(
+                self.from_.value,
+                self.to.value + 1,
+                self.by.value if self.by is not None else 1,
+            )
+        return None
+
     def __next__(self) -> int:
         """Returns the next integer in the range."""
         if self.to is not None and self._number > self.to:  # type: ignore[operator]
@@ -627,15 +650,22 @@ class ListObject(DataStructureObject):
 
 @dataclass
 class HashMapObject(DataStructureObject):
-    pairs: Optional[List['PairObject']] = field(kw_only=True)
+    pairs: Dict[FarrObject, 'PairObject'] = field(kw_only=True)
 
     def __post_init__(self) -> None:
-        """Tries to ignore duplicate pairs."""
-        self._drop_duplicates()
+        """Indexes the given pairs by their keys.
+
+        A dictionary keeps the order of insertion, so the pairs stay in order
+        and the last pair of a duplicate key takes the place of the first.
+        """
+        if not isinstance(self.pairs, dict):
+            self.pairs = {
+                pair.key: pair for pair in self.pairs or ()  # type: ignore[attr-defined]
+            }
 
     def __str__(self) -> str:
         """Returns existing pairs separated by a semicolon."""
-        return '; '.join(map(str, self.pairs))  # type: ignore[arg-type]
+        return '; '.join(map(str, self.pairs.values()))
 
     def __hash__(self) -> int:
         """Returns the object ID as a hash."""
@@ -649,10 +679,10 @@ class HashMapObject(DataStructureObject):
         if key.from_.value <= 0 or key.by is not None and key.by.value <= 0:  # type: ignore[union-attr]
             raise IndexError('Non-positive indexes are not allowed!')
         return (
-            self.pairs[key.from_.value - 1]  # type: ignore[index, union-attr]
+            self._pair_at(key.from_.value)  # type: ignore[union-attr]
             if key.to is None and key.by is None
             else HashMapObject(
-                pairs=self.pairs[  # type: ignore[index]
+                pairs=list(self.pairs.values())[  # type: ignore[arg-type]
                     key.from_.value  # type: ignore[union-attr]
                     - 1 : key.to.value if key.to is not None else None : (
                         key.by.value if key.by is not None else None
@@ -662,50 +692,51 @@ class HashMapObject(DataStructureObject):
         )
 
     def __iter__(self) -> 'HashMapObject':
-        """iterates over the pairs in the hash map."""
-        self._index = 0
+        """Iterates over the pairs in the hash map."""
+        self._pairs = iter(tuple(self.pairs.values()))
         return self
 
     def __next__(self) -> Tuple[FarrObject, FarrObject]:
         """Returns the next pair."""
-        if self.pairs is not None and self._index >= len(self.pairs):
-            raise StopIteration
-        pair = self.pairs[self._index]  # type: ignore[index]
-        self._index += 1
+        pair = next(self._pairs)
         return pair.key, pair.value
 
-    def _drop_duplicates(self) -> None:
-        """Removes duplicate pairs."""
-        self.pairs = list({pair.key: pair for pair in self.pairs}.values())  # type: ignore[union-attr]
+    def _pair_at(self, index: int) -> 'PairObject':
+        """Finds the pair at a position that starts from one."""
+        if (
+            pair := next(islice(self.pairs.values(), index - 1, None), None)
+        ) is None:
+            raise IndexError('No pair found!')
+        return pair
 
     @property
     def first(self) -> 'PairObject':
         """Returns the first existing pair."""
         if not self.pairs:
             raise IndexError('No pair found!')
-        return self.pairs[0]
+        return next(iter(self.pairs.values()))
 
     @property
     def last(self) -> 'PairObject':
         """Returns the last existing pair."""
         if not self.pairs:
             raise IndexError('No pair found!')
-        return self.pairs[-1]
+        return next(reversed(self.pairs.values()))
 
     @property
     def length(self) -> IntegerObject:
         """Returns the number of existing pairs."""
-        return IntegerObject(value=len(self.pairs))  # type: ignore[arg-type]
+        return IntegerObject(value=len(self.pairs))
 
     @property
     def keys(self) -> ListObject:
         """Returns all available keys."""
-        return ListObject(elements=list(map(lambda x: x.key, self.pairs)))  # type: ignore[arg-type]
+        return ListObject(elements=list(self.pairs))
 
     @property
     def values(self) -> ListObject:
         """Returns all values."""
-        return ListObject(elements=list(map(lambda x: x.value, self.pairs)))  # type: ignore[arg-type]
+        return ListObject(elements=[x.value for x in self.pairs.values()])
 
     def isempty_q(self) -> BooleanObject:
         """Returns whether there is a pair or not."""
@@ -713,7 +744,7 @@ class HashMapObject(DataStructureObject):
 
     def clear_e(self) -> NullObject:
         """Makes the object empty of pairs."""
-        self.pairs = []
+        self.pairs = {}
         return NullObject()
 
     def get(
@@ -722,25 +753,26 @@ class HashMapObject(DataStructureObject):
         orelse: Optional[FarrObject] = None,
     ) -> FarrObject:
         """Returns a value based on the key or something else."""
-        return {pair.key: pair.value for pair in self.pairs}.get(  # type: ignore[union-attr]
-            key, orelse if orelse is not None else NullObject()
-        )
+        if (pair := self.pairs.get(key, None)) is not None:
+            return pair.value
+        return orelse if orelse is not None else NullObject()
 
     def iupdate_e(self, hash_map: 'HashMapObject') -> 'HashMapObject':
         """Updates the current pairs based on the new values."""
-        self.pairs.extend(hash_map.pairs)  # type: ignore[union-attr, arg-type]
-        self._drop_duplicates()
+        self.pairs.update(hash_map.pairs)
         return self
 
     def pop_e(self, index: IntegerObject) -> 'PairObject':
         """Discards a pair based on its index."""
         if index.value <= 0:
             raise IndexError('Non-positive indexes are not allowed!')
-        return self.pairs.pop(index.value - 1)  # type: ignore[union-attr]
+        return self.pairs.pop(self._pair_at(index.value).key)
 
     def popitem_e(self, key: FarrObject) -> 'PairObject':
         """Deletes a pair based on the key."""
-        return self.pairs.pop(self.pairs.index(key))  # type: ignore[union-attr, arg-type]
+        if (pair := self.pairs.pop(key, None)) is None:
+            raise ValueError(f'No pair found with the key `{key}`!')
+        return pair
 
 
 @dataclass
@@ -765,6 +797,258 @@ class PairObject(DataStructureObject):
         return hash((self.key, self.value))
 
 
+@dataclass
+class SetObject(DataStructureObject):
+    elements: Dict[FarrObject, None] = field(kw_only=True)
+
+    def __post_init__(self) -> None:
+        """Keeps the distinct elements in the order they were given."""
+        if not isinstance(self.elements, dict):
+            self.elements = dict.fromkeys(self.elements or ())
+
+    def __str__(self) -> str:
+        """Returns elements separated by a semicolon."""
+        return '; '.join(map(str, self.elements))
+
+    def __hash__(self) -> int:
+        """Returns the object ID as a hash."""
+        return id(self)
+
+    def __contains__(self, element: FarrObject) -> bool:
+        """Checks the existence of an element by its hash."""
+        return element in self.elements
+
+    def __iter__(self) -> 'SetObject':
+        """Iterates over the elements in the set."""
+        self._elements = iter(tuple(self.elements))
+        return self
+
+    def __next__(self) -> FarrObject:
+        """Returns the next element of the set."""
+        return next(self._elements)
+
+    @staticmethod
+    def _hashed(other: DataStructureObject) -> 'SetObject':
+        """Returns the other set, or a set of the other elements."""
+        if isinstance(other, SetObject):
+            return other
+        return SetObject(elements=list(other))  # type: ignore[arg-type, call-overload]
+
+    @property
+    def length(self) -> IntegerObject:
+        """Returns the number of elements in the set."""
+        return IntegerObject(value=len(self.elements))
+
+    def isempty_q(self) -> BooleanObject:
+        """Returns the status of the set being empty or not."""
+        return BooleanObject(value=not bool(self.elements))
+
+    def contains_q(self, element: FarrObject) -> BooleanObject:
+        """Checks if the element is in the set."""
+        return BooleanObject(value=element in self.elements)
+
+    def clear_e(self) -> NullObject:
+        """Removes all elements from the set."""
+        self.elements = {}
+        return NullObject()
+
+    def iadd_e(self, element: FarrObject) -> NullObject:
+        """Adds an element if it is not in the set yet."""
+        self.elements[element] = None
+        return NullObject()
+
+    def popitem_e(self, element: FarrObject) -> FarrObject:
+        """Discards an element and returns it."""
+        if element not in self.elements:
+            raise ValueError(f'No element found equal to `{element}`!')
+        del self.elements[element]
+        return element
+
+    def union(self, other: DataStructureObject) -> 'SetObject':
+        """Returns the elements of both."""
+        return SetObject(elements={**self.elements, **dict.fromkeys(other)})
+
+    def intersection(self, other: DataStructureObject) -> 'SetObject':
+        """Returns the elements that are in both."""
+        others = self._hashed(other)
+        return SetObject(elements=[x for x in self.elements if x in others])  # type: ignore[arg-type]
+
+    def difference(self, other: DataStructureObject) -> 'SetObject':
+        """Returns the elements that are not in the other one."""
+        others = self._hashed(other)
+        return SetObject(
+            elements=[x for x in self.elements if x not in others]  # type: ignore[arg-type]
+        )
+
+    def iupdate_e(self, other: DataStructureObject) -> 'SetObject':
+        """Adds the elements of another data structure and returns the set."""
+        self.elements.update(dict.fromkeys(other))
+        return self
+
+
+@dataclass
+class DequeObject(DataStructureObject):
+    elements: Deque[FarrObject] = field(kw_only=True)
+    maxlen: Optional[IntegerObject] = field(default=None, kw_only=True)
+
+    def __post_init__(self) -> None:
+        """Keeps the elements in a double-ended queue, bounded if asked."""
+        if self.maxlen is not None and self.maxlen.value < 0:
+            raise ValueError('The maximum length cannot be negative!')
+        self.elements = deque(
+            self.elements,
+            self.maxlen.value if self.maxlen is not None else None,
+        )
+
+    def __str__(self) -> str:
+        """Returns elements separated by a semicolon."""
+        return '; '.join(map(str, self.elements))
+
+    def __hash__(self) -> int:
+        """Returns the object ID as a hash."""
+        return id(self)
+
+    def __iter__(self) -> 'DequeObject':
+        """Iterates over the elements from front to back."""
+        self._elements = iter(tuple(self.elements))
+        return self
+
+    def __next__(self) -> FarrObject:
+        """Returns the next element of the deque."""
+        return next(self._elements)
+
+    @property
+    def first(self) -> FarrObject:
+        """Returns the front element if the deque is not empty."""
+        if not self.elements:
+            raise IndexError('The deque is empty!')
+        return self.elements[0]
+
+    @property
+    def last(self) -> FarrObject:
+        """Returns the back element if the deque is not empty."""
+        if not self.elements:
+            raise IndexError('The deque is empty!')
+        return self.elements[-1]
+
+    @property
+    def length(self) -> IntegerObject:
+        """Returns the number of elements in the deque."""
+        return IntegerObject(value=len(self.elements))
+
+    def isempty_q(self) -> BooleanObject:
+        """Returns the status of the deque being empty or not."""
+        return BooleanObject(value=not bool(self.elements))
+
+    def clear_e(self) -> NullObject:
+        """Removes all elements from the deque."""
+        self.elements.clear()
+        return NullObject()
+
+    def ipush_front_e(self, element: FarrObject) -> NullObject:
+        """Adds an element to the front, dropping one from the back if full."""
+        self.elements.appendleft(element)
+        return NullObject()
+
+    def ipush_back_e(self, element: FarrObject) -> NullObject:
+        """Adds an element to the back, dropping one from the front if full."""
+        self.elements.append(element)
+        return NullObject()
+
+    def pop_front_e(self) -> FarrObject:
+        """Removes the front element and returns it."""
+        if not self.elements:
+            raise IndexError('The deque is empty!')
+        return self.elements.popleft()
+
+    def pop_back_e(self) -> FarrObject:
+        """Removes the back element and returns it."""
+        if not self.elements:
+            raise IndexError('The deque is empty!')
+        return self.elements.pop()
+
+
+@dataclass
+class HeapObject(DataStructureObject):
+    elements: InitVar[List[FarrObject]] = field(kw_only=True)
+    key: Optional[Callable[[FarrObject], FarrObject]] = field(
+        default=None, repr=False, kw_only=True
+    )
+    _entries: List[Tuple[Any, int, FarrObject]] = field(
+        init=False, repr=False
+    )
+
+    def __post_init__(self, elements: List[FarrObject]) -> None:
+        """Ranks every element once and turns the entries into a heap.
+
+        An entry is the rank, the order of arrival and the element, so equal
+        ranks come out in order and the elements are never compared.
+        """
+        self._count = count()
+        self._entries = [self._entry(x) for x in elements]
+        heapq.heapify(self._entries)
+
+    def _entry(self, element: FarrObject) -> Tuple[Any, int, FarrObject]:
+        """Makes the heap entry of an element."""
+        return (
+            self.key(element) if self.key is not None else element,
+            next(self._count),
+            element,
+        )
+
+    def __str__(self) -> str:
+        """Returns elements from the smallest rank separated by a semicolon."""
+        return '; '.join(str(x) for _, _, x in sorted(self._entries))
+
+    def __hash__(self) -> int:
+        """Returns the object ID as a hash."""
+        return id(self)
+
+    def __iter__(self) -> 'HeapObject':
+        """Iterates over the elements from the smallest rank."""
+        self._sorted = iter(sorted(self._entries))
+        return self
+
+    def __next__(self) -> FarrObject:
+        """Returns the next element of the heap."""
+        return next(self._sorted)[-1]
+
+    @property
+    def length(self) -> IntegerObject:
+        """Returns the number of elements in the heap."""
+        return IntegerObject(value=len(self._entries))
+
+    def isempty_q(self) -> BooleanObject:
+        """Returns the status of the heap being empty or not."""
+        return BooleanObject(value=not bool(self._entries))
+
+    def clear_e(self) -> NullObject:
+        """Removes all elements from the heap."""
+        self._entries = []
+        return NullObject()
+
+    def peek(self) -> FarrObject:
+        """Returns the element with the smallest rank."""
+        if not self._entries:
+            raise IndexError('The heap is empty!')
+        return self._entries[0][-1]
+
+    def ipush_e(self, element: FarrObject) -> NullObject:
+        """Adds an element to the heap."""
+        heapq.heappush(self._entries, self._entry(element))
+        return NullObject()
+
+    def pop_e(self) -> FarrObject:
+        """Removes the element with the smallest rank and returns it."""
+        if not self._entries:
+            raise IndexError('The heap is empty!')
+        return heapq.heappop(self._entries)[-1]
+
+    def ipushpop_e(self, element: FarrObject) -> FarrObject:
+        """Adds an element and then pops the smallest one in one step."""
+        return heapq.heappushpop(self._entries, self._entry(element))[-1]
+
+
 class PythonNativeObject(ExpressionObject):
     pass
 
@@ -841,6 +1125,61 @@ class PythonNativeExitObject(PythonNativeObject):
         sys.exit(code)  # type: ignore[arg-type]
 
 
+class PythonNativeSetObject(PythonNativeObject):
+    def __call__(self, *args: Tuple[FarrObject, ...]) -> SetObject:
+        """Makes a set of the distinct arguments."""
+        return SetObject(elements=list(args))  # type: ignore[arg-type]
+
+
+class PythonNativeDequeObject(PythonNativeObject):
+    def __call__(
+        self,
+        *args: Tuple[FarrObject, ...],
+        maxlen: Optional[IntegerObject] = None,
+    ) -> DequeObject:
+        """Makes a deque of the arguments with an optional maximum length."""
+        return DequeObject(elements=args, maxlen=maxlen)  # type: ignore[arg-type]
+
+
+@dataclass
+class PythonNativeHeapObject(PythonNativeObject):
+    caller: Optional[Callable[[Any, List[FarrObject]], FarrObject]] = field(
+        default=None, repr=False, kw_only=True
+    )
+
+    def bind(
+        self,
+        caller: Callable[[Any, List[FarrObject]], FarrObject],
+    ) -> 'PythonNativeHeapObject':
+        """Returns the same builtin that runs its keys with the caller."""
+        return replace(self, caller=caller)
+
+    def _ranker(
+        self,
+        key: Optional[Any],
+    ) -> Optional[Callable[[FarrObject], FarrObject]]:
+        """Turns the key into a function that the heap can call."""
+        if isinstance(key, NonPythonNativeObject):
+            return lambda x: self.caller(key, [x])  # type: ignore[misc]
+        return key
+
+    def __call__(
+        self,
+        *args: Tuple[FarrObject, ...],
+        key: Optional[Any] = None,
+    ) -> HeapObject:
+        """Makes a heap of the arguments, ranked by an optional key."""
+        return HeapObject(elements=list(args), key=self._ranker(key))  # type: ignore[arg-type]
+
+    def heapify(
+        self,
+        list_: ListObject,
+        key: Optional[Any] = None,
+    ) -> HeapObject:
+        """Makes a heap of the elements of a list in linear time."""
+        return HeapObject(elements=list_.elements, key=self._ranker(key))  # type: ignore[arg-type]
+
+
 class PythonNativeTypeOfObject(PythonNativeObject):
     def __call__(self, object_: FarrObject) -> StringObject:
         """Returns the object type."""
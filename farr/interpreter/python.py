@@ -0,0 +1,295 @@
+# Farr's goal is to give programmers the sense of liberation that comes
+# from the beauty of the code itself, even if it hurts productivity!
+# We understand that beauty is not objective...
+# https://github.com/sheikhartin/farr
+
+import pathlib
+from itertools import islice
+from typing import (  # type: ignore[attr-defined]
+    types,
+    Optional,
+    Any,
+    Callable,
+    Sequence,
+    Type,
+    List,
+    Tuple,
+    Dict,
+)
+
+from farr.exceptions import (
+    BreakError,
+    ContinueError,
+    ReturnError,
+    InterpretError,
+)
+from farr.cache import load_module, load_code
+from farr.parser.nodes import (
+    ASTNode,
+    ModuleNode,
+    BlockNode,
+    ItemizedExpressionNode,
+    FunctionDefinitionNode,
+)
+from farr.interpreter import FarrInterpreter
+from farr.interpreter.base import Environment
+from farr.interpreter.objects import (
+    FarrObject,
+    IntegerObject,
+    NonPythonNativeObject,
+    FunctionDefinitionObject,
+)
+from farr.compiler.python import PythonCompiler, number_nodes
+
+_ONE = IntegerObject(value=1)
+
+
+def items(*values: Any) -> List[Any]:
+    """Keeps the values of some items that are not missing."""
+    return [x for x in values if x is not None]
+
+
+def step(environment: Environment, name: str, sign: str, post: bool) -> Any:
+    """Adds one to a variable or subtracts one from it."""
+    previous = environment.locate(name)
+    environment.replace(
+        name, result := previous + _ONE if sign == '+' else previous - _ONE
+    )
+    return previous if post else result
+
+
+def store_for(
+    environment: Environment,
+    names: Tuple[str, ...],
+    value: Any,
+) -> None:
+    """Assigns an iteration of a loop to its variables."""
+    for name, item in zip(
+        names, value if isinstance(value, Sequence) else (value,)
+    ):
+        environment.assign(name, item)
+    return None
+
+
+class PythonInterpreter(FarrInterpreter):
+    """Runs the Python translation of the modules instead of walking them.
+
+    Attributes:
+        _namespaces: The namespace of every translated module, kept with the
+            module.
+        _bodies: The generated function of every function body.
+    """
+
+    _namespaces: Dict[int, Tuple[ModuleNode, Dict[str, Any]]] = {}
+    _bodies: Dict[int, Tuple[BlockNode, Callable[[Any], Any]]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Gives every interpreter its own translations."""
+        super().__init_subclass__(**kwargs)
+        cls._namespaces, cls._bodies = {}, {}
+
+    @classmethod
+    def register(
+        cls,
+        node_type: Type[ASTNode],
+        handler: Callable[[Any, Any], Any],
+    ) -> None:
+        """Registers the handler and forgets the code translated without it."""
+        super().register(node_type, handler)
+        for interpreter in cls._family():
+            interpreter._namespaces.clear()  # type: ignore[attr-defined]
+            interpreter._bodies.clear()  # type: ignore[attr-defined]
+        return None
+
+    def _compiler(self) -> PythonCompiler:
+        """Returns a compiler that leaves registered node types alone."""
+        return PythonCompiler(
+            fallbacks=(
+                x
+                for interpreter in self.__class__.__mro__
+                for x in vars(interpreter).get('_registered', {})
+            )
+        )
+
+    def _load_namespace(
+        self,
+        module: ModuleNode,
+        code: types.CodeType,
+    ) -> Dict[str, Any]:
+        """Executes the translation of a module and keeps its namespace."""
+        namespace = {'__name__': '__farr__', '_nodes': number_nodes(module)}
+        exec(code, namespace)
+        self._namespaces[id(module)] = module, namespace
+        return namespace
+
+    def parse_file(self, file_path: pathlib.Path) -> ModuleNode:
+        """Returns the syntax tree of a file with its cached translation."""
+        module = super().parse_file(file_path)
+        if (
+            id(module) not in self._namespaces
+            and not self._compiler().fallbacks
+        ):
+            self._load_namespace(
+                module,
+                load_code(
+                    file_path,
+                    lambda: compile(
+                        self._compiler().compile(module, str(file_path)),
+                        f'<{file_path}>',
+                        'exec',
+                    ),
+                    self.cache,
+                ),
+            )
+        return module
+
+    def _interpret(self, node: ASTNode) -> Any:
+        """Runs the translation of modules and walks the other nodes."""
+        if not isinstance(node, ModuleNode):
+            return self._settle(super()._interpret(node))
+        elif (
+            translated := self._namespaces.get(id(node), None)
+        ) is not None and translated[0] is node:
+            return self._run(translated[1]['__farr_main__'])
+        return self._run(
+            self._load_namespace(
+                node,
+                compile(self._compiler().compile(node), '<farr>', 'exec'),
+            )['__farr_main__']
+        )
+
+    def _execute_body(self, body: BlockNode) -> Optional[FarrObject]:
+        """Runs the generated function of a body if there is one."""
+        if (
+            translated := self._bodies.get(id(body), None)
+        ) is None or translated[0] is not body:
+            return super()._execute_body(body)
+        try:
+            return self._run(translated[1])
+        except ReturnError as e:
+            # Returns from the nodes that are left to the tree-walker
+            return e.expression
+
+    def _define(
+        self,
+        node: FunctionDefinitionNode,
+        function: Callable[[Any], Any],
+    ) -> FunctionDefinitionObject:
+        """Makes a function whose body runs as generated code."""
+        self._bodies[id(node.body)] = node.body, function  # type: ignore[assignment]
+        self._signature(node.params)  # type: ignore[arg-type]
+        return FunctionDefinitionObject(
+            body=node.body,  # type: ignore[arg-type]
+            params=node.params,
+        )
+
+    def _run(self, function: Callable[[Any], Any]) -> Any:
+        """Calls a generated function and points its errors at the nodes."""
+        try:
+            return function(self)
+        except (BreakError, ContinueError, ReturnError):
+            raise
+        except InterpretError as e:
+            if e.calls and e.calls[-1] is None:
+                e.passed(self._origin(e.__traceback__, innermost=False))
+            raise
+        except BaseException as e:
+            raise InterpretError(error=e, origin=self._origin(e.__traceback__))
+
+    @staticmethod
+    def _origin(
+        traceback: Optional[types.TracebackType],
+        innermost: bool = True,
+    ) -> Optional[ASTNode]:
+        """Finds the node behind the generated code of a traceback.
+
+        Every generated line knows the columns of the nodes it is made of, so
+        the columns of the failed instruction lead to the smallest node. The
+        outermost generated code is the one that made a call.
+        """
+        origin = None
+        while traceback is not None:
+            namespace = traceback.tb_frame.f_globals
+            if spans := namespace.get('__farr_positions__', {}).get(
+                traceback.tb_lineno, ()
+            ):
+                *_, column, end_column = next(
+                    islice(
+                        traceback.tb_frame.f_code.co_positions(),
+                        traceback.tb_lasti // 2,
+                        None,
+                    )
+                )
+                _, _, index = min(
+                    [
+                        x
+                        for x in spans
+                        if column is None
+                        or end_column is None
+                        or x[0] <= column
+                        and end_column <= x[1]
+                    ]
+                    or spans,
+                    key=lambda x: x[1] - x[0],
+                )
+                origin = namespace['_nodes'][index]
+                if not innermost:
+                    break
+            traceback = traceback.tb_next
+        return origin
+
+    def _call(self, invoke: Any, args: List[Any], tail: bool = False) -> Any:
+        """Calls any object with the evaluated arguments."""
+        if isinstance(invoke, NonPythonNativeObject):
+            return (
+                self._tail_call
+                if tail
+                else self._invoke_non_python_native_object
+            )(invoke, args)
+        return invoke(*args)
+
+    def _call_with_node(
+        self,
+        invoke: Any,
+        args: ItemizedExpressionNode,
+        tail: bool = False,
+    ) -> Any:
+        """Calls any object with arguments that need the interpreter."""
+        if isinstance(invoke, NonPythonNativeObject):
+            return self._call_non_python_native_object(invoke, args, tail)
+        return self._call_python_native_object(invoke, args)
+
+    def _bind_method(self, result: Any, name: str) -> Any:
+        """Looks a method up on the result of a chain."""
+        if isinstance(method := getattr(result, name), NonPythonNativeObject):
+            method.environment = result.environment
+        return method
+
+    def _call_method(self, result: Any, name: str, args: List[Any]) -> Any:
+        """Calls a method in a chain with the evaluated arguments."""
+        if isinstance(
+            method := self._bind_method(result, name), types.MethodType
+        ):
+            return method(*args)
+        return self._invoke_non_python_native_object(method, args)
+
+    def _call_method_with_node(
+        self,
+        result: Any,
+        name: str,
+        args: ItemizedExpressionNode,
+    ) -> Any:
+        """Calls a method in a chain with arguments that need the interpreter."""
+        if isinstance(
+            method := self._bind_method(result, name), types.MethodType
+        ):
+            return self._call_python_native_object(method, args)
+        return self._call_non_python_native_object(method, args)
+
+
+def run_python_module(namespace: Dict[str, Any]) -> None:
+    """Runs a module that was compiled to Python as a script."""
+    module = load_module(pathlib.Path(namespace['__farr_source__']))
+    namespace['_nodes'] = number_nodes(module)
+    PythonInterpreter._namespaces[id(module)] = module, namespace
+    return PythonInterpreter().interpret(module)
@@ -0,0 +1,64 @@
+# Farr's goal is to give programmers the sense of liberation that comes
+# from the beauty of the code itself, even if it hurts productivity!
+# We understand that beauty is not objective...
+# https://github.com/sheikhartin/farr
+
+import pathlib
+from typing import Optional, Callable, List, Dict
+
+from farr.interpreter.objects import ImportSystemObject
+
+
+class ModuleRegistry:
+    """Keeps every loaded module or library once for the whole process.
+
+    Attributes:
+        _loaded: The import objects mapped to their resolved paths.
+        _loading: Paths that are being loaded now, from the outermost one.
+    """
+
+    def __init__(self) -> None:
+        self._loaded: Dict[pathlib.Path, ImportSystemObject] = {}
+        self._loading: List[pathlib.Path] = []
+
+    def __contains__(self, path: pathlib.Path) -> bool:
+        """Checks whether the path is already loaded or not."""
+        return path.resolve() in self._loaded
+
+    def load(
+        self,
+        path: pathlib.Path,
+        loader: Callable[[], ImportSystemObject],
+    ) -> ImportSystemObject:
+        """Returns the loaded object of the path or loads it for the first time."""
+        if (
+            loaded := self._loaded.get(path := path.resolve(), None)
+        ) is not None:
+            return loaded
+        elif path in self._loading:
+            raise ImportError(
+                'Circular import detected: {}!'.format(
+                    ' -> '.join(
+                        f'`{x.stem}`'
+                        for x in self._loading[self._loading.index(path) :]
+                        + [path]
+                    )
+                )
+            )
+        self._loading.append(path)
+        try:
+            loaded = self._loaded[path] = loader()
+        finally:
+            self._loading.pop()
+        return loaded
+
+    def invalidate(self, path: Optional[pathlib.Path] = None) -> None:
+        """Forgets a loaded path, or all of them, to load them again."""
+        if path is None:
+            self._loaded.clear()
+            return None
+        self._loaded.pop(path.resolve(), None)
+        return None
+
+
+modules = ModuleRegistry()
@@ -0,0 +1,200 @@
+# Farr's goal is to give programmers the sense of liberation that comes
+# from the beauty of the code itself, even if it hurts productivity!
+# We understand that beauty is not objective...
+# https://github.com/sheikhartin/farr
+
+import dataclasses
+from dataclasses import dataclass, field
+from typing import Optional, Any, List, Tuple, Set, FrozenSet, Dict
+
+from farr.parser.nodes import (
+    ASTNode,
+    BlockNode,
+    IdentifierNode,
+    ItemizedExpressionNode,
+    UseNode,
+    VariableDeclarationNode,
+    VariadicParameterDeclarationNode,
+    ForNode,
+    CatchNode,
+    FunctionDefinitionNode,
+    MemberFunctionDefinitionNode,
+    StructDefinitionNode,
+)
+
+
+@dataclass
+class Scope:
+    """The frame layout of a function and the addresses of its identifiers.
+
+    Attributes:
+        names: The slot of every name that the function declares itself.
+        addresses: The `(depth, slot)` of the identifiers that surely refer
+            to the frame, by the id of their nodes. The depth counts the
+            `catch` environments between the identifier and the frame.
+    """
+
+    names: Dict[str, int] = field(default_factory=dict, kw_only=True)
+    addresses: Dict[int, Tuple[int, int]] = field(
+        default_factory=dict, kw_only=True
+    )
+
+
+@dataclass
+class Signature:
+    """The binding plan of the parameters of a function or a struct.
+
+    The parameters are declared first in the frame of a function, so the
+    slot of each one is known before any call.
+
+    Attributes:
+        declarations: The name, default expression and variadicity of every
+            parameter in order.
+        names: The names of all parameters.
+        required: The names of the parameters without defaults.
+        optional: The names of the parameters with defaults.
+        variadic: The names of the variadic parameters without defaults.
+        slots: The frame slot of every parameter in order.
+        positional: The index of every parameter that takes a positional
+            argument, in order.
+        keywords: The index of every parameter that takes a keyword
+            argument, by its name.
+        rest: The index of the variadic parameter, if there is one.
+    """
+
+    declarations: List[Tuple[str, Optional[ASTNode], bool]] = field(
+        default_factory=list, kw_only=True
+    )
+    names: FrozenSet[str] = field(default_factory=frozenset, kw_only=True)
+    required: List[str] = field(default_factory=list, kw_only=True)
+    optional: FrozenSet[str] = field(default_factory=frozenset, kw_only=True)
+    variadic: List[str] = field(default_factory=list, kw_only=True)
+    slots: List[int] = field(default_factory=list, kw_only=True)
+    positional: List[int] = field(default_factory=list, kw_only=True)
+    keywords: Dict[str, int] = field(default_factory=dict, kw_only=True)
+    rest: Optional[int] = field(default=None, kw_only=True)
+
+
+def sign(params: ItemizedExpressionNode) -> Signature:
+    """Checks the parameters of a definition and sorts them out once."""
+    declarations = [
+        (
+            x.identifier.value,  # type: ignore[union-attr]
+            x.expression,  # type: ignore[union-attr]
+            isinstance(x, VariadicParameterDeclarationNode),
+        )
+        for x in params.items
+    ]
+    if len(variadic := [x for x, y, z in declarations if y is None and z]) > 1:
+        raise TypeError(
+            'Multiple variadic parameters defined. '
+            'A function can only have one variadic parameter.'
+        )
+    layout: Dict[str, int] = {}
+    return Signature(
+        declarations=declarations,
+        names=frozenset(x for x, _, _ in declarations),
+        required=[x for x, y, z in declarations if y is None and not z],
+        optional=frozenset(x for x, y, _ in declarations if y is not None),
+        variadic=variadic,
+        slots=[layout.setdefault(x, len(layout)) for x, _, _ in declarations],
+        positional=[
+            i for i, (_, y, z) in enumerate(declarations) if y is None and not z
+        ],
+        keywords={
+            x: i for i, (x, y, _) in enumerate(declarations) if y is not None
+        },
+        rest=next(
+            (
+                i
+                for i, (_, y, z) in enumerate(declarations)
+                if y is None and z
+            ),
+            None,
+        ),
+    )
+
+
+class Resolver:
+    """Lays the frame of a function out before it runs.
+
+    Farr looks the names of the callee up in the environment of the caller,
+    so only the names that a function declares itself get an address. The
+    others are still looked up by name.
+
+    Attributes:
+        _scope: The scope that is being built.
+        _found: Every identifier with the names that the surrounding `catch`
+            environments declare.
+    """
+
+    def __init__(self) -> None:
+        self._scope = Scope()
+        self._found: List[Tuple[IdentifierNode, Tuple[Set[str], ...]]] = []
+
+    def resolve(
+        self,
+        params: ItemizedExpressionNode,
+        body: BlockNode,
+    ) -> Scope:
+        """Returns the scope of a function with these parameters and body."""
+        self._scope, self._found = Scope(), []
+        for param in params.items:
+            # The slots of the parameters are the ones that `sign` expects
+            self._declare(param.identifier.value, ())  # type: ignore[union-attr]
+        self._visit([params, body], ())
+        for node, hidden in self._found:
+            if (
+                slot := self._scope.names.get(node.value, None)
+            ) is not None and not any(node.value in x for x in hidden):
+                self._scope.addresses[id(node)] = len(hidden), slot
+        return self._scope
+
+    def _declare(self, name: str, hidden: Tuple[Set[str], ...]) -> None:
+        """Gives a name a slot, or hides it in the innermost `catch`."""
+        if hidden:
+            hidden[-1].add(name)
+        elif name not in self._scope.names:
+            self._scope.names[name] = len(self._scope.names)
+        return None
+
+    def _visit(self, value: Any, hidden: Tuple[Set[str], ...]) -> None:
+        """Collects the declarations and identifiers under a value."""
+        if isinstance(value, list):
+            for x in value:
+                self._visit(x, hidden)
+            return None
+        elif not isinstance(value, ASTNode):
+            return None
+        elif isinstance(value, IdentifierNode):
+            self._found.append((value, hidden))
+            return None
+        elif isinstance(value, MemberFunctionDefinitionNode):
+            return self._visit(value.struct, hidden)
+        elif isinstance(value, FunctionDefinitionNode):
+            # The body of a function is resolved when it is called
+            self._declare(value.identifier.value, hidden)
+            return self._visit(value.identifier, hidden)
+        elif isinstance(value, StructDefinitionNode):
+            self._declare(value.identifier.value, hidden)
+            return self._visit([value.identifier, value.parents], hidden)
+        elif isinstance(value, UseNode):
+            self._declare(value.path.items[-1].value, hidden)  # type: ignore[union-attr]
+            return None
+        elif isinstance(value, VariableDeclarationNode):
+            self._declare(value.identifier.value, hidden)
+        elif isinstance(value, ForNode):
+            for variable in value.initial.items:  # type: ignore[attr-defined]
+                if isinstance(variable, IdentifierNode):
+                    self._declare(variable.value, hidden)
+        elif isinstance(value, CatchNode):
+            self._visit(value.excepts, hidden)
+            inner = hidden + (set(),)
+            if value.as_ is not None:
+                self._declare(value.as_.value, inner)
+            self._visit(value.body, inner)
+            return self._visit(value.orelse, hidden)
+        if dataclasses.is_dataclass(value):
+            for x in dataclasses.fields(value):
+                self._visit(getattr(value, x.name), hidden)
+        return None
@@ -3,6 +3,8 @@
 # We understand that beauty is not objective...
 # https://github.com/sheikhartin/farr
 
+from typing import Any
+
 from farr.lexer.base import GroupedTokens, Token, RegexLexer
 
 
@@ -100,8 +102,11 @@ class FarrRegexLexer(RegexLexer):
     ]
 
 
+# The members are generated from the tokens, so they are unknown to checkers
+TokenKind: Any = FarrRegexLexer.kinds
+
 if __name__ == '__main__':
     import sys
     from pprint import pprint
 
-    pprint(FarrRegexLexer().tokenize(sys.stdin.read()))
+    pprint(list(FarrRegexLexer().tokenize(sys.stdin.read())))
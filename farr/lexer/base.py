@@ -4,8 +4,26 @@
 # https://github.com/sheikhartin/farr
 
 import re
+import mmap
+from array import array
+from enum import IntEnum
 from dataclasses import dataclass, field
-from typing import Optional, List
+from typing import (
+    overload,
+    Optional,
+    Union,
+    Any,
+    IO,
+    Type,
+    Iterator,
+    Sequence,
+    List,
+    Tuple,
+    Dict,
+    Set,
+)
+
+_NON_ASCII = re.compile(rb'[^\x00-\x7f]')
 
 
 @dataclass(frozen=True)
@@ -29,63 +47,285 @@ class TokenState:
     value: str = field(kw_only=True)
 
 
+class TokenBuffer(Sequence[TokenState]):
+    """Keeps the tokens of a source in parallel arrays instead of objects.
+
+    The value of a token is sliced from the source only when it is asked for,
+    and `TokenState` objects are built on demand.
+
+    Attributes:
+        source: The code that the values are sliced from.
+        names: The enumeration that the kinds belong to.
+        _labels: The name of each kind.
+        kinds: The kind of each token.
+        starts: Where each token starts in the source.
+        ends: And where it ends.
+        rows: The row of each token.
+        columns: The column of each token.
+    """
+
+    def __init__(
+        self,
+        source: Union[str, bytes, mmap.mmap],
+        names: Type[IntEnum],
+    ) -> None:
+        self.source = source
+        self.names = names
+        self._labels = {kind.value: kind.name for kind in names}
+        self.kinds = array('H')
+        self.starts = array('Q')
+        self.ends = array('Q')
+        self.rows = array('L')
+        self.columns = array('L')
+
+    def __len__(self) -> int:
+        """Returns the number of tokens."""
+        return len(self.kinds)
+
+    @overload
+    def __getitem__(self, index: int) -> TokenState: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[TokenState]: ...
+
+    def __getitem__(
+        self,
+        index: Union[int, slice],
+    ) -> Union[TokenState, List[TokenState]]:
+        """Builds the state of the token(s) at the given index."""
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return TokenState(
+            row=self.rows[index],
+            column=self.columns[index],
+            name=self._labels[self.kinds[index]],
+            value=self.value(index),
+        )
+
+    def __eq__(self, other: object) -> bool:
+        """Compares the tokens with another sequence of tokens."""
+        if not isinstance(other, Sequence):
+            return NotImplemented
+        return len(self) == len(other) and all(
+            x == y for x, y in zip(self, other)
+        )
+
+    def __repr__(self) -> str:
+        """Shows the tokens the way a list of states would look."""
+        return f'{self.__class__.__name__}({list(self)!r})'
+
+    def append(
+        self,
+        kind: int,
+        start: int,
+        end: int,
+        row: int,
+        column: int,
+    ) -> None:
+        """Adds a token to the end of the arrays."""
+        self.kinds.append(kind)
+        self.starts.append(start)
+        self.ends.append(end)
+        self.rows.append(row)
+        self.columns.append(column)
+
+    def value(self, index: int) -> str:
+        """Slices the text of a token from the source."""
+        if isinstance(
+            value := self.source[self.starts[index] : self.ends[index]], str
+        ):
+            return value
+        return value.decode(errors='replace')
+
+
 class RegexLexer:
     """A base class for building a lexer using regular expressions.
 
     Attributes:
         tokens: The language tokens.
-        _separator: A pattern that separates parts of the code.
-        _row: The current row position in the source code.
-        _column: And the column position.
+        kinds: An integer enumeration of the token names.
+        _labels: The name of each kind.
+        _scanner: A master pattern that names the group of each lexeme.
+        _bytes_scanner: The same pattern for memory-mapped files.
+        _lookups: Known lexemes of each group mapped to their kinds.
+        _classifiers: Patterns that name the token of the other lexemes.
+        _ignored: Kinds that are scanned but never labeled.
     """
 
     tokens: List[GroupedTokens]
+    kinds: Type[IntEnum]
+    _labels: Dict[int, str]
+    _scanner: re.Pattern
+    _bytes_scanner: re.Pattern
+    _lookups: Dict[str, Dict[str, int]]
+    _classifiers: Dict[str, re.Pattern]
+    _ignored: Set[int]
 
-    def __init__(self) -> None:
-        # Patching the separator tokens pattern
-        self._separator = re.compile(
-            '|'.join(
-                f'({grouped_tokens.pattern})' for grouped_tokens in self.tokens
-            )
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Compiles the tokens once for every lexer that defines them."""
+        super().__init_subclass__(**kwargs)
+        if 'tokens' in cls.__dict__:
+            cls._compile_tokens()
+
+    @staticmethod
+    def _resolve_token(tokens: List[Token], chunk: str) -> Optional[Token]:
+        """Returns the first token that fully matches the chunk."""
+        for token in tokens:
+            if re.fullmatch(token.pattern, chunk):
+                return token
+        return None
+
+    @classmethod
+    def _compile_tokens(cls) -> None:
+        """Builds the kinds, scanners, lookups and classifiers from the tokens."""
+        cls.kinds = IntEnum(  # type: ignore[misc]
+            'TokenKind',
+            [
+                token.name
+                for grouped_tokens in cls.tokens
+                for token in grouped_tokens.tokens
+            ],
+            module=cls.__module__,
+        )
+        cls._labels = {kind.value: kind.name for kind in cls.kinds}
+        cls._ignored = {
+            cls.kinds[token.name]
+            for grouped_tokens in cls.tokens
+            for token in grouped_tokens.tokens
+            if token.ignore
+        }
+        pattern = '|'.join(
+            f'(?P<_{i}>{grouped_tokens.pattern})'
+            for i, grouped_tokens in enumerate(cls.tokens)
         )
-        self._row = self._column = -1
-
-    def _match_token(self, chunk: str) -> Token:
-        """Checks whether the token is valid or not."""
-        for grouped_tokens in self.tokens:
-            if re.fullmatch(grouped_tokens.pattern, chunk):
-                for token in grouped_tokens.tokens:
-                    if re.fullmatch(token.pattern, chunk):
-                        return token
-        raise ValueError(
-            'A strange thing was found! '
-            f'Line {self._row}, column {self._column}'
+        cls._scanner = re.compile(pattern)
+        cls._bytes_scanner = re.compile(pattern.encode())
+        cls._lookups, cls._classifiers = {}, {}
+        for i, grouped_tokens in enumerate(cls.tokens):
+            lookup: Dict[str, int] = {}
+            for token in grouped_tokens.tokens:
+                # Reading `\={2}` as `==` is enough for keywords and symbols
+                literal = re.sub(
+                    r'\\(.)',
+                    r'\1',
+                    re.sub(
+                        r'(\\?.)\{(\d+)\}',
+                        lambda x: x.group(1) * int(x.group(2)),
+                        token.pattern,
+                    ),
+                )
+                if (
+                    resolved := cls._resolve_token(
+                        grouped_tokens.tokens, literal
+                    )
+                ) is not None:
+                    lookup.setdefault(literal, cls.kinds[resolved.name])
+            cls._lookups[f'_{i}'] = lookup
+            cls._classifiers[f'_{i}'] = re.compile(
+                '|'.join(
+                    f'(?P<{token.name}>{token.pattern})'
+                    for token in grouped_tokens.tokens
+                )
+            )
+        return None
+
+    def _match_token(self, group: str, chunk: str) -> Optional[int]:
+        """Finds the kind of a chunk scanned by the given group."""
+        if (match_ := self._classifiers[group].fullmatch(chunk)) is None:
+            return None
+        kind = self.kinds[match_.lastgroup]  # type: ignore[index]
+        if len(chunk) == 1:  # Single characters are few, so remember them
+            self._lookups[group][chunk] = kind
+        return kind
+
+    def _scan(
+        self,
+        code: Union[str, bytes, mmap.mmap],
+    ) -> Iterator[Tuple[int, int, int, int, int, str]]:
+        """Scans the code lazily and yields the kind and place of tokens."""
+        scanner = (
+            self._scanner if isinstance(code, str) else self._bytes_scanner
         )
+        row = column = 1
 
-    def _update_position(self, chunk: str) -> None:
-        """Updates the pointer position after passing the current chunk."""
-        for char in chunk:
-            if char in '\r\n':  # TODO: Check for different operating systems
-                self._row += 1
-                self._column = 1
+        position = 0
+        for match_ in scanner.finditer(code):  # type: ignore[arg-type]
+            start, end = match_.span()
+            if start == end:
+                continue
+            elif start != position:
+                break
+            group, chunk = match_.lastgroup, match_.group()
+            if not isinstance(chunk, str):
+                chunk = chunk.decode(errors='replace')
+            if (
+                kind := self._lookups[group].get(chunk, None)  # type: ignore[index]
+            ) is None and (
+                kind := self._match_token(group, chunk)  # type: ignore[arg-type]
+            ) is None:
+                break
+            if kind not in self._ignored:
+                yield kind, start, end, row, column, chunk
+            if '\n' in chunk or '\r' in chunk:
+                row += chunk.count('\n') + chunk.count('\r')
+                column = len(chunk) - max(chunk.rfind('\n'), chunk.rfind('\r'))
             else:
-                self._column += 1
+                column += len(chunk)
+            position = end
+        if position != len(code):
+            raise ValueError(
+                f'A strange thing was found! Line {row}, column {column}'
+            )
         return None
 
-    def tokenize(self, code: str) -> List[TokenState]:
+    def tokenize(self, code: str) -> TokenBuffer:
         """Tokenizes the code and then labels them."""
-        self._row = self._column = 1
-        result = []
-
-        for chunk in filter(lambda x: x, self._separator.split(code)):
-            if not (token := self._match_token(chunk)).ignore:
-                result.append(
-                    TokenState(
-                        row=self._row,
-                        column=self._column,
-                        name=token.name,
-                        value=chunk,
-                    )
-                )
-            self._update_position(chunk)
-        return result
+        buffer = TokenBuffer(code, self.kinds)
+        for kind, start, end, row, column, _ in self._scan(code):
+            buffer.append(kind, start, end, row, column)
+        return buffer
+
+    def tokenize_iter(
+        self,
+        source: Union[str, bytes, IO[Any], mmap.mmap],
+    ) -> Iterator[TokenState]:
+        """Tokenizes a string, a file or a memory map one token at a time.
+
+        Files are memory-mapped instead of being read, so a pure ASCII source
+        is never copied. Other sources are decoded first, because the bytes
+        scanner cannot match letters outside ASCII.
+        """
+        if isinstance(source, (str, bytes, mmap.mmap)):
+            yield from self._label(self._text(source))
+            return None
+        try:
+            mapped = mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ)
+        except (AttributeError, OSError, ValueError):  # Pipes, buffers, etc.
+            yield from self._label(self._text(source.read()))
+            return None
+        with mapped:
+            yield from self._label(self._text(mapped))
+        return None
+
+    @staticmethod
+    def _text(
+        code: Union[str, bytes, mmap.mmap],
+    ) -> Union[str, bytes, mmap.mmap]:
+        """Decodes the bytes of a source unless they are pure ASCII."""
+        if isinstance(code, str) or _NON_ASCII.search(code) is None:  # type: ignore[arg-type]
+            return code
+        return code[:].decode('utf-8')
+
+    def _label(
+        self,
+        code: Union[str, bytes, mmap.mmap],
+    ) -> Iterator[TokenState]:
+        """Turns the scanned tokens into states."""
+        for kind, _, _, row, column, chunk in self._scan(code):
+            yield TokenState(
+                row=row,
+                column=column,
+                name=self._labels[kind],
+                value=chunk,
+            )
+        return None
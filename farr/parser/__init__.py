@@ -4,9 +4,14 @@
 # https://github.com/sheikhartin/farr
 
 from functools import partial
-from typing import Optional, Union, Callable, List, Tuple
+from typing import Optional, Union, Callable, Iterable, Type, List, Tuple, Dict
 
-from farr.helpers import partition_a_sequence, normalize_identifier
+from farr.helpers import (
+    partition_a_sequence,
+    normalize_identifier,
+    split_interpolations,
+)
+from farr.lexer import TokenKind, FarrRegexLexer
 from farr.lexer.base import TokenState
 from farr.parser.base import Parser
 from farr.parser.nodes import (
@@ -23,6 +28,7 @@ from farr.parser.nodes import (
     FloatNode,
     StringNode,
     IdentifierNode,
+    InterpolatedStringNode,
     RangeNode,
     ItemizedExpressionNode,
     ChainedExpressionsNode,
@@ -71,17 +77,105 @@ from farr.parser.nodes import (
 
 
 class FarrParser(Parser):
-    def _except_current_and_next_at(
-        self,
-        index: int,
-        tokens: Tuple[str, ...],
-    ) -> Optional[bool]:
-        """Checks the token at the given index without advancing the position."""
-        return (
-            self._tokens_state[index].name in tokens
-            if len(self._tokens_state) >= index
-            else None
-        )
+    kinds = TokenKind
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._statements: Dict[
+            int, Callable[[], Optional[Union[ExpressionNode, StatementNode]]]
+        ] = {
+            TokenKind.Use: partial(
+                self._followed_by_semicolon, self._parse_use
+            ),
+            TokenKind.Variable: partial(
+                self._followed_by_semicolon, self._parse_variable_declaration
+            ),
+            TokenKind.While: self._parse_while,
+            TokenKind.For: self._parse_for,
+            TokenKind.Break: partial(
+                self._followed_by_semicolon, self._parse_break
+            ),
+            TokenKind.Continue: partial(
+                self._followed_by_semicolon, self._parse_continue
+            ),
+            TokenKind.If: self._parse_if,
+            TokenKind.Match: self._parse_match,
+            TokenKind.Try: self._parse_try,
+            TokenKind.Function: self._process_function,
+            TokenKind.Struct: self._parse_struct,
+            TokenKind.Return: partial(
+                self._followed_by_semicolon, self._parse_return
+            ),
+        }
+        self._assignments: Dict[int, Type[AssignmentNode]] = {
+            TokenKind.Equal: AssignmentNode,
+            TokenKind.LeftShiftEqual: LeftShiftAssignmentNode,
+            TokenKind.RightShiftEqual: RightShiftAssignmentNode,
+            TokenKind.AddEqual: AddAssignmentNode,
+            TokenKind.SubtractEqual: SubtractAssignmentNode,
+            TokenKind.MultiplyEqual: MultiplyAssignmentNode,
+            TokenKind.DivideEqual: DivideAssignmentNode,
+            TokenKind.ModulusEqual: ModulusAssignmentNode,
+            TokenKind.PowerEqual: PowerAssignmentNode,
+        }
+        self._prefixes: Dict[int, Callable[[], Optional[ExpressionNode]]] = {
+            TokenKind.Increment: self._parse_pre_increment,
+            TokenKind.Decrement: self._parse_pre_decrement,
+            TokenKind.Pass: self._parse_pass,
+            TokenKind.Null: self._parse_null,
+            TokenKind.Binary: partial(
+                self._process_literal, self._parse_binary
+            ),
+            TokenKind.Octal: partial(self._process_literal, self._parse_octal),
+            TokenKind.Hexadecimal: partial(
+                self._process_literal, self._parse_hexadecimal
+            ),
+            TokenKind.Integer: partial(
+                self._process_literal, self._parse_integer
+            ),
+            TokenKind.Float: partial(self._process_literal, self._parse_float),
+            TokenKind.String: partial(
+                self._process_literal, self._parse_string
+            ),
+            TokenKind.Identifier: self._process_identifier,
+            TokenKind.Not: self._parse_negation_operation,
+            TokenKind.LeftBrace: self._process_braces,
+            TokenKind.LeftParenthesis: self._process_grouped_expression,
+            TokenKind.LeftBracket: partial(self._bracketed, self._parse_range),  # type: ignore[dict-item]
+            **dict.fromkeys(
+                (
+                    TokenKind.LeftShift,
+                    TokenKind.RightShift,
+                    TokenKind.Add,
+                    TokenKind.Subtract,
+                    TokenKind.Multiply,
+                    TokenKind.Divide,
+                    TokenKind.Modulus,
+                    TokenKind.Power,
+                ),
+                self._parse_arithmetic_operation,
+            ),
+        }
+        self._infixes: Dict[
+            int, Tuple[int, Callable[[ExpressionNode], ExpressionNode]]
+        ] = {
+            **dict.fromkeys(
+                (
+                    TokenKind.EqualEqual,
+                    TokenKind.NotEqual,
+                    TokenKind.GreaterThan,
+                    TokenKind.LessThan,
+                    TokenKind.GreaterThanOrEqual,
+                    TokenKind.LessThanOrEqual,
+                ),
+                (1, self._parse_relational_operation),
+            ),
+            TokenKind.And: (2, self._parse_logical_operation),
+            TokenKind.Or: (2, self._parse_logical_operation),
+            TokenKind.Increment: (3, self._parse_post_increment),
+            TokenKind.Decrement: (3, self._parse_post_decrement),
+            TokenKind.If: (4, self._parse_ternary_operation),
+        }
 
     def _validate(
         self,
@@ -90,13 +184,13 @@ class FarrParser(Parser):
     ) -> Optional[ExpressionNode]:
         """Validates function output and checks for expected tokens."""
         if (node := fn()) is None:
-            self.expect(*expects)
+            self.fail(*expects)
         return node
 
     def _followed_by(
         self,
         fn: Callable[[], Optional[Union[ExpressionNode, StatementNode]]],
-        expects: Tuple[str, ...],
+        expects: Tuple[int, ...],
     ) -> Optional[Union[ExpressionNode, StatementNode]]:
         """Calls function and expects following tokens."""
         node = fn()
@@ -109,13 +203,13 @@ class FarrParser(Parser):
         fn: Callable[[], Optional[Union[ExpressionNode, StatementNode]]],
     ) -> Optional[Union[ExpressionNode, StatementNode]]:
         """Calls function and expects following semicolon."""
-        return self._followed_by(fn, ('Semicolon',))
+        return self._followed_by(fn, (TokenKind.Semicolon,))
 
     def _grouped(
         self,
-        opened: str,
+        opened: int,
         fn: Callable[[], Optional[Union[ExpressionNode, StatementNode]]],
-        closed: str,
+        closed: int,
     ) -> Optional[Union[ExpressionNode, StatementNode]]:
         """Groups expression between opening and closing tokens."""
         self.expect(opened)
@@ -130,21 +224,23 @@ class FarrParser(Parser):
         fn: Callable[[], Optional[Union[ExpressionNode, StatementNode]]],
     ) -> Optional[Union[ExpressionNode, StatementNode]]:
         """Groups expression in brackets."""
-        return self._grouped('LeftBracket', fn, 'RightBracket')
+        return self._grouped(TokenKind.LeftBracket, fn, TokenKind.RightBracket)
 
     def _braced(
         self,
         fn: Callable[[], Optional[Union[ExpressionNode, StatementNode]]],
     ) -> Optional[Union[ExpressionNode, StatementNode]]:
         """Groups expressions in braces."""
-        return self._grouped('LeftBrace', fn, 'RightBrace')
+        return self._grouped(TokenKind.LeftBrace, fn, TokenKind.RightBrace)
 
     def _parenthesized(
         self,
         fn: Callable[[], Optional[Union[ExpressionNode, StatementNode]]],
     ) -> Optional[Union[ExpressionNode, StatementNode]]:
         """Groups expression in parentheses."""
-        return self._grouped('LeftParenthesis', fn, 'RightParenthesis')
+        return self._grouped(
+            TokenKind.LeftParenthesis, fn, TokenKind.RightParenthesis
+        )
 
     def _separated_items(
         self,
@@ -154,7 +250,7 @@ class FarrParser(Parser):
                 Union[ExpressionNode, VariableDeclarationNode, AssignmentNode]
             ],
         ],
-        separators: Tuple[str, ...],
+        separators: Tuple[int, ...],
     ) -> ItemizedExpressionNode:
         """Collects separated items."""
         items = []
@@ -178,7 +274,7 @@ class FarrParser(Parser):
         ],
     ) -> ItemizedExpressionNode:
         """Collects items separated by comma."""
-        return self._separated_items(fn, ('Comma',))
+        return self._separated_items(fn, (TokenKind.Comma,))
 
     def _dot_separated_items(
         self,
@@ -190,7 +286,7 @@ class FarrParser(Parser):
         ],
     ) -> ItemizedExpressionNode:
         """Collects items separated by dot."""
-        return self._separated_items(fn, ('Dot',))
+        return self._separated_items(fn, (TokenKind.Dot,))
 
     def _accumulate_until(
         self,
@@ -205,7 +301,7 @@ class FarrParser(Parser):
 
     def _parse_pass(self) -> PassNode:
         """Parses a pass token."""
-        self.expect('Pass')
+        self.expect(TokenKind.Pass)
         pass_ = PassNode(
             row=self._current_token.row,  # type: ignore[attr-defined]
             column=self._current_token.column,  # type: ignore[attr-defined]
@@ -215,7 +311,7 @@ class FarrParser(Parser):
 
     def _parse_null(self) -> NullNode:
         """Parses a null."""
-        self.expect('Null')
+        self.expect(TokenKind.Null)
         null = NullNode(
             row=self._current_token.row,  # type: ignore[attr-defined]
             column=self._current_token.column,  # type: ignore[attr-defined]
@@ -225,7 +321,7 @@ class FarrParser(Parser):
 
     def _parse_binary(self) -> BinaryNode:
         """Parses a binary value."""
-        self.expect('Binary')
+        self.expect(TokenKind.Binary)
         binary = BinaryNode(
             row=self._current_token.row,  # type: ignore[attr-defined]
             column=self._current_token.column,  # type: ignore[attr-defined]
@@ -236,7 +332,7 @@ class FarrParser(Parser):
 
     def _parse_octal(self) -> OctalNode:
         """Parses an octal value."""
-        self.expect('Octal')
+        self.expect(TokenKind.Octal)
         octal = OctalNode(
             row=self._current_token.row,  # type: ignore[attr-defined]
             column=self._current_token.column,  # type: ignore[attr-defined]
@@ -247,7 +343,7 @@ class FarrParser(Parser):
 
     def _parse_hexadecimal(self) -> HexadecimalNode:
         """Parses a hexadecimal value."""
-        self.expect('Hexadecimal')
+        self.expect(TokenKind.Hexadecimal)
         hexadecimal = HexadecimalNode(
             row=self._current_token.row,  # type: ignore[attr-defined]
             column=self._current_token.column,  # type: ignore[attr-defined]
@@ -258,7 +354,7 @@ class FarrParser(Parser):
 
     def _parse_integer(self) -> IntegerNode:
         """Parses an integer token."""
-        self.expect('Integer')
+        self.expect(TokenKind.Integer)
         integer = IntegerNode(
             row=self._current_token.row,  # type: ignore[attr-defined]
             column=self._current_token.column,  # type: ignore[attr-defined]
@@ -269,7 +365,7 @@ class FarrParser(Parser):
 
     def _parse_float(self) -> FloatNode:
         """Parses a float token."""
-        self.expect('Float')
+        self.expect(TokenKind.Float)
         float_ = FloatNode(
             row=self._current_token.row,  # type: ignore[attr-defined]
             column=self._current_token.column,  # type: ignore[attr-defined]
@@ -278,20 +374,41 @@ class FarrParser(Parser):
         self.step()
         return float_
 
-    def _parse_string(self) -> StringNode:
-        """Parses a string token."""
-        self.expect('String')
+    def _parse_string(self) -> Union[StringNode, InterpolatedStringNode]:
+        """Parses a string token and the expressions interpolated in it.
+
+        A string whose interpolations are not valid code is left as it is,
+        so the error is only raised if the string is evaluated.
+        """
+        self.expect(TokenKind.String)
         string = StringNode(
             row=self._current_token.row,  # type: ignore[attr-defined]
             column=self._current_token.column,  # type: ignore[attr-defined]
             value=self._current_token.value,  # type: ignore[attr-defined]
         )
         self.step()
-        return string
+        *parts, last = split_interpolations(string.value)
+        if not parts:
+            return string
+        try:
+            interpolations = [
+                self.__class__()
+                .parse(FarrRegexLexer().tokenize(f'{source};'))
+                .body
+                for source in parts[1::2]
+            ]
+        except SyntaxError:
+            return string
+        return InterpolatedStringNode(
+            row=string.row,
+            column=string.column,
+            texts=[*parts[::2], last],
+            interpolations=interpolations,
+        )
 
     def _parse_identifier(self) -> IdentifierNode:
         """Parses an identifier token."""
-        self.expect('Identifier', 'Symbol')
+        self.expect(TokenKind.Identifier)
         identifier = IdentifierNode(
             row=self._current_token.row,  # type: ignore[attr-defined]
             column=self._current_token.column,  # type: ignore[attr-defined]
@@ -302,31 +419,9 @@ class FarrParser(Parser):
         self.step()
         return identifier
 
-    def _process_factor(self) -> Optional[ExpressionNode]:
-        """Processes a factor expression."""
-        if self.check('Pass'):
-            return self._parse_pass()
-        elif self.check('Null'):
-            return self._parse_null()
-        elif self.check('Binary'):
-            return self._parse_binary()
-        elif self.check('Octal'):
-            return self._parse_octal()
-        elif self.check('Hexadecimal'):
-            return self._parse_hexadecimal()
-        elif self.check('Integer'):
-            return self._parse_integer()
-        elif self.check('Float'):
-            return self._parse_float()
-        elif self.check('String'):
-            return self._parse_string()
-        elif self.check('Identifier', 'Symbol'):
-            return self._parse_identifier()
-        return None
-
     def _parse_negation_operation(self) -> NegationOperationNode:
         """Parses a negation operation."""
-        self.expect('Not')
+        self.expect(TokenKind.Not)
         operator = self._current_token
         self.step()
         return NegationOperationNode(
@@ -341,7 +436,7 @@ class FarrParser(Parser):
 
     def _parse_pre_increment(self) -> PreIncrementNode:
         """Parses a pre-increment operation."""
-        self.expect('Increment')
+        self.expect(TokenKind.Increment)
         operator = self._current_token
         self.step()
         return PreIncrementNode(
@@ -360,7 +455,7 @@ class FarrParser(Parser):
 
     def _parse_pre_decrement(self) -> PreDecrementNode:
         """Parses a pre-decrement operation."""
-        self.expect('Decrement')
+        self.expect(TokenKind.Decrement)
         operator = self._current_token
         self.step()
         return PreDecrementNode(
@@ -390,7 +485,7 @@ class FarrParser(Parser):
 
     def _parse_pair(self) -> PairNode:
         """Parses a pair expression."""
-        self.expect('Colon')
+        self.expect(TokenKind.Colon)
         self.step()
         return PairNode(
             key=self._validate(  # type: ignore[arg-type]
@@ -405,11 +500,11 @@ class FarrParser(Parser):
 
     def _resolve_empty_hash_map(self) -> None:
         """Resolves an empty hash map."""
-        self.expect('LeftBrace')
+        self.expect(TokenKind.LeftBrace)
         self.step()
-        self.expect('Colon')
+        self.expect(TokenKind.Colon)
         self.step()
-        self.expect('RightBrace')
+        self.expect(TokenKind.RightBrace)
         self.step()
         return None
 
@@ -423,7 +518,7 @@ class FarrParser(Parser):
                         fn=self._parse_pair,
                     )
                 )
-                if not self._except_current_and_next_at(0, ('RightBrace',))
+                if not self.check_at(2, TokenKind.RightBrace)
                 else self._resolve_empty_hash_map()  # type: ignore[func-returns-value]
             )
         )
@@ -431,10 +526,10 @@ class FarrParser(Parser):
     def _parse_range(self) -> RangeNode:
         """Parses a range expression."""
         from_ = self._validate(self._process_expression, ('Expression',))
-        if (by := None) or self.check('Comma'):
+        if (by := None) or self.check(TokenKind.Comma):
             self.step()
             by = self._validate(self._process_expression, ('Expression',))
-        if (to := None) or self.check('Between'):
+        if (to := None) or self.check(TokenKind.Between):
             self.step()
             to = self._validate(self._process_expression, ('Expression',))
         return RangeNode(from_=from_, to=to, by=by)  # type: ignore[arg-type]
@@ -442,14 +537,14 @@ class FarrParser(Parser):
     def _parse_arithmetic_operation(self) -> ArithmeticOperationNode:
         """Parses an arithmetic operation."""
         self.expect(
-            'LeftShift',
-            'RightShift',
-            'Add',
-            'Subtract',
-            'Multiply',
-            'Divide',
-            'Modulus',
-            'Power',
+            TokenKind.LeftShift,
+            TokenKind.RightShift,
+            TokenKind.Add,
+            TokenKind.Subtract,
+            TokenKind.Multiply,
+            TokenKind.Divide,
+            TokenKind.Modulus,
+            TokenKind.Power,
         )
         operator = self._current_token
         self.step()
@@ -470,7 +565,7 @@ class FarrParser(Parser):
     def _parse_keyword_assignment(self) -> AssignmentNode:
         """Assigns to an optional parameter when calling."""
         references = self._dot_separated_items(self._parse_identifier)
-        self.expect('Equal')
+        self.expect(TokenKind.Equal)
         self.step()
         return AssignmentNode(
             references=references,
@@ -482,7 +577,7 @@ class FarrParser(Parser):
 
     def _parse_expandable_argument(self) -> ExpandableArgumentNode:
         """Parses an expandable argument for calls."""
-        self.expect('Pass')
+        self.expect(TokenKind.Pass)
         self.step()
         return ExpandableArgumentNode(
             expression=self._validate(self._process_expression, ('Expression',))  # type: ignore[arg-type]
@@ -494,11 +589,11 @@ class FarrParser(Parser):
         """Resolves a call argument expression."""
         return (
             self._parse_keyword_assignment()
-            if self.check('Identifier', 'Symbol') and self.peek('Equal')
+            if self.check(TokenKind.Identifier) and self.peek(TokenKind.Equal)
             else (
                 self._parse_expandable_argument()
-                if self.check('Pass')
-                and not self.peek('Comma', 'RightParenthesis')
+                if self.check(TokenKind.Pass)
+                and not self.peek(TokenKind.Comma, TokenKind.RightParenthesis)
                 else self._process_expression()
             )
         )
@@ -560,160 +655,175 @@ class FarrParser(Parser):
         base: ExpressionNode,
     ) -> Union[ExpressionNode, ChainedExpressionsNode]:
         """Processes chained expressions if dot is detected."""
-        if self.check('Dot'):
+        if self.check(TokenKind.Dot):
             self.step()
             return self._parse_chained_expressions(base)
         return base
 
+    def _process_literal(
+        self,
+        fn: Callable[[], HeterogeneousLiteralNode],
+    ) -> Union[ExpressionNode, ChainedExpressionsNode]:
+        """Processes a literal that may be chained."""
+        return self._process_chaining(fn())
+
+    def _process_identifier(
+        self,
+    ) -> Union[ExpressionNode, ChainedExpressionsNode]:
+        """Processes an identifier that may be called or chained."""
+        identifier = self._parse_identifier()
+        if self.check(TokenKind.LeftParenthesis):
+            return self._process_chaining(self._parse_call(identifier))
+        return self._process_chaining(identifier)
+
+    def _process_braces(self) -> Optional[ExpressionNode]:
+        """Processes a list or a hash map."""
+        if self.peek(TokenKind.RightBrace) or self.check_at(2, TokenKind.Comma):
+            return self._process_chaining(self._parse_list())
+        elif self.peek(TokenKind.Colon):
+            return self._process_chaining(self._parse_hash_map())
+        return None
+
+    def _process_grouped_expression(
+        self,
+    ) -> Union[ExpressionNode, ChainedExpressionsNode]:
+        """Processes an expression between parentheses."""
+        return self._process_chaining(
+            GroupedExpressionNode(
+                expression=self._parenthesized(  # type: ignore[arg-type]
+                    self._process_expression
+                )
+            )
+        )
+
     def _process_term(self) -> Optional[ExpressionNode]:
         """Processes a term expression."""
-        if self.check('Increment'):
-            return self._parse_pre_increment()
-        elif self.check('Decrement'):
-            return self._parse_pre_decrement()
-        elif (factor := self._process_factor()) is None:
-            if self.check('Not'):
-                return self._parse_negation_operation()
-            elif self.check('LeftBrace') and (
-                self.peek('RightBrace')
-                or self._except_current_and_next_at(0, ('Comma',))
-            ):
-                return self._process_chaining(self._parse_list())
-            elif self.check('LeftBrace') and self.peek('Colon'):
-                return self._process_chaining(self._parse_hash_map())
-            elif self.check('LeftParenthesis'):
-                return self._process_chaining(
-                    GroupedExpressionNode(
-                        expression=self._parenthesized(  # type: ignore[arg-type]
-                            self._process_expression
-                        )
-                    )
-                )
-            elif self.check('LeftBracket'):
-                return self._bracketed(self._parse_range)  # type: ignore[return-value]
-            elif self.check(
-                'LeftShift',
-                'RightShift',
-                'Add',
-                'Subtract',
-                'Multiply',
-                'Divide',
-                'Modulus',
-                'Power',
-            ):
-                return self._parse_arithmetic_operation()
-        elif isinstance(factor, HeterogeneousLiteralNode):
-            if isinstance(factor, IdentifierNode) and self.check(
-                'LeftParenthesis'
-            ):
-                return self._process_chaining(self._parse_call(factor))
-            return self._process_chaining(factor)
-        return factor
-
-    def _process_expression(self) -> Optional[ExpressionNode]:
-        """Processes an expression."""
-        if (left := self._process_term()) is None:
+        if (prefix := self._prefixes.get(self._current_kind)) is None:  # type: ignore[arg-type]
             return None
+        return prefix()
 
-        if self.check(
-            'EqualEqual',
-            'NotEqual',
-            'GreaterThan',
-            'LessThan',
-            'GreaterThanOrEqual',
-            'LessThanOrEqual',
-        ):
-            operator = self._current_token
-            self.step()
-            left = RelationalOperationNode(
-                row=operator.row,  # type: ignore[attr-defined]
-                column=operator.column,  # type: ignore[attr-defined]
-                operator=operator.name,  # type: ignore[attr-defined]
-                left=left,
-                right=self._validate(  # type: ignore[arg-type]
-                    self._process_expression,
-                    ('Expression',),
-                ),
-            )
-        if self.check('And', 'Or'):
-            operator = self._current_token
-            self.step()
-            left = LogicalOperationNode(
-                row=operator.row,  # type: ignore[attr-defined]
-                column=operator.column,  # type: ignore[attr-defined]
-                operator=operator.name,  # type: ignore[attr-defined]
-                left=left,
-                right=self._validate(  # type: ignore[arg-type]
-                    self._process_expression,
-                    ('Expression',),
-                ),
-            )
+    def _parse_relational_operation(
+        self,
+        left: ExpressionNode,
+    ) -> RelationalOperationNode:
+        """Parses a relational operation."""
+        operator = self._current_token
+        self.step()
+        return RelationalOperationNode(
+            row=operator.row,  # type: ignore[attr-defined]
+            column=operator.column,  # type: ignore[attr-defined]
+            operator=operator.name,  # type: ignore[attr-defined]
+            left=left,
+            right=self._validate(  # type: ignore[arg-type]
+                self._process_expression,
+                ('Expression',),
+            ),
+        )
 
-        if self.check('Increment'):
-            operator = self._current_token
-            self.step()
-            left = PostIncrementNode(
-                row=operator.row,  # type: ignore[attr-defined]
-                column=operator.column,  # type: ignore[attr-defined]
-                operator=None,
-                operand=(
-                    left.expressions
-                    if isinstance(left, ChainedExpressionsNode)
-                    else ItemizedExpressionNode(items=[left])
-                ),
-            )
-        elif self.check('Decrement'):
-            operator = self._current_token
-            self.step()
-            left = PostDecrementNode(
-                row=operator.row,  # type: ignore[attr-defined]
-                column=operator.column,  # type: ignore[attr-defined]
-                operator=None,
-                operand=(
-                    left.expressions
-                    if isinstance(left, ChainedExpressionsNode)
-                    else ItemizedExpressionNode(items=[left])
-                ),
-            )
+    def _parse_logical_operation(
+        self,
+        left: ExpressionNode,
+    ) -> LogicalOperationNode:
+        """Parses a logical operation."""
+        operator = self._current_token
+        self.step()
+        return LogicalOperationNode(
+            row=operator.row,  # type: ignore[attr-defined]
+            column=operator.column,  # type: ignore[attr-defined]
+            operator=operator.name,  # type: ignore[attr-defined]
+            left=left,
+            right=self._validate(  # type: ignore[arg-type]
+                self._process_expression,
+                ('Expression',),
+            ),
+        )
 
-        if self.check('If'):
-            if_ = self._current_token
-            self.step()
-            condition = self._validate(
+    def _parse_post_increment(self, left: ExpressionNode) -> PostIncrementNode:
+        """Parses a post-increment operation."""
+        operator = self._current_token
+        self.step()
+        return PostIncrementNode(
+            row=operator.row,  # type: ignore[attr-defined]
+            column=operator.column,  # type: ignore[attr-defined]
+            operator=None,
+            operand=(
+                left.expressions
+                if isinstance(left, ChainedExpressionsNode)
+                else ItemizedExpressionNode(items=[left])
+            ),
+        )
+
+    def _parse_post_decrement(self, left: ExpressionNode) -> PostDecrementNode:
+        """Parses a post-decrement operation."""
+        operator = self._current_token
+        self.step()
+        return PostDecrementNode(
+            row=operator.row,  # type: ignore[attr-defined]
+            column=operator.column,  # type: ignore[attr-defined]
+            operator=None,
+            operand=(
+                left.expressions
+                if isinstance(left, ChainedExpressionsNode)
+                else ItemizedExpressionNode(items=[left])
+            ),
+        )
+
+    def _parse_ternary_operation(
+        self,
+        then: ExpressionNode,
+    ) -> TernaryOperationNode:
+        """Parses a ternary operation."""
+        if_ = self._current_token
+        self.step()
+        condition = self._validate(
+            self._process_expression,
+            ('Expression',),
+        )
+        self.expect(TokenKind.Else)
+        self.step()
+        return TernaryOperationNode(
+            row=if_.row,  # type: ignore[attr-defined]
+            column=if_.column,  # type: ignore[attr-defined]
+            then=then,
+            condition=condition,  # type: ignore[arg-type]
+            orelse=self._validate(  # type: ignore[arg-type]
                 self._process_expression,
                 ('Expression',),
-            )
-            self.expect('Else')
-            self.step()
-            left = TernaryOperationNode(
-                row=if_.row,  # type: ignore[attr-defined]
-                column=if_.column,  # type: ignore[attr-defined]
-                then=left,
-                condition=condition,  # type: ignore[arg-type]
-                orelse=self._validate(  # type: ignore[arg-type]
-                    self._process_expression,
-                    ('Expression',),
-                ),
-            )
+            ),
+        )
+
+    def _process_expression(self, power: int = 0) -> Optional[ExpressionNode]:
+        """Processes an expression by climbing the binding powers.
+
+        An operator after the left side is taken only if it binds tighter
+        than the previous one, and the right sides are whole expressions.
+        """
+        if (left := self._process_term()) is None:
+            return None
+        while (
+            infix := self._infixes.get(self._current_kind)  # type: ignore[arg-type]
+        ) is not None and infix[0] > power:
+            power, fn = infix
+            left = fn(left)
         return left
 
     def _parse_use(self) -> UseNode:
         """Parses an use statement."""
-        self.expect('Use')
+        self.expect(TokenKind.Use)
         self.step()
         return UseNode(
             path=self._separated_items(
                 self._parse_identifier,
-                ('Divide',),
+                (TokenKind.Divide,),
             )
         )
 
     def _parse_variable_declaration(self) -> VariableDeclarationNode:
         """Parses a variable declaration statement."""
-        self.expect('Variable')
+        self.expect(TokenKind.Variable)
         self.step()
         identifier = self._parse_identifier()
-        if (expression := None) or self.check('Equal'):
+        if (expression := None) or self.check(TokenKind.Equal):
             self.step()
             expression = self._validate(
                 self._process_expression, ('Expression',)
@@ -726,12 +836,12 @@ class FarrParser(Parser):
         self,
     ) -> VariadicParameterDeclarationNode:
         """Parses a declaration of a variadic parameter."""
-        self.expect('Variable')
+        self.expect(TokenKind.Variable)
         self.step()
         identifier = self._parse_identifier()
-        self.expect('Pass')
+        self.expect(TokenKind.Pass)
         self.step()
-        if (expression := None) or self.check('Equal'):
+        if (expression := None) or self.check(TokenKind.Equal):
             self.step()
             expression = self._validate(
                 self._process_expression, ('Expression',)
@@ -745,129 +855,10 @@ class FarrParser(Parser):
         references: ItemizedExpressionNode,
     ) -> AssignmentNode:
         """Parses an assignment statement."""
-        self.expect('Equal')
+        self.expect(*self._assignments)
+        node_type = self._assignments[self._current_kind]  # type: ignore[index]
         self.step()
-        return AssignmentNode(
-            references=references,
-            expression=self._validate(  # type: ignore[arg-type]
-                self._process_expression,
-                ('Expression',),
-            ),
-        )
-
-    def _parse_left_shift_assignment(
-        self,
-        references: ItemizedExpressionNode,
-    ) -> LeftShiftAssignmentNode:
-        """Parses a left shift assignment."""
-        self.expect('LeftShiftEqual')
-        self.step()
-        return LeftShiftAssignmentNode(
-            references=references,
-            expression=self._validate(  # type: ignore[arg-type]
-                self._process_expression,
-                ('Expression',),
-            ),
-        )
-
-    def _parse_right_shift_assignment(
-        self,
-        references: ItemizedExpressionNode,
-    ) -> RightShiftAssignmentNode:
-        """Parses a right shift assignment."""
-        self.expect('RightShiftEqual')
-        self.step()
-        return RightShiftAssignmentNode(
-            references=references,
-            expression=self._validate(  # type: ignore[arg-type]
-                self._process_expression,
-                ('Expression',),
-            ),
-        )
-
-    def _parse_add_assignment(
-        self,
-        references: ItemizedExpressionNode,
-    ) -> AddAssignmentNode:
-        """Parses an addition assignment."""
-        self.expect('AddEqual')
-        self.step()
-        return AddAssignmentNode(
-            references=references,
-            expression=self._validate(  # type: ignore[arg-type]
-                self._process_expression,
-                ('Expression',),
-            ),
-        )
-
-    def _parse_subtract_assignment(
-        self,
-        references: ItemizedExpressionNode,
-    ) -> SubtractAssignmentNode:
-        """Parses a subtraction assignment."""
-        self.expect('SubtractEqual')
-        self.step()
-        return SubtractAssignmentNode(
-            references=references,
-            expression=self._validate(  # type: ignore[arg-type]
-                self._process_expression,
-                ('Expression',),
-            ),
-        )
-
-    def _parse_multiply_assignment(
-        self,
-        references: ItemizedExpressionNode,
-    ) -> MultiplyAssignmentNode:
-        """Parses a multiplication assignment."""
-        self.expect('MultiplyEqual')
-        self.step()
-        return MultiplyAssignmentNode(
-            references=references,
-            expression=self._validate(  # type: ignore[arg-type]
-                self._process_expression,
-                ('Expression',),
-            ),
-        )
-
-    def _parse_divide_assignment(
-        self,
-        references: ItemizedExpressionNode,
-    ) -> DivideAssignmentNode:
-        """Parses a division assignment."""
-        self.expect('DivideEqual')
-        self.step()
-        return DivideAssignmentNode(
-            references=references,
-            expression=self._validate(  # type: ignore[arg-type]
-                self._process_expression,
-                ('Expression',),
-            ),
-        )
-
-    def _parse_modulus_assignment(
-        self,
-        references: ItemizedExpressionNode,
-    ) -> ModulusAssignmentNode:
-        """Parses a modulus assignment."""
-        self.expect('ModulusEqual')
-        self.step()
-        return ModulusAssignmentNode(
-            references=references,
-            expression=self._validate(  # type: ignore[arg-type]
-                self._process_expression,
-                ('Expression',),
-            ),
-        )
-
-    def _parse_power_assignment(
-        self,
-        references: ItemizedExpressionNode,
-    ) -> PowerAssignmentNode:
-        """Parses a power assignment."""
-        self.expect('PowerEqual')
-        self.step()
-        return PowerAssignmentNode(
+        return node_type(
             references=references,
             expression=self._validate(  # type: ignore[arg-type]
                 self._process_expression,
@@ -880,20 +871,20 @@ class FarrParser(Parser):
         fn: Callable[[], Optional[Union[ExpressionNode, StatementNode]]],
     ) -> BlockNode:
         """Parses a block."""
-        self.expect('Equal')
+        self.expect(TokenKind.Equal)
         self.step()
-        self.expect('LeftBrace')
+        self.expect(TokenKind.LeftBrace)
         self.step()
         body = self._accumulate_until(
-            lambda: self.at_end() or self.check('RightBrace'), fn
+            lambda: self.at_end() or self.check(TokenKind.RightBrace), fn
         )
-        self.expect('RightBrace')
+        self.expect(TokenKind.RightBrace)
         self.step()
         return BlockNode(body=body)  # type: ignore[arg-type]
 
     def _parse_while(self) -> WhileNode:
         """Parses a while statement."""
-        self.expect('While')
+        self.expect(TokenKind.While)
         self.step()
         condition = self._validate(
             (
@@ -901,13 +892,13 @@ class FarrParser(Parser):
                     self._parenthesized,
                     fn=self._process_expression,
                 )
-                if self.check('LeftParenthesis')
+                if self.check(TokenKind.LeftParenthesis)
                 else self._process_expression
             ),
             ('Expression',),
         )
         body = self._parse_block(self._process_expression_or_statement)
-        if (orelse := None) or self.check('Else'):
+        if (orelse := None) or self.check(TokenKind.Else):
             self.step()
             orelse = self._parse_block(self._process_expression_or_statement)
         return WhileNode(condition=condition, body=body, orelse=orelse)  # type: ignore[arg-type]
@@ -918,13 +909,13 @@ class FarrParser(Parser):
         """Resolves an initial declaration in a for loop."""
         return (
             self._parse_variable_declaration()
-            if self.check('Variable')
+            if self.check(TokenKind.Variable)
             else self._parse_identifier()
         )
 
     def _parse_for(self) -> ForNode:
         """Parses a for statement."""
-        self.expect('For')
+        self.expect(TokenKind.For)
         self.step()
         initial = (
             self._parenthesized(
@@ -933,14 +924,14 @@ class FarrParser(Parser):
                     fn=self._resolve_initial,
                 )
             )
-            if self.check('LeftParenthesis')
+            if self.check(TokenKind.LeftParenthesis)
             else self._comma_separated_items(self._resolve_initial)
         )
-        self.expect('In')
+        self.expect(TokenKind.In)
         self.step()
         condition = self._validate(self._process_expression, ('Expression',))
         body = self._parse_block(self._process_expression_or_statement)
-        if (orelse := None) or self.check('Else'):
+        if (orelse := None) or self.check(TokenKind.Else):
             self.step()
             orelse = self._parse_block(self._process_expression_or_statement)
         return ForNode(
@@ -952,7 +943,7 @@ class FarrParser(Parser):
 
     def _parse_break(self) -> BreakNode:
         """Parses a break statement."""
-        self.expect('Break')
+        self.expect(TokenKind.Break)
         break_ = BreakNode(
             row=self._current_token.row,  # type: ignore[attr-defined]
             column=self._current_token.column,  # type: ignore[attr-defined]
@@ -962,7 +953,7 @@ class FarrParser(Parser):
 
     def _parse_continue(self) -> ContinueNode:
         """Parses a continue statement."""
-        self.expect('Continue')
+        self.expect(TokenKind.Continue)
         continue_ = ContinueNode(
             row=self._current_token.row,  # type: ignore[attr-defined]
             column=self._current_token.column,  # type: ignore[attr-defined]
@@ -972,7 +963,7 @@ class FarrParser(Parser):
 
     def _parse_if(self) -> IfNode:
         """Parses an if statement."""
-        self.expect('If')
+        self.expect(TokenKind.If)
         self.step()
         condition = self._validate(
             (
@@ -980,16 +971,20 @@ class FarrParser(Parser):
                     self._parenthesized,
                     fn=self._process_expression,
                 )
-                if self.check('LeftParenthesis')
+                if self.check(TokenKind.LeftParenthesis)
                 else self._process_expression
             ),
             ('Expression',),
         )
         body = self._parse_block(self._process_expression_or_statement)
-        if (orelse := None) or self.check('Else') and self.peek('If'):
+        if (
+            (orelse := None)
+            or self.check(TokenKind.Else)
+            and self.peek(TokenKind.If)
+        ):
             self.step()
             orelse = self._parse_if()
-        elif self.check('Else'):
+        elif self.check(TokenKind.Else):
             self.step()
             orelse = self._parse_block(  # type: ignore[assignment]
                 self._process_expression_or_statement
@@ -998,7 +993,7 @@ class FarrParser(Parser):
 
     def _parse_case(self) -> CaseNode:
         """Parses a case of the match statement."""
-        self.expect('For')
+        self.expect(TokenKind.For)
         self.step()
         condition = (
             self._parenthesized(  # type: ignore[arg-type]
@@ -1007,24 +1002,28 @@ class FarrParser(Parser):
                     fn=self._process_expression,
                 )
             )
-            if self.check('LeftParenthesis')
+            if self.check(TokenKind.LeftParenthesis)
             else self._validate(
                 self._process_expression,
                 ('Expression',),
             )
         )
         body = self._parse_block(self._process_expression_or_statement)
-        if (orelse := None) or self.check('Else') and self.peek('For'):
+        if (
+            (orelse := None)
+            or self.check(TokenKind.Else)
+            and self.peek(TokenKind.For)
+        ):
             self.step()
             orelse = self._parse_case()
-        elif self.check('Else'):
+        elif self.check(TokenKind.Else):
             self.step()
             orelse = self._parse_block(self._process_expression_or_statement)  # type: ignore[assignment]
         return CaseNode(condition=condition, body=body, orelse=orelse)  # type: ignore[arg-type]
 
     def _parse_match(self) -> MatchNode:
         """Parses a match-for statement."""
-        self.expect('Match')
+        self.expect(TokenKind.Match)
         self.step()
         return MatchNode(
             expression=self._validate(  # type: ignore[arg-type]
@@ -1036,7 +1035,7 @@ class FarrParser(Parser):
 
     def _parse_catch(self) -> CatchNode:
         """Parses a catch clause."""
-        self.expect('Catch')
+        self.expect(TokenKind.Catch)
         self.step()
         return CatchNode(
             excepts=(
@@ -1046,20 +1045,24 @@ class FarrParser(Parser):
                         fn=self._parse_identifier,
                     )
                 )
-                if self.check('LeftParenthesis')
+                if self.check(TokenKind.LeftParenthesis)
                 else self._comma_separated_items(self._parse_identifier)
             ),
-            as_=self._parse_identifier() if self.check('Identifier') else None,
+            as_=(
+                self._parse_identifier()
+                if self.check(TokenKind.Identifier)
+                else None
+            ),
             body=self._parse_block(self._process_expression_or_statement),
-            orelse=self._parse_catch() if self.check('Catch') else None,
+            orelse=self._parse_catch() if self.check(TokenKind.Catch) else None,
         )
 
     def _parse_try(self) -> TryNode:
         """Parses a try-catch statement."""
-        self.expect('Try')
+        self.expect(TokenKind.Try)
         self.step()
         body = self._parse_block(self._process_expression_or_statement)
-        if (catch := None) or self.check('Catch'):
+        if (catch := None) or self.check(TokenKind.Catch):
             catch = self._parse_catch()
         return TryNode(body=body, catch=catch)
 
@@ -1071,18 +1074,18 @@ class FarrParser(Parser):
         """Resolves a parameter declaration."""
         return (
             self._parse_variadic_parameter_declaration()
-            if self.check('Variable')
-            and self._except_current_and_next_at(0, ('Pass',))
+            if self.check(TokenKind.Variable)
+            and self.check_at(2, TokenKind.Pass)
             else (
                 self._parse_variable_declaration()
-                if self.check('Variable')
+                if self.check(TokenKind.Variable)
                 else None
             )
         )
 
     def _parse_function(self) -> FunctionDefinitionNode:
         """Parses a function definition."""
-        self.expect('Function')
+        self.expect(TokenKind.Function)
         self.step()
         return FunctionDefinitionNode(
             identifier=self._parse_identifier(),
@@ -1097,10 +1100,10 @@ class FarrParser(Parser):
 
     def _parse_member_function(self) -> MemberFunctionDefinitionNode:
         """Parses a member function definition."""
-        self.expect('Function')
+        self.expect(TokenKind.Function)
         self.step()
         struct = self._parse_identifier()
-        self.expect('DoubleColon')
+        self.expect(TokenKind.DoubleColon)
         self.step()
         return MemberFunctionDefinitionNode(
             identifier=self._parse_identifier(),
@@ -1116,10 +1119,10 @@ class FarrParser(Parser):
 
     def _parse_struct(self) -> StructDefinitionNode:
         """Parses a struct definition."""
-        self.expect('Struct')
+        self.expect(TokenKind.Struct)
         self.step()
         identifier = self._parse_identifier()
-        if (parents := None) or self.check('LessThan'):
+        if (parents := None) or self.check(TokenKind.LessThan):
             self.step()
             parents = (
                 self._parenthesized(
@@ -1128,7 +1131,7 @@ class FarrParser(Parser):
                         fn=self._parse_identifier,
                     )
                 )
-                if self.check('LeftParenthesis')
+                if self.check(TokenKind.LeftParenthesis)
                 else self._comma_separated_items(self._parse_identifier)
             )
         return StructDefinitionNode(
@@ -1144,7 +1147,7 @@ class FarrParser(Parser):
 
     def _parse_return(self) -> ReturnNode:
         """Parses a return statement."""
-        self.expect('Return')
+        self.expect(TokenKind.Return)
         return_ = self._current_token
         self.step()
         return ReturnNode(
@@ -1153,43 +1156,25 @@ class FarrParser(Parser):
             expression=self._process_expression(),
         )
 
+    def _process_function(
+        self,
+    ) -> Union[FunctionDefinitionNode, MemberFunctionDefinitionNode]:
+        """Processes a function or a member function definition."""
+        if self.check_at(2, TokenKind.DoubleColon):
+            return self._parse_member_function()
+        return self._parse_function()
+
     def _process_expression_or_statement(
         self,
     ) -> Optional[Union[ExpressionNode, StatementNode]]:
         """Processes either an expression or a statement."""
-        if self.check('Use'):
-            return self._followed_by_semicolon(self._parse_use)  # type: ignore[return-value]
-        elif self.check('Variable'):
-            return self._followed_by_semicolon(  # type: ignore[return-value]
-                self._parse_variable_declaration
-            )
-        elif self.check('While'):
-            return self._parse_while()
-        elif self.check('For'):
-            return self._parse_for()
-        elif self.check('Break'):
-            return self._followed_by_semicolon(self._parse_break)  # type: ignore[return-value]
-        elif self.check('Continue'):
-            return self._followed_by_semicolon(self._parse_continue)  # type: ignore[return-value]
-        elif self.check('If'):
-            return self._parse_if()
-        elif self.check('Match'):
-            return self._parse_match()
-        elif self.check('Try'):
-            return self._parse_try()
-        elif self.check('Function') and not self._except_current_and_next_at(
-            0, ('DoubleColon',)
-        ):
-            return self._parse_function()
-        elif self.check('Function'):
-            return self._parse_member_function()
-        elif self.check('Struct'):
-            return self._parse_struct()
-        elif self.check('Return'):
-            return self._followed_by_semicolon(self._parse_return)  # type: ignore[return-value]
+        if (
+            statement := self._statements.get(self._current_kind)  # type: ignore[arg-type]
+        ) is not None:
+            return statement()
         elif (
             expression := self._process_expression()
-        ) is not None and self.check('Equal'):
+        ) is not None and self.check(*self._assignments):
             return self._followed_by_semicolon(
                 partial(
                     self._parse_assignment,
@@ -1200,100 +1185,11 @@ class FarrParser(Parser):
                     ),
                 )
             )
-        elif expression is not None and self.check('LeftShiftEqual'):
-            return self._followed_by_semicolon(
-                partial(
-                    self._parse_left_shift_assignment,
-                    references=(
-                        expression.expressions
-                        if isinstance(expression, ChainedExpressionsNode)
-                        else ItemizedExpressionNode(items=[expression])
-                    ),
-                )
-            )
-        elif expression is not None and self.check('RightShiftEqual'):
-            return self._followed_by_semicolon(
-                partial(
-                    self._parse_right_shift_assignment,
-                    references=(
-                        expression.expressions
-                        if isinstance(expression, ChainedExpressionsNode)
-                        else ItemizedExpressionNode(items=[expression])
-                    ),
-                )
-            )
-        elif expression is not None and self.check('AddEqual'):
-            return self._followed_by_semicolon(
-                partial(
-                    self._parse_add_assignment,
-                    references=(
-                        expression.expressions
-                        if isinstance(expression, ChainedExpressionsNode)
-                        else ItemizedExpressionNode(items=[expression])
-                    ),
-                )
-            )
-        elif expression is not None and self.check('SubtractEqual'):
-            return self._followed_by_semicolon(
-                partial(
-                    self._parse_subtract_assignment,
-                    references=(
-                        expression.expressions
-                        if isinstance(expression, ChainedExpressionsNode)
-                        else ItemizedExpressionNode(items=[expression])
-                    ),
-                )
-            )
-        elif expression is not None and self.check('MultiplyEqual'):
-            return self._followed_by_semicolon(
-                partial(
-                    self._parse_multiply_assignment,
-                    references=(
-                        expression.expressions
-                        if isinstance(expression, ChainedExpressionsNode)
-                        else ItemizedExpressionNode(items=[expression])
-                    ),
-                )
-            )
-        elif expression is not None and self.check('DivideEqual'):
-            return self._followed_by_semicolon(
-                partial(
-                    self._parse_divide_assignment,
-                    references=(
-                        expression.expressions
-                        if isinstance(expression, ChainedExpressionsNode)
-                        else ItemizedExpressionNode(items=[expression])
-                    ),
-                )
-            )
-        elif expression is not None and self.check('ModulusEqual'):
-            return self._followed_by_semicolon(
-                partial(
-                    self._parse_modulus_assignment,
-                    references=(
-                        expression.expressions
-                        if isinstance(expression, ChainedExpressionsNode)
-                        else ItemizedExpressionNode(items=[expression])
-                    ),
-                )
-            )
-        elif expression is not None and self.check('PowerEqual'):
-            return self._followed_by_semicolon(
-                partial(
-                    self._parse_power_assignment,
-                    references=(
-                        expression.expressions
-                        if isinstance(expression, ChainedExpressionsNode)
-                        else ItemizedExpressionNode(items=[expression])
-                    ),
-                )
-            )
         return self._followed_by_semicolon(lambda: expression)
 
-    def parse(self, tokens_state: List[TokenState]) -> ModuleNode:
+    def parse(self, tokens_state: Iterable[TokenState]) -> ModuleNode:
         """Parses the whole module and returns the root AST node."""
-        self._tokens_state = tokens_state
-        self.step()
+        self.start(tokens_state)
 
         return ModuleNode(
             body=sum(
@@ -3,76 +3,205 @@
 # We understand that beauty is not objective...
 # https://github.com/sheikhartin/farr
 
-from typing import Optional, List
+from enum import IntEnum
+from typing import Optional, Iterable, Iterator, Sequence, Type, List
 
-from farr.lexer.base import TokenState
+from farr.lexer.base import TokenState, TokenBuffer
 from farr.parser.nodes import ModuleNode
 
 
+class TokenStream:
+    """A cursor over the tokens that moves forward without consuming them.
+
+    Buffers from the lexer are read in place. Other iterables are pulled
+    lazily, and the tokens behind the cursor are dropped when no mark needs
+    them anymore.
+
+    Attributes:
+        kinds: The enumeration that the kinds of tokens belong to.
+        _values: The kind of each token name.
+        _tokens: The tokens that are available for reading.
+        _kinds: The kind of each available token.
+        _iterator: Where the missing tokens come from.
+        _offset: The absolute index of the first available token.
+        _position: The absolute index of the current token.
+        _marks: Positions that the cursor may be reset to.
+    """
+
+    def __init__(
+        self,
+        tokens: Iterable[TokenState],
+        kinds: Type[IntEnum],
+    ) -> None:
+        self.kinds = kinds
+        self._values = {kind.name: kind.value for kind in kinds}
+        self._tokens: Sequence[TokenState]
+        self._kinds: Sequence[int]
+        self._iterator: Optional[Iterator[TokenState]] = None
+        if isinstance(tokens, TokenBuffer) and tokens.names is kinds:
+            self._tokens, self._kinds = tokens, tokens.kinds
+        elif isinstance(tokens, Sequence):
+            self._tokens = tokens
+            self._kinds = [self._values[token.name] for token in tokens]
+        else:
+            self._tokens, self._kinds = [], []
+            self._iterator = iter(tokens)
+        self._offset = 0
+        self._position = 0
+        self._marks: List[int] = []
+
+    def _fill(self, index: int) -> bool:
+        """Pulls tokens until the given relative index is available."""
+        while len(self._kinds) <= index:
+            if (
+                self._iterator is None
+                or (token := next(self._iterator, None)) is None
+            ):
+                return False
+            self._tokens.append(token)  # type: ignore[attr-defined]
+            self._kinds.append(self._values[token.name])  # type: ignore[attr-defined]
+        return True
+
+    def peek(self, k: int = 0) -> Optional[TokenState]:
+        """Returns the token `k` places after the cursor without moving it."""
+        if (index := self._position - self._offset + k) < len(
+            self._kinds
+        ) or self._fill(index):
+            return self._tokens[index]
+        return None
+
+    def kind(self, k: int = 0) -> Optional[int]:
+        """Returns the kind of the token `k` places after the cursor."""
+        if (index := self._position - self._offset + k) < len(
+            self._kinds
+        ) or self._fill(index):
+            return self._kinds[index]
+        return None
+
+    def advance(self) -> None:
+        """Moves the cursor to the next token."""
+        self._position += 1
+        if (
+            self._iterator is not None
+            and not self._marks
+            and (consumed := self._position - self._offset) >= 1024
+        ):
+            # Dropping in big chunks keeps the cost of each token constant
+            del self._tokens[:consumed]  # type: ignore[attr-defined]
+            del self._kinds[:consumed]  # type: ignore[attr-defined]
+            self._offset = self._position
+        return None
+
+    def mark(self) -> int:
+        """Remembers the position of the cursor to come back to it later."""
+        self._marks.append(self._position)
+        return self._position
+
+    def reset(self, mark: int) -> None:
+        """Moves the cursor back to a marked position and forgets the mark."""
+        self.release(mark)
+        self._position = mark
+        return None
+
+    def release(self, mark: int) -> None:
+        """Forgets a mark without moving the cursor."""
+        self._marks.remove(mark)
+        return None
+
+
 class Parser:
     """A brain that analyzes the grammar of a language.
 
     Attributes:
-        _tokens_state: A list of TokenState objects.
+        kinds: The integer kinds that the tokens are compared by.
+        _tokens: A cursor over the tokens of the code.
         _current_token: It is clear from the name.
         _next_token: Read the previous attribute description.
+        _current_kind: The kind of the current token.
+        _next_kind: The kind of the next token.
     """
 
+    kinds: Type[IntEnum]
+
     def __init__(self) -> None:
-        self._tokens_state = []  # type: ignore[var-annotated]
+        self._tokens = TokenStream([], self.kinds)
         self._current_token = None
         self._next_token = None
+        self._current_kind: Optional[int] = None
+        self._next_kind: Optional[int] = None
 
     def at_end(self) -> bool:
         """Looks at the remaining tokens to check the end."""
-        return (
-            not self._tokens_state
-            and self._current_token is None
-            and self._next_token is None
-        )
+        return self._current_token is None and self._next_token is None
 
-    def advance(self) -> Optional[TokenState]:
-        """Advances to the next token in the tokens state."""
-        return self._tokens_state.pop(0) if self._tokens_state else None
-
-    def expect(self, *args: str) -> None:
-        """Raises if the expectation is not met."""
+    def fail(self, *args: str) -> None:
+        """Raises a syntax error that names the expected tokens."""
         if (args_ := '/'.join(args)) and self._current_token is None:
             raise SyntaxError(f'Expected `{args_}`, but nothing here!')
-        elif self._current_token.name not in args:  # type: ignore[attr-defined]
-            raise SyntaxError(
-                f'Expected `{args_}`, got `{self._current_token.name}`! '  # type: ignore[attr-defined]
-                f'Line {self._current_token.row}, column {self._current_token.column}'
-            )
+        raise SyntaxError(
+            f'Expected `{args_}`, got `{self._current_token.name}`! '  # type: ignore[attr-defined]
+            f'Line {self._current_token.row}, column {self._current_token.column}'  # type: ignore[attr-defined]
+        )
+
+    def expect(self, *args: int) -> None:
+        """Raises if the expectation is not met."""
+        if self._current_kind not in args:
+            self.fail(*(self.kinds(arg).name for arg in args))
         return None
 
-    def check(self, *args: str) -> Optional[bool]:
+    def check(self, *args: int) -> Optional[bool]:
         """Checks whether the current token matches the target or not."""
         return (
-            self._current_token.name in args  # type: ignore[attr-defined]
-            if self._current_token is not None
+            self._current_kind in args
+            if self._current_kind is not None
             else None
         )
 
-    def peek(self, *args: str) -> Optional[bool]:
+    def peek(self, *args: int) -> Optional[bool]:
         """Looks at the next token to match."""
+        return self._next_kind in args if self._next_kind is not None else None
+
+    def check_at(self, k: int, *args: int) -> Optional[bool]:
+        """Matches the token `k` places after the current one."""
         return (
-            self._next_token.name in args  # type: ignore[attr-defined]
-            if self._next_token is not None
-            else None
+            kind in args if (kind := self._tokens.kind(k)) is not None else None
         )
 
+    def _sync(self) -> None:
+        """Reads the current and next tokens from the cursor."""
+        self._current_token = self._tokens.peek()  # type: ignore[assignment]
+        self._current_kind = self._tokens.kind()
+        self._next_token = self._tokens.peek(1)  # type: ignore[assignment]
+        self._next_kind = self._tokens.kind(1)
+        return None
+
     def step(self) -> None:
         """Moves the next and current token values forward."""
-        if (
-            self._tokens_state
-            and self._current_token is None
-            and self._next_token is None
-        ):
-            self._next_token = self.advance()  # type: ignore[assignment]
-        self._current_token = self._next_token
-        self._next_token = self.advance()  # type: ignore[assignment]
+        self._tokens.advance()
+        self._current_token, self._current_kind = (
+            self._next_token,
+            self._next_kind,
+        )
+        self._next_token = self._tokens.peek(1)  # type: ignore[assignment]
+        self._next_kind = self._tokens.kind(1)
+        return None
+
+    def mark(self) -> int:
+        """Remembers the current position for backtracking."""
+        return self._tokens.mark()
+
+    def reset(self, mark: int) -> None:
+        """Backtracks to a marked position."""
+        self._tokens.reset(mark)
+        self._sync()
+        return None
+
+    def start(self, tokens_state: Iterable[TokenState]) -> None:
+        """Puts the cursor at the first token."""
+        self._tokens = TokenStream(tokens_state, self.kinds)
+        self._sync()
+        return None
 
-    def parse(self, tokens_state: List[TokenState]) -> ModuleNode:
+    def parse(self, tokens_state: Iterable[TokenState]) -> ModuleNode:
         """Returns a AST that shows the structure of the code."""
         raise NotImplementedError
@@ -4,11 +4,30 @@
 # https://github.com/sheikhartin/farr
 
 from dataclasses import dataclass, field
-from typing import Optional, Union, Any, List
+from typing import Optional, Union, Any, List, Dict
 
 
 class ASTNode:
-    pass
+    """The base of all nodes.
+
+    The engines keep what they make of a node on the node itself, so it
+    lives exactly as long as the node. Those attributes start with an
+    underscore and are left out when the node is pickled or copied.
+    """
+
+    _constant: Any = None
+    _signature: Any = None
+    _scope: Any = None
+    _closure: Any = None
+    _code: Any = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Returns the fields of the node without what the engines kept."""
+        return {
+            key: value
+            for key, value in self.__dict__.items()
+            if not key.startswith('_')
+        }
 
 
 @dataclass
@@ -71,6 +90,12 @@ class IdentifierNode(HeterogeneousLiteralNode):
     pass
 
 
+@dataclass
+class InterpolatedStringNode(PositionedNode, ExpressionNode):
+    texts: List[str] = field(kw_only=True)
+    interpolations: List[List[ExpressionNode]] = field(kw_only=True)
+
+
 @dataclass
 class RangeNode(ExpressionNode):
     from_: ExpressionNode = field(kw_only=True)
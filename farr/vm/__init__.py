@@ -0,0 +1,598 @@
+# Farr's goal is to give programmers the sense of liberation that comes
+# from the beauty of the code itself, even if it hurts productivity!
+# We understand that beauty is not objective...
+# https://github.com/sheikhartin/farr
+
+import operator
+from typing import (  # type: ignore[attr-defined]
+    types,
+    Optional,
+    Any,
+    Callable,
+    Sequence,
+    Type,
+    List,
+    Tuple,
+    Dict,
+)
+
+from farr.exceptions import (
+    BreakError,
+    ContinueError,
+    ReturnError,
+    InterpretError,
+)
+from farr.parser.nodes import ASTNode, BlockNode
+from farr.interpreter import FarrInterpreter
+from farr.interpreter.base import (
+    UNBOUND,
+    Environment,
+    Frame,
+    TailCall,
+    Interpreter,
+)
+from farr.interpreter.objects import (
+    FarrObject,
+    BooleanObject,
+    StringObject,
+    RangeObject,
+    ListObject,
+    HashMapObject,
+    PairObject,
+    NullObject,
+    NonPythonNativeObject,
+    FunctionDefinitionObject,
+    StructDefinitionObject,
+    StructInstanceObject,
+)
+from farr.compiler import FarrCompiler
+from farr.compiler.base import Opcode, OPERATORS, CodeObject
+
+_BINARY_OPERATORS: Tuple[Callable[[Any, Any], Any], ...] = tuple(
+    {
+        'LeftShift': operator.lshift,
+        'RightShift': operator.rshift,
+        'Add': operator.add,
+        'Subtract': operator.sub,
+        'Multiply': operator.mul,
+        'Divide': operator.truediv,
+        'Modulus': operator.mod,
+        'Power': operator.pow,
+        'EqualEqual': operator.eq,
+        'NotEqual': operator.ne,
+        'LessThan': operator.lt,
+        'GreaterThan': operator.gt,
+        'LessThanOrEqual': operator.le,
+        'GreaterThanOrEqual': operator.ge,
+        'And': lambda x, y: x and y,
+        'Or': lambda x, y: x or y,
+    }[name]
+    for name in OPERATORS
+)
+
+(
+    POP_TOP,
+    DUP_TOP,
+    LOAD_CONST,
+    LOAD_STRING,
+    LOAD_NAME,
+    STORE_NAME,
+    DECLARE_NAME,
+    LOAD_FAST,
+    STORE_FAST,
+    DECLARE_FAST,
+    LOAD_ATTR,
+    LOAD_METHOD,
+    LOAD_INDEX,
+    BINARY_OP,
+    UNARY_NOT,
+    CONTAINS,
+    BUILD_ITEMS,
+    BUILD_LIST,
+    BUILD_HASH_MAP,
+    BUILD_PAIR,
+    BUILD_RANGE,
+    FORMAT_VALUES,
+    BUILD_STRING,
+    JUMP,
+    POP_JUMP_IF_FALSE,
+    POP_JUMP_IF_TRUE,
+    JUMP_IF_FALSE_OR_POP,
+    JUMP_IF_TRUE_OR_POP,
+    GET_ITER,
+    FOR_ITER,
+    STORE_FOR,
+    SETUP_LOOP,
+    POP_BLOCK,
+    BREAK_LOOP,
+    CONTINUE_LOOP,
+    CALL,
+    CALL_WITH_NODE,
+    CALL_METHOD,
+    CALL_METHOD_WITH_NODE,
+    TAIL_CALL,
+    TAIL_CALL_WITH_NODE,
+    MAKE_FUNCTION,
+    RETURN_VALUE,
+    RAISE_RETURN,
+    EVAL,
+) = (int(x) for x in Opcode)
+
+_EXHAUSTED = object()
+
+
+class FarrVirtualMachine(FarrInterpreter):
+    """Runs the bytecode of the nodes instead of walking them.
+
+    Loops and returns are jumps inside a code object. The exceptions of the
+    tree-walker are only raised when they have to leave one, like `break!`
+    in a function that is called from a loop.
+
+    Attributes:
+        stackless: Whether the calls between Farr functions are kept on a
+            stack of the machine instead of the Python stack.
+        _generation: The token that the code objects kept on the nodes
+            must carry to be used by this machine.
+    """
+
+    stackless: bool = False
+    _generation: object = object()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Gives every virtual machine its own code objects."""
+        super().__init_subclass__(**kwargs)
+        cls._generation = object()
+
+    @classmethod
+    def register(
+        cls,
+        node_type: Type[ASTNode],
+        handler: Callable[[Any, Any], Any],
+    ) -> None:
+        """Registers the handler and forgets the code compiled without it."""
+        super().register(node_type, handler)
+        for interpreter in cls._family():
+            interpreter._generation = object()  # type: ignore[attr-defined]
+        return None
+
+    def _compile(self, node: ASTNode, function: bool = False) -> CodeObject:
+        """Returns the code object of a node and compiles it if needed."""
+        body = node.body if isinstance(node, BlockNode) else None
+        if (
+            (compiled := node._code) is not None
+            and compiled[0] is self._generation
+            and compiled[1] is function
+            # Member functions are appended to the bodies of structs later
+            and compiled[3] is body
+            and compiled[4] == (len(body) if body is not None else 0)
+        ):
+            return compiled[2]
+        code = FarrCompiler(
+            fallbacks=(
+                x
+                for interpreter in self.__class__.__mro__
+                for x in vars(interpreter).get('_registered', {})
+            )
+        ).compile(
+            node,
+            name=node.__class__.__name__,
+            function=function,
+            scope=node._scope if function else None,
+        )
+        node._code = (
+            self._generation,
+            function,
+            code,
+            body,
+            len(body) if body is not None else 0,
+        )
+        return code
+
+    def _interpret(self, node: ASTNode) -> Any:
+        """Runs the code object of the node."""
+        return self._run(self._compile(node))
+
+    def _execute_body(self, body: BlockNode) -> Optional[FarrObject]:
+        """Runs a body as a function that may return a value."""
+        return self._run(self._compile(body, function=True))
+
+    def _run(self, code: CodeObject) -> Any:
+        """Executes the instructions of a code object.
+
+        In the stackless mode a call to a Farr function saves the running
+        code on `calls` and continues with the body of the function in the
+        same loop, so the depth of recursion is only limited by memory.
+        """
+        instructions, constants, names, layout, varnames = self._unpack(code)
+        stack: List[Any] = []
+        push, pop = stack.append, stack.pop
+        blocks: List[Tuple[int, int, int]] = []
+        ip = 0
+        calls: List[Tuple[Any, ...]] = []
+        invoke: Optional[NonPythonNativeObject] = None
+        environment_backup: Optional[Environment] = None
+        entering: Optional[Tuple[NonPythonNativeObject, Environment]] = None
+        while True:
+            try:
+                while True:
+                    opcode, arg = instructions[ip]
+                    ip += 1
+                    if opcode == LOAD_FAST:
+                        if (
+                            isinstance(environment := self.environment, Frame)
+                            and environment.layout is layout
+                            and (value := environment.slots[arg]) is not UNBOUND
+                            and value is not None
+                        ):
+                            push(value)
+                        else:
+                            push(environment.locate(varnames[arg]))
+                    elif opcode == LOAD_NAME:
+                        push(self.environment.locate(names[arg]))
+                    elif opcode == LOAD_CONST:
+                        push(constants[arg])
+                    elif opcode == BINARY_OP:
+                        right = pop()
+                        push(_BINARY_OPERATORS[arg](pop(), right))
+                    elif opcode == POP_TOP:
+                        pop()
+                    elif opcode == STORE_FAST:
+                        if (
+                            isinstance(environment := self.environment, Frame)
+                            and environment.layout is layout
+                            and environment.slots[arg] is not UNBOUND
+                        ):
+                            environment.slots[arg] = pop()
+                        else:
+                            environment.replace(varnames[arg], pop())
+                    elif opcode == STORE_NAME:
+                        self.environment.replace(names[arg], pop())
+                    elif opcode == POP_JUMP_IF_FALSE:
+                        if not pop():
+                            ip = arg
+                    elif opcode == JUMP:
+                        ip = arg
+                    elif opcode == FOR_ITER:
+                        if (value := next(stack[-1], _EXHAUSTED)) is _EXHAUSTED:
+                            pop()
+                            ip = arg
+                        else:
+                            push(value)
+                    elif opcode == STORE_FOR:
+                        value, environment = pop(), self.environment
+                        for name, item in zip(
+                            constants[arg],
+                            value if isinstance(value, Sequence) else (value,),
+                        ):
+                            environment.assign(name, item)
+                    elif opcode == DECLARE_FAST:
+                        if (
+                            isinstance(environment := self.environment, Frame)
+                            and environment.layout is layout
+                        ):
+                            environment.slots[arg] = pop()
+                        else:
+                            environment.assign(varnames[arg], pop())
+                    elif opcode == DECLARE_NAME:
+                        self.environment.assign(names[arg], pop())
+                    elif opcode == CALL:
+                        args = stack[len(stack) - arg :]
+                        del stack[len(stack) - arg :]
+                        if isinstance(callee := pop(), NonPythonNativeObject):
+                            if self.stackless:
+                                entering = callee, self._prepare(callee, args)
+                                break
+                            push(
+                                self._invoke_non_python_native_object(
+                                    callee, args
+                                )
+                            )
+                        else:
+                            push(callee(*args))
+                    elif opcode == TAIL_CALL:
+                        args = stack[len(stack) - arg :]
+                        del stack[len(stack) - arg :]
+                        if isinstance(callee := pop(), NonPythonNativeObject):
+                            if self.stackless and not self._leaves_tail_calls():
+                                entering = callee, self._prepare(callee, args)
+                                break
+                            push(self._tail_call(callee, args))
+                        else:
+                            push(callee(*args))
+                    elif opcode == LOAD_STRING:
+                        push(StringObject(value=constants[arg]))
+                    elif opcode == DUP_TOP:
+                        push(stack[-1])
+                    elif opcode == LOAD_ATTR:
+                        push(self._load_attribute(pop(), names[arg]))
+                    elif opcode == LOAD_METHOD:
+                        if isinstance(
+                            method := getattr(result := pop(), names[arg]),
+                            NonPythonNativeObject,
+                        ):
+                            method.environment = result.environment
+                        push(method)
+                    elif opcode == CALL_METHOD:
+                        args = stack[len(stack) - arg :]
+                        del stack[len(stack) - arg :]
+                        if isinstance(method := pop(), types.MethodType):
+                            push(method(*args))
+                        elif self.stackless:
+                            entering = method, self._prepare(method, args)
+                            break
+                        else:
+                            push(
+                                self._invoke_non_python_native_object(
+                                    method, args
+                                )
+                            )
+                    elif opcode == LOAD_INDEX:
+                        index = pop()
+                        push(pop()[index])
+                    elif opcode == UNARY_NOT:
+                        push(BooleanObject(value=not pop()))
+                    elif opcode == POP_JUMP_IF_TRUE:
+                        if pop():
+                            ip = arg
+                    elif opcode == JUMP_IF_FALSE_OR_POP:
+                        if not stack[-1]:
+                            ip = arg
+                        else:
+                            pop()
+                    elif opcode == JUMP_IF_TRUE_OR_POP:
+                        if stack[-1]:
+                            ip = arg
+                        else:
+                            pop()
+                    elif opcode == GET_ITER:
+                        push(iter(pop()))
+                    elif opcode == SETUP_LOOP:
+                        blocks.append((arg, ip, len(stack)))
+                    elif opcode == POP_BLOCK:
+                        blocks.pop()
+                    elif opcode == BREAK_LOOP:
+                        if not blocks:
+                            raise BreakError(
+                                'If there was a loop, it was broken!'
+                            )
+                        ip, _, depth = blocks[-1]
+                        del stack[depth:]
+                    elif opcode == CONTINUE_LOOP:
+                        if not blocks:
+                            raise ContinueError(
+                                'If you can go to the next round!'
+                            )
+                        _, ip, depth = blocks[-1]
+                        del stack[depth:]
+                    elif opcode == RETURN_VALUE:
+                        if not calls:
+                            return pop()
+                        result = pop()
+                        break
+                    elif opcode == RAISE_RETURN:
+                        raise ReturnError(expression=pop())
+                    elif opcode == BUILD_ITEMS:
+                        push(self._collect(stack, arg))
+                    elif opcode == BUILD_LIST:
+                        push(ListObject(elements=self._collect(stack, arg)))
+                    elif opcode == BUILD_HASH_MAP:
+                        push(HashMapObject(pairs=self._collect(stack, arg)))  # type: ignore[arg-type]
+                    elif opcode == BUILD_PAIR:
+                        value = pop()
+                        push(PairObject(key=pop(), value=value))
+                    elif opcode == BUILD_RANGE:
+                        by = pop() if arg & 2 else None
+                        to = pop() if arg & 1 else None
+                        push(RangeObject(from_=pop(), to=to, by=by))
+                    elif opcode == FORMAT_VALUES:
+                        values = stack[len(stack) - arg :]
+                        del stack[len(stack) - arg :]
+                        push(' '.join(map(str, values)))
+                    elif opcode == BUILD_STRING:
+                        parts = stack[len(stack) - arg :]
+                        del stack[len(stack) - arg :]
+                        push(StringObject(value=''.join(parts)))
+                    elif opcode == CONTAINS:
+                        container = pop()
+                        push(pop() in container)
+                    elif opcode == CALL_WITH_NODE:
+                        if isinstance(callee := pop(), NonPythonNativeObject):
+                            if self.stackless:
+                                entering = callee, self._prepare(
+                                    callee,
+                                    *self._evaluate_arguments(constants[arg]),
+                                )
+                                break
+                            push(
+                                self._call_non_python_native_object(
+                                    callee, constants[arg]
+                                )
+                            )
+                        else:
+                            push(
+                                self._call_python_native_object(
+                                    callee, constants[arg]
+                                )
+                            )
+                    elif opcode == CALL_METHOD_WITH_NODE:
+                        if isinstance(method := pop(), types.MethodType):
+                            push(
+                                self._call_python_native_object(
+                                    method, constants[arg]
+                                )
+                            )
+                        elif self.stackless:
+                            entering = method, self._prepare(
+                                method,
+                                *self._evaluate_arguments(constants[arg]),
+                            )
+                            break
+                        else:
+                            push(
+                                self._call_non_python_native_object(
+                                    method, constants[arg]
+                                )
+                            )
+                    elif opcode == TAIL_CALL_WITH_NODE:
+                        if isinstance(callee := pop(), NonPythonNativeObject):
+                            if self.stackless and not self._leaves_tail_calls():
+                                entering = callee, self._prepare(
+                                    callee,
+                                    *self._evaluate_arguments(constants[arg]),
+                                )
+                                break
+                            push(
+                                self._call_non_python_native_object(
+                                    callee, constants[arg], True
+                                )
+                            )
+                        else:
+                            push(
+                                self._call_python_native_object(
+                                    callee, constants[arg]
+                                )
+                            )
+                    elif opcode == MAKE_FUNCTION:
+                        self._signature(constants[arg].params)
+                        push(
+                            FunctionDefinitionObject(
+                                body=constants[arg].body,
+                                params=constants[arg].params,
+                            )
+                        )
+                    elif opcode == EVAL:
+                        push(
+                            self._settle(
+                                Interpreter._interpret(self, constants[arg])
+                            )
+                        )
+                    else:
+                        raise SystemError(f'Unknown opcode `{opcode}`!')
+            except BaseException as e:
+                error = (
+                    e
+                    if isinstance(
+                        e,
+                        (
+                            BreakError,
+                            ContinueError,
+                            ReturnError,
+                            InterpretError,
+                        ),
+                    )
+                    else InterpretError(error=e, origin=code.nodes[ip - 1])
+                )
+                # Unwinds the saved calls until one of them handles the error
+                while True:
+                    if (
+                        isinstance(error, (BreakError, ContinueError))
+                        and blocks
+                    ):
+                        break_, continue_, depth = blocks[-1]
+                        del stack[depth:]
+                        ip = (
+                            break_
+                            if isinstance(error, BreakError)
+                            else continue_
+                        )
+                        break
+                    elif isinstance(error, ReturnError) and code.function:
+                        if not calls:
+                            return error.expression
+                        result = error.expression
+                        break
+                    elif isinstance(error, InterpretError):
+                        error.passed(code.nodes[ip - 1])
+                    if not calls:
+                        raise error
+                    if isinstance(error, InterpretError):
+                        error.leave()
+                    self.environment = environment_backup  # type: ignore
+                    (
+                        code,
+                        stack,
+                        blocks,
+                        ip,
+                        invoke,
+                        environment_backup,
+                    ) = calls.pop()
+                    (
+                        instructions,
+                        constants,
+                        names,
+                        layout,
+                        varnames,
+                    ) = self._unpack(code)
+                    push, pop = stack.append, stack.pop
+                if not isinstance(error, ReturnError):
+                    continue
+            if entering is not None:
+                calls.append(
+                    (code, stack, blocks, ip, invoke, environment_backup)
+                )
+                (invoke, self.environment), environment_backup = (
+                    entering,
+                    self.environment,
+                )
+                entering = None
+            elif isinstance(result, TailCall):
+                invoke, self.environment = result.invoke, result.environment
+            else:
+                if result is None:
+                    result = (
+                        StructInstanceObject(
+                            environment=self.environment.copy()
+                        )
+                        if isinstance(invoke, StructDefinitionObject)
+                        else NullObject()
+                    )
+                self.environment = environment_backup  # type: ignore
+                code, stack, blocks, ip, invoke, environment_backup = (
+                    calls.pop()
+                )
+                instructions, constants, names, layout, varnames = (
+                    self._unpack(code)
+                )
+                push, pop = stack.append, stack.pop
+                push(result)
+                continue
+            code = self._compile(
+                invoke.body, function=True  # type: ignore[union-attr]
+            )
+            instructions, constants, names, layout, varnames = self._unpack(
+                code
+            )
+            stack, blocks, ip = [], [], 0
+            push, pop = stack.append, stack.pop
+
+    @staticmethod
+    def _unpack(
+        code: CodeObject,
+    ) -> Tuple[
+        List[Tuple[int, int]],
+        List[Any],
+        List[str],
+        Optional[Dict[str, int]],
+        List[str],
+    ]:
+        """Returns what the instructions of a code object refer to."""
+        return (
+            code.instructions,
+            code.constants,
+            code.names,
+            code.layout,
+            code.varnames,
+        )
+
+    @staticmethod
+    def _collect(stack: List[Any], count: int) -> List[Any]:
+        """Pops the values of some items and drops the missing ones."""
+        items = [x for x in stack[len(stack) - count :] if x is not None]
+        del stack[len(stack) - count :]
+        return items
+
+
+class StacklessVirtualMachine(FarrVirtualMachine):
+    """Runs the calls between Farr functions without nesting Python frames."""
+
+    stackless = True
@@ -3,11 +3,25 @@
 # We understand that beauty is not objective...
 # https://github.com/sheikhartin/farr
 
+import textwrap
+from typing import Callable, Type, Sequence
+
 import pytest
 
 from farr.lexer import FarrRegexLexer
 from farr.parser import FarrParser
+from farr.parser.nodes import ModuleNode
 from farr.interpreter import FarrInterpreter
+from farr.interpreter.closures import ClosureInterpreter
+from farr.interpreter.python import PythonInterpreter
+from farr.vm import FarrVirtualMachine
+
+ENGINES = (
+    FarrInterpreter,
+    ClosureInterpreter,
+    FarrVirtualMachine,
+    PythonInterpreter,
+)
 
 
 @pytest.fixture(scope='session')
@@ -26,3 +40,27 @@ def farr_parser_fixture() -> FarrParser:
 def farr_interpreter_fixture() -> FarrInterpreter:
     """Returns an instance of `FarrInterpreter`."""
     return FarrInterpreter()
+
+
+@pytest.fixture
+def farr_engines_fixture(
+    farr_regex_lexer_fixture: FarrRegexLexer,
+    farr_parser_fixture: FarrParser,
+    capsys: pytest.CaptureFixture,
+) -> Callable[..., ModuleNode]:
+    """Returns a runner that checks what every engine prints for a program."""
+
+    def run(
+        code: str,
+        expected: str,
+        engines: Sequence[Type[FarrInterpreter]] = ENGINES,
+    ) -> ModuleNode:
+        module = farr_parser_fixture.parse(
+            farr_regex_lexer_fixture.tokenize(textwrap.dedent(code))
+        )
+        for interpreter in engines:
+            interpreter().interpret(module)
+            assert capsys.readouterr().out == expected, interpreter.__name__
+        return module
+
+    return run
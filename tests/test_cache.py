@@ -0,0 +1,89 @@
+# Farr's goal is to give programmers the sense of liberation that comes
+# from the beauty of the code itself, even if it hurts productivity!
+# We understand that beauty is not objective...
+# https://github.com/sheikhartin/farr
+
+import shutil
+import pathlib
+from importlib.util import MAGIC_NUMBER
+
+import pytest
+
+import farr
+from farr.cache import (
+    cache_path,
+    code_path,
+    compiler_stamp,
+    load_module,
+    load_code,
+)
+from farr.constants import CACHE_DISABLER
+from farr.parser import FarrParser
+from farr.parser.nodes import ModuleNode, StringNode
+
+
+def test_syntax_tree_caching(
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Loads a module from the cache until its source changes."""
+    monkeypatch.delenv(CACHE_DISABLER, raising=False)
+    (filepath := tmp_path / 'hi.farr').write_text('"Hi!";')
+    module = load_module(filepath)
+    assert cache_path(filepath).is_file()
+
+    with monkeypatch.context() as m:
+        m.setattr(FarrParser, 'parse', pytest.fail)
+        assert load_module(filepath) == module
+
+    filepath.write_text('"Bye!";')
+    assert load_module(filepath) == ModuleNode(
+        body=[StringNode(row=1, column=1, value='"Bye!"')]
+    )
+
+
+def test_disabled_cache(
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Parses again without writing anything when the cache is off."""
+    monkeypatch.setenv(CACHE_DISABLER, '1')
+    (filepath := tmp_path / 'hi.farr').write_text('"Hi!";')
+    load_module(filepath)
+    assert not cache_path(filepath).parent.exists()
+
+    # Said explicitly, it wins over the environment either way
+    monkeypatch.delenv(CACHE_DISABLER)
+    load_module(filepath, cache=False)
+    assert not cache_path(filepath).parent.exists()
+    monkeypatch.setenv(CACHE_DISABLER, '1')
+    load_module(filepath, cache=True)
+    assert cache_path(filepath).exists()
+
+
+def test_python_translation_caching(
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Keeps the translation of a module as a `.pyc` until its source changes."""
+    monkeypatch.delenv(CACHE_DISABLER, raising=False)
+    (filepath := tmp_path / 'hi.farr').write_text('"Hi!";')
+    code = load_code(filepath, lambda: compile('1', 'hi', 'eval'))
+    assert code_path(filepath).read_bytes()[:4] == MAGIC_NUMBER
+    assert load_code(filepath, pytest.fail) == code
+
+    filepath.write_text('"Bye!";')
+    assert eval(load_code(filepath, lambda: compile('2', 'hi', 'eval'))) == 2
+
+
+def test_compiler_stamp(
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Changes with the helpers that the parser unescapes strings with."""
+    root = tmp_path / 'farr'
+    shutil.copytree(pathlib.Path(farr.__file__).parent, root)
+    monkeypatch.setattr(farr, '__file__', str(root / '__init__.py'))
+    stamp = compiler_stamp.__wrapped__()
+    (helpers := root / 'helpers.py').write_text(helpers.read_text() + '\n')
+    assert compiler_stamp.__wrapped__() != stamp
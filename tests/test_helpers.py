@@ -3,11 +3,16 @@
 # We understand that beauty is not objective...
 # https://github.com/sheikhartin/farr
 
-from typing import Callable, Sequence, Any, List, Tuple
+from typing import Optional, Callable, Sequence, Any, List, Tuple
 
 import pytest
 
-from farr.helpers import partition_a_sequence, normalize_identifier
+from farr.helpers import (
+    partition_a_sequence,
+    normalize_identifier,
+    split_interpolations,
+    plain_string,
+)
 
 
 @pytest.mark.parametrize(
@@ -37,3 +42,21 @@ def test_partition_a_sequence(
 def test_normalize_identifier(identifier: str, expected: str) -> None:
     """Tests the normalized output of an identifier."""
     assert normalize_identifier(identifier) == expected
+
+
+@pytest.mark.parametrize(
+    ('value', 'parts', 'text'),
+    [
+        ('"Hi!"', ['Hi!'], 'Hi!'),
+        ('"a ${x} b${+ 1 2}"', ['a ', 'x', ' b', '+ 1 2', ''], None),
+        ('"\\${x}\\n"', ['\\${x}\n'], '\\${x}\n'),
+    ],
+)
+def test_split_interpolations(
+    value: str,
+    parts: List[str],
+    text: Optional[str],
+) -> None:
+    """Tests the texts and interpolations of a string literal."""
+    assert split_interpolations(value) == parts
+    assert plain_string(value) == text
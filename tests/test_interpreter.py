@@ -3,13 +3,31 @@
 # We understand that beauty is not objective...
 # https://github.com/sheikhartin/farr
 
+import pathlib
+import pickle
 import textwrap
+from typing import Callable
 
 import pytest
 
+from farr.constants import RESOURCES_ROOT_PATH
+from farr.exceptions import InterpretError
 from farr.lexer import FarrRegexLexer
 from farr.parser import FarrParser
+from farr.parser.nodes import (
+    ModuleNode,
+    StringNode,
+    InterpolatedStringNode,
+    FunctionDefinitionNode,
+)
 from farr.interpreter import FarrInterpreter
+from farr.interpreter.closures import ClosureInterpreter
+from farr.interpreter.python import PythonInterpreter
+from farr.compiler import FarrCompiler, disassemble
+from farr.vm import FarrVirtualMachine, StacklessVirtualMachine
+from farr.interpreter.objects import StringObject
+from farr.interpreter.registry import modules
+from farr.interpreter.resolver import Resolver, sign
 
 
 def test_binary_operations_interpretation(
@@ -260,3 +278,568 @@ def test_import_system_interpretation(
         true true false
         """
     )
+
+
+def test_module_registry_interpretation(
+    farr_regex_lexer_fixture: FarrRegexLexer,
+    farr_parser_fixture: FarrParser,
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture,
+) -> None:
+    """Loads a diamond import once and stops a circular one."""
+    monkeypatch.setenv(RESOURCES_ROOT_PATH, str(tmp_path))
+    (libs := tmp_path / 'libs').mkdir()
+    (libs / 'counter.farr').write_text('println("loaded");')
+    (libs / 'left.farr').write_text('use counter;')
+    (libs / 'right.farr').write_text('use counter;')
+    (libs / 'ping.farr').write_text('use pong;')
+    (libs / 'pong.farr').write_text('use ping;')
+
+    FarrInterpreter().interpret(
+        farr_parser_fixture.parse(
+            farr_regex_lexer_fixture.tokenize('use left; use right;')
+        )
+    )
+    assert capsys.readouterr().out == 'loaded\n'
+    assert libs / 'counter.farr' in modules
+
+    with pytest.raises(InterpretError) as e:
+        FarrInterpreter()._interpret(
+            farr_parser_fixture.parse(
+                farr_regex_lexer_fixture.tokenize('use ping;')
+            )
+        )
+    assert isinstance(e.value.error, ImportError)
+    modules.invalidate(libs / 'counter.farr')
+    assert libs / 'counter.farr' not in modules
+
+
+def test_registered_handler_interpretation(
+    farr_regex_lexer_fixture: FarrRegexLexer,
+    farr_parser_fixture: FarrParser,
+    capsys: pytest.CaptureFixture,
+) -> None:
+    """Overrides the handler of a node type in a subclass."""
+
+    class ShoutingInterpreter(FarrInterpreter):
+        pass
+
+    ShoutingInterpreter.register(
+        StringNode,
+        lambda self, node: StringObject(value=node.value.strip('"').upper()),
+    )
+    module = farr_parser_fixture.parse(
+        farr_regex_lexer_fixture.tokenize('println("Hi!");')
+    )
+    ShoutingInterpreter().interpret(module)
+    FarrInterpreter().interpret(module)
+    assert capsys.readouterr().out == 'HI!\nHi!\n'
+
+
+def test_closure_engine_interpretation(
+    farr_regex_lexer_fixture: FarrRegexLexer,
+    farr_parser_fixture: FarrParser,
+    capsys: pytest.CaptureFixture,
+) -> None:
+    """Compares the output of the closure engine with the tree-walker."""
+    module = farr_parser_fixture.parse(
+        farr_regex_lexer_fixture.tokenize(
+            textwrap.dedent(
+                """
+                fn fib(let n) = {
+                  if n <= 1 = { return! n; }
+                  return! + fib(- n 1) fib(- n 2);
+                }
+
+                let total = 0;
+                for let i in [1..20] = {
+                  if ((% i 3) == 0) = { continue!; }
+                  total += i;
+                  if i > 15 = { break!; }
+                }
+                let j = 0;
+                while j < 3 = { j++; } else = { println("done ${j}"); }
+                println(fib(10), total, "${total} and ${+ j 1}", 5 && 0);
+                try = { println(nothing); } catch NameError = {
+                  println("caught");
+                }
+                """
+            )
+        )
+    )
+    FarrInterpreter().interpret(module)
+    expected = capsys.readouterr().out
+    ClosureInterpreter().interpret(module)
+    assert (
+        capsys.readouterr().out
+        == expected
+        == 'done 3\n55 91 91 and 4 0\ncaught\n'
+    )
+    copied = pickle.loads(pickle.dumps(module))
+    assert module.body[0]._closure is not None
+    assert copied.body[0]._closure is None
+    ClosureInterpreter().interpret(copied)
+    assert capsys.readouterr().out == expected
+
+
+def test_virtual_machine_interpretation(
+    farr_regex_lexer_fixture: FarrRegexLexer,
+    farr_parser_fixture: FarrParser,
+    capsys: pytest.CaptureFixture,
+) -> None:
+    """Runs the bytecode of a program and checks its disassembly."""
+    module = farr_parser_fixture.parse(
+        farr_regex_lexer_fixture.tokenize(
+            textwrap.dedent(
+                """
+                fn stop(let i) = {
+                  if i > 2 = { break!; }
+                  return! * i 10;
+                }
+
+                let found = {};
+                for let i in [1..5] = {
+                  found.iappend!(stop(i));
+                  match i = {
+                    for (1, 4) = { println("one or four"); }
+                    else = { println("${i}?"); }
+                  }
+                }
+                println(found.length, found.[2], 3 if false else 4);
+                """
+            )
+        )
+    )
+    FarrInterpreter().interpret(module)
+    expected = capsys.readouterr().out
+    FarrVirtualMachine().interpret(module)
+    assert capsys.readouterr().out == expected == 'one or four\n2?\n2 20 4\n'
+    disassembly = disassemble(FarrCompiler().compile(module))
+    assert 'FOR_ITER' in disassembly and 'Disassembly of stop:' in disassembly
+
+
+def test_python_engine_interpretation(
+    farr_regex_lexer_fixture: FarrRegexLexer,
+    farr_parser_fixture: FarrParser,
+    capsys: pytest.CaptureFixture,
+) -> None:
+    """Runs the Python translation and points its errors at the nodes."""
+    module = farr_parser_fixture.parse(
+        farr_regex_lexer_fixture.tokenize(
+            textwrap.dedent(
+                """
+                fn stop(let i) = {
+                  if i > 2 = { break!; }
+                  return! * i 10;
+                }
+
+                let found = {};
+                for let i in [1..5] = {
+                  found.iappend!(stop(i));
+                } else = { println("never"); }
+                println(found.length, "${found.[2]}!", 3 if false else 4);
+                """
+            )
+        )
+    )
+    FarrInterpreter().interpret(module)
+    expected = capsys.readouterr().out
+    PythonInterpreter().interpret(module)
+    assert capsys.readouterr().out == expected == '2 20! 4\n'
+
+    with pytest.raises(InterpretError) as e:
+        PythonInterpreter()._interpret(
+            farr_parser_fixture.parse(
+                farr_regex_lexer_fixture.tokenize('let x = 1;\nprintln(+ x y);')
+            )
+        )
+    assert isinstance(e.value.error, NameError)
+    assert e.value.location == (2, 13)
+
+
+def test_frame_interpretation(
+    farr_engines_fixture: Callable[..., ModuleNode],
+) -> None:
+    """Keeps the locals in slots and still finds the names of the callers."""
+    module = farr_engines_fixture(
+        """
+        let total = 0;
+        fn peek() = { return! + secret total; }
+        fn bump(let n) = {
+          let secret = * n 10;
+          try = { / n 0; } catch ArithmeticError e = {
+            let secret = 1;
+            total += n;
+          }
+          return! peek();
+        }
+        println(bump(2), bump(3), total);
+        """,
+        '22 35 5\n',
+        (FarrInterpreter, FarrVirtualMachine),
+    )
+    bump = next(
+        x
+        for x in module.body
+        if isinstance(x, FunctionDefinitionNode)
+        and x.identifier.value == 'bump'
+    )
+    scope = Resolver().resolve(bump.params, bump.body)  # type: ignore[arg-type]
+    assert list(scope.names) == ['n', 'secret']
+    assert 'e' not in scope.names and (1, 0) in scope.addresses.values()
+
+
+def test_error_call_stack_interpretation(
+    farr_regex_lexer_fixture: FarrRegexLexer,
+    farr_parser_fixture: FarrParser,
+) -> None:
+    """Keeps the node of an error and the calls it comes out of."""
+    module = farr_parser_fixture.parse(
+        farr_regex_lexer_fixture.tokenize(
+            textwrap.dedent(
+                """
+                fn inner(let a) = { return! / a 0; }
+                fn outer(let b) = {
+                  try = { inner(b); } catch ArithmeticError = { let caught = true; }
+                  return! inner(b);
+                }
+                println(outer(1));
+                """
+            )
+        )
+    )
+    for interpreter in (
+        FarrInterpreter,
+        ClosureInterpreter,
+        FarrVirtualMachine,
+        StacklessVirtualMachine,
+    ):
+        with pytest.raises(InterpretError) as e:
+            interpreter()._interpret(module)
+        assert isinstance(e.value.error, ZeroDivisionError)
+        assert e.value.location == (2, 29)
+        assert e.value.traceback == [(7, 9)]
+        with pytest.raises(InterpretError) as e:
+            interpreter(tail_calls=False)._interpret(module)
+        assert e.value.traceback == [(5, 11), (7, 9)]
+
+
+def test_completion_interpretation(
+    farr_engines_fixture: Callable[..., ModuleNode],
+) -> None:
+    """Leaves loops and functions through completions and their errors."""
+    farr_engines_fixture(
+        """
+        fn stop(let i) = { if i > 2 = { break!; } return! i; }
+        fn find(let t) = {
+          for let x in [1..5] = {
+            try = { / x - x t; } catch ArithmeticError = {
+              return! * x 10;
+            }
+          }
+        }
+        let seen = {};
+        for let i in [1..5] = { seen.iappend!(stop(i)); }
+        println(seen, find(3));
+        """,
+        '1; 2 30\n',
+        (FarrInterpreter, PythonInterpreter),
+    )
+
+
+def test_signature_interpretation(
+    farr_regex_lexer_fixture: FarrRegexLexer,
+    farr_parser_fixture: FarrParser,
+    capsys: pytest.CaptureFixture,
+    farr_engines_fixture: Callable[..., ModuleNode],
+) -> None:
+    """Binds the arguments with the plan of the parameters."""
+    module = farr_engines_fixture(
+        """
+        fn f(let a, let b = a, let rest...) = {
+          return! "${a} ${b} ${rest}";
+        }
+        let xs = {1, 2, 3};
+        println(f(1), f(1, b = 2), f(...xs), xs);
+        """,
+        '1 null  1 2  1 null 2; 3 1; 2; 3\n',
+        (FarrInterpreter, FarrVirtualMachine),
+    )
+    signature = sign(module.body[0].params)  # type: ignore[union-attr]
+    assert signature.required == ['a'] and signature.variadic == ['rest']
+    assert signature.optional == {'b'} and signature.names == {'a', 'b', 'rest'}
+    assert signature.positional == [0] and signature.keywords == {'b': 1}
+    assert signature.rest == 2 and len(signature.slots) == 3
+    module = farr_parser_fixture.parse(
+        farr_regex_lexer_fixture.tokenize(
+            'fn f(let a..., let b...) = { pass; }\nprintln(1);\n'
+        )
+    )
+    for interpreter in (FarrInterpreter, FarrVirtualMachine):
+        with pytest.raises(InterpretError) as e:
+            interpreter()._interpret(module)
+        assert isinstance(e.value.error, TypeError)
+        assert capsys.readouterr().out == ''
+
+
+def test_tail_call_interpretation(
+    farr_engines_fixture: Callable[..., ModuleNode],
+) -> None:
+    """Runs calls in tail position without growing the Python stack."""
+    module = farr_engines_fixture(
+        """
+        fn count(let n, let acc = 0) = {
+          if n == 0 = { return! acc; }
+          return! count(- n 1, acc = + acc 1);
+        }
+        fn even?(let n) = { if n == 0 = { return! true; } return! odd?(- n 1); }
+        fn odd?(let n) = { if n == 0 = { return! false; } return! even?(- n 1); }
+        println(count(5000), even?(5001));
+        """,
+        '5000 false\n',
+        (
+            FarrInterpreter,
+            ClosureInterpreter,
+            FarrVirtualMachine,
+            StacklessVirtualMachine,
+            PythonInterpreter,
+        ),
+    )
+    with pytest.raises(InterpretError) as e:
+        FarrInterpreter(tail_calls=False)._interpret(module)
+    assert isinstance(e.value.error, RecursionError)
+
+
+def test_stackless_interpretation(
+    farr_regex_lexer_fixture: FarrRegexLexer,
+    farr_parser_fixture: FarrParser,
+    capsys: pytest.CaptureFixture,
+) -> None:
+    """Keeps the calls between Farr functions off the Python stack."""
+    module = farr_parser_fixture.parse(
+        farr_regex_lexer_fixture.tokenize(
+            textwrap.dedent(
+                """
+                fn depth(let n) = {
+                  if n == 0 = { return! 0; }
+                  return! + depth(- n 1) 1;
+                }
+                fn stop(let i) = { if i > 2 = { break!; } return! i; }
+                struct Point = { let x, let y }
+                let seen = {};
+                for let i in [1..5] = { seen.iappend!(stop(i)); }
+                println(depth(5000), seen, Point(1, 2).y);
+                """
+            )
+        )
+    )
+    StacklessVirtualMachine().interpret(module)
+    assert capsys.readouterr().out == '5000 1; 2 2\n'
+    with pytest.raises(InterpretError) as e:
+        FarrVirtualMachine()._interpret(module)
+    assert isinstance(e.value.error, RecursionError)
+
+
+def test_short_circuit_interpretation(
+    farr_engines_fixture: Callable[..., ModuleNode],
+) -> None:
+    """Skips the right side when the left one decides the result."""
+    farr_engines_fixture(
+        """
+        let xs = {1, 2, 3};
+        let i = 5;
+        println((i <= 3) && (xs.[i] > 0), (i > 3) || (xs.[i] > 0));
+        println(1 && 2, 0 || null, 0 && xs.[i]);
+        """,
+        'false true\n2 null 0\n',
+    )
+
+
+def test_range_loop_interpretation(
+    farr_engines_fixture: Callable[..., ModuleNode],
+) -> None:
+    """Counts through integer ranges and unpacks the other rounds."""
+    farr_engines_fixture(
+        """
+        fn total(let n) = {
+          let s = 0;
+          for let i in [1, 3..n] = { s += i; }
+          for let j in [5..1] = { s += 1000; }
+          return! s;
+        }
+        let seen = {};
+        for let x in [0.5..2] = { seen.iappend!(x); }
+        for (let k, let v) in {:1 2, :3 4} = { seen.iappend!(+ k v); }
+        println(total(10), seen);
+        """,
+        '22 0.5; 1.5; 3; 7\n',
+    )
+
+
+def test_single_loop_variable_interpretation(
+    farr_engines_fixture: Callable[..., ModuleNode],
+) -> None:
+    """Unpacks the pairs of a hash map but not the lists of a list."""
+    farr_engines_fixture(
+        """
+        for let k in {:1 2, :3 4} = { println(k, typeof?(k)); }
+        fn firsts(let pairs) = {
+          let seen = {};
+          for let x in pairs = { seen.iappend!(x); }
+          return! seen;
+        }
+        let pairs = {};
+        pairs.iappend!({5, 6});
+        pairs.iappend!({7, 8});
+        println(firsts(pairs), firsts({:"a" 1}), pairs.[1].length);
+        """,
+        '1 IntegerObject\n3 IntegerObject\n5; 6; 7; 8 a 2\n',
+    )
+
+
+def test_constant_pool_interpretation(
+    farr_regex_lexer_fixture: FarrRegexLexer,
+    farr_parser_fixture: FarrParser,
+    capsys: pytest.CaptureFixture,
+) -> None:
+    """Converts every literal once and keeps strings apart."""
+    module = farr_parser_fixture.parse(
+        farr_regex_lexer_fixture.tokenize(
+            textwrap.dedent(
+                """
+                let total = 0;
+                let text = "";
+                for let i in [1..3] = {
+                  total += + 0b10 1.5;
+                  text = text.concat("${i}\\t");
+                }
+                println(total, text);
+                """
+            )
+        )
+    )
+    interpreter = FarrInterpreter()
+    interpreter.interpret(module)
+    assert capsys.readouterr().out == '10.5 1\t2\t3\t\n'
+    number, string = farr_parser_fixture.parse(
+        farr_regex_lexer_fixture.tokenize('0b10; "a";')
+    ).body
+    assert interpreter._interpret(number) is FarrInterpreter()._interpret(
+        number
+    )
+    assert interpreter._interpret(string) is not interpreter._interpret(string)
+    copied = pickle.loads(pickle.dumps(number))
+    assert copied == number and '_constant' not in vars(copied)
+
+
+def test_interpolated_string_interpretation(
+    farr_engines_fixture: Callable[..., ModuleNode],
+) -> None:
+    """Parses the interpolations once and formats them in every engine."""
+    module = farr_engines_fixture(
+        """
+        fn greet(let name, let n) = {
+          return! "Hi ${name}, ${+ n 1} ${n}${name}!";
+        }
+        for let i in [1..2] = { println(greet("Farr", i)); }
+        """,
+        'Hi Farr, 2 1Farr!\nHi Farr, 3 2Farr!\n',
+    )
+    string = module.body[0].body.body[0].expression  # type: ignore[attr-defined]
+    assert isinstance(string, InterpolatedStringNode)
+    assert string.texts == ['Hi ', ', ', ' ', '', '!']
+
+
+def test_hash_map_interpretation(
+    farr_engines_fixture: Callable[..., ModuleNode],
+) -> None:
+    """Keeps the pairs in order while finding them by their keys."""
+    farr_engines_fixture(
+        """
+        let m = {:"a" 1, :"b" 2, :"a" 3};
+        println(m, m.get("a"), m.get("z"), m.get("z", 0));
+        m.iupdate!({:"c" 4, :"b" 5});
+        println(m.keys, m.values, m.first, m.last);
+        println(m.[2], m.[2..3], m.pop!(1), m.popitem!("c"), m);
+        for (let k, let v) in m = { m.popitem!(k); }
+        println(m.isempty?());
+        try = { m.popitem!(9); } catch ValueError = { println("no 9"); }
+        """,
+        'a->3; b->2 3 null 0\n'
+        'a; b; c 3; 5; 4 a->3 c->4\n'
+        'b->5 b->5; c->4 a->3 c->4 b->5\n'
+        'true\n'
+        'no 9\n',
+        (FarrInterpreter, FarrVirtualMachine),
+    )
+
+
+def test_set_interpretation(
+    farr_engines_fixture: Callable[..., ModuleNode],
+) -> None:
+    """Keeps distinct elements and combines sets with other structures."""
+    farr_engines_fixture(
+        """
+        let s = set(3, 1, 3, 2);
+        println(s, s.length, s.contains?(2), s.contains?(9));
+        s.iadd!(4);
+        println(
+          s.union({5, 1}),
+          s.intersection(set(1, 4, 7)),
+          s.difference({3, 9})
+        );
+        println(s.popitem!(3), s, (+ 0 1).isin(s));
+        match 4 = { for s = { println("found"); } }
+        try = { s.popitem!(9); } catch ValueError = { println("no 9"); }
+        """,
+        '3; 1; 2 3 true false\n'
+        '3; 1; 2; 4; 5 1; 4 1; 2; 4\n'
+        '3 1; 2; 4 true\n'
+        'found\n'
+        'no 9\n',
+    )
+
+
+def test_deque_interpretation(
+    farr_engines_fixture: Callable[..., ModuleNode],
+) -> None:
+    """Pushes and pops at both ends and bounds the length if asked."""
+    farr_engines_fixture(
+        """
+        let q = deque(1, 2);
+        q.ipush_front!(0);
+        q.ipush_back!(3);
+        println(q.first, q.last, q.pop_front!(), q.pop_back!(), q);
+        let window = deque(maxlen=2);
+        for let i in [1..5] = { window.ipush_back!(i); }
+        for let x in q = { q.ipush_back!(x); }
+        println(window, q, deque().isempty?());
+        """,
+        '0 3 0 3 1; 2\n4; 5 1; 2; 1; 2 true\n',
+    )
+
+
+def test_heap_interpretation(
+    farr_engines_fixture: Callable[..., ModuleNode],
+) -> None:
+    """Pops the smallest rank first and runs the key once per element."""
+    farr_engines_fixture(
+        """
+        let h = heap(5, 1, 4);
+        h.ipush!(3);
+        println(h.peek(), h.pop!(), h.pop!(), h);
+        fn negate(let x) = { return! - 0 x; }
+        let m = heap.heapify({3, 9, 1, 7}, key=negate);
+        println(m.pop!(), m.ipushpop!(8), m);
+        let calls = 0;
+        fn rank(let task) = { calls += 1; return! % task 10; }
+        let jobs = heap(key=rank);
+        for let j in {14, 11, 23, 1} = { jobs.ipush!(j); }
+        let order = {};
+        while ! jobs.isempty?() = { order.iappend!(jobs.pop!()); }
+        println(order, calls);
+        """,
+        '1 1 3 4; 5\n9 8 7; 3; 1\n11; 1; 23; 14 4\n',
+    )
+    assert FarrInterpreter.builtin_symbols['heap'].caller is None  # type: ignore[attr-defined]
@@ -3,11 +3,13 @@
 # We understand that beauty is not objective...
 # https://github.com/sheikhartin/farr
 
+import io
+import pathlib
 import textwrap
 
 import pytest
 
-from farr.lexer import FarrRegexLexer
+from farr.lexer import FarrRegexLexer, TokenKind
 from farr.lexer.base import TokenState
 
 
@@ -101,6 +103,64 @@ def test_tokenization_output_types(
     )
 
 
+def test_lazy_tokenization_of_files(
+    farr_regex_lexer_fixture: FarrRegexLexer,
+    tmp_path: pathlib.Path,
+) -> None:
+    """Compares the tokens streamed from files with the eager ones."""
+    code = textwrap.dedent(
+        """
+        /* Numbers
+           and strings... */
+        let greeting = "Salam, dünya!";
+        println(greeting, 0b101, -.5);
+        """
+    )
+    (filepath := tmp_path / 'greeting.farr').write_text(code, encoding='utf-8')
+    with filepath.open('rb') as file:
+        assert list(
+            farr_regex_lexer_fixture.tokenize_iter(file)
+        ) == farr_regex_lexer_fixture.tokenize(code)
+    assert list(
+        farr_regex_lexer_fixture.tokenize_iter(io.StringIO(code))
+    ) == farr_regex_lexer_fixture.tokenize(code)
+
+
+def test_non_ascii_identifiers_tokenization_of_files(
+    farr_regex_lexer_fixture: FarrRegexLexer,
+    tmp_path: pathlib.Path,
+) -> None:
+    """Lexes identifiers outside ASCII from files like from strings."""
+    code = 'let سلام = 5;\nprintln(سلام);\n'
+    (filepath := tmp_path / 'salam.farr').write_text(code, encoding='utf-8')
+    with filepath.open('rb') as file:
+        assert list(
+            farr_regex_lexer_fixture.tokenize_iter(file)
+        ) == farr_regex_lexer_fixture.tokenize(code)
+    assert list(
+        farr_regex_lexer_fixture.tokenize_iter(code.encode())
+    ) == farr_regex_lexer_fixture.tokenize(code)
+
+
+def test_token_buffer_arrays(
+    farr_regex_lexer_fixture: FarrRegexLexer,
+) -> None:
+    """Checks the kinds and the offsets kept by the token buffer."""
+    tokens = farr_regex_lexer_fixture.tokenize('let x = "hi";')
+    assert list(tokens.kinds) == [
+        TokenKind.Variable,
+        TokenKind.Identifier,
+        TokenKind.Equal,
+        TokenKind.String,
+        TokenKind.Semicolon,
+    ]
+    assert list(tokens.starts) == [0, 4, 6, 8, 12]
+    assert tokens.value(3) == '"hi"'
+    assert tokens[-1] == TokenState(
+        row=1, column=13, name='Semicolon', value=';'
+    )
+
+
 @pytest.mark.xfail(raises=ValueError)
 def test_tokenization_value_error(
     farr_regex_lexer_fixture: FarrRegexLexer,
@@ -7,8 +7,9 @@ import textwrap
 
 import pytest
 
-from farr.lexer import FarrRegexLexer
+from farr.lexer import FarrRegexLexer, TokenKind
 from farr.parser import FarrParser
+from farr.parser.base import TokenStream
 from farr.parser.nodes import (
     ModuleNode,
     BlockNode,
@@ -24,8 +25,10 @@ from farr.parser.nodes import (
     PostDecrementNode,
     ArithmeticOperationNode,
     RelationalOperationNode,
+    TernaryOperationNode,
     VariableDeclarationNode,
     MultiplyAssignmentNode,
+    PowerAssignmentNode,
     WhileNode,
     ForNode,
     IfNode,
@@ -352,6 +355,79 @@ def test_birthday_greetings_sender_syntax_tree(
     )
 
 
+def test_lazy_tokens_syntax_tree(
+    farr_regex_lexer_fixture: FarrRegexLexer,
+    farr_parser_fixture: FarrParser,
+) -> None:
+    """Parses streamed tokens the same as a list of them."""
+    code = textwrap.dedent(
+        """
+        let scores = {:"Ali" 17, :"Sara" 19};
+        for (let name, let score) in scores = {
+          println("${name}: ${score}");
+        }
+        """
+    )
+    assert farr_parser_fixture.parse(
+        farr_regex_lexer_fixture.tokenize_iter(code)
+    ) == farr_parser_fixture.parse(farr_regex_lexer_fixture.tokenize(code))
+
+
+def test_operator_binding_syntax_tree(
+    farr_regex_lexer_fixture: FarrRegexLexer,
+    farr_parser_fixture: FarrParser,
+) -> None:
+    """Checks how a postfix, a ternary and an aggregate assignment bind."""
+    assert farr_parser_fixture.parse(
+        farr_regex_lexer_fixture.tokenize('x ^= i++ if i < 3 else 0;')
+    ) == ModuleNode(
+        body=[
+            PowerAssignmentNode(
+                references=ItemizedExpressionNode(
+                    items=[IdentifierNode(row=1, column=1, value='x')]
+                ),
+                expression=TernaryOperationNode(
+                    row=1,
+                    column=10,
+                    then=PostIncrementNode(
+                        row=1,
+                        column=7,
+                        operator=None,
+                        operand=ItemizedExpressionNode(
+                            items=[IdentifierNode(row=1, column=6, value='i')]
+                        ),
+                    ),
+                    condition=RelationalOperationNode(
+                        row=1,
+                        column=15,
+                        operator='LessThan',
+                        left=IdentifierNode(row=1, column=13, value='i'),
+                        right=IntegerNode(row=1, column=17, value='3'),
+                    ),
+                    orelse=IntegerNode(row=1, column=24, value='0'),
+                ),
+            )
+        ]
+    )
+
+
+def test_token_stream_lookahead_and_backtracking(
+    farr_regex_lexer_fixture: FarrRegexLexer,
+) -> None:
+    """Moves a cursor over the tokens and comes back to a mark."""
+    tokens = TokenStream(
+        farr_regex_lexer_fixture.tokenize_iter('let x = (+ 1 2);'), TokenKind
+    )
+    assert tokens.kind(4) == TokenKind.Add
+    mark = tokens.mark()
+    for _ in range(3):
+        tokens.advance()
+    assert tokens.peek().value == '('  # type: ignore[union-attr]
+    tokens.reset(mark)
+    assert tokens.peek().value == 'let'  # type: ignore[union-attr]
+    assert tokens.kind(9) is None
+
+
 @pytest.mark.xfail(raises=SyntaxError)
 def test_parse_syntax_error(
     farr_regex_lexer_fixture: FarrRegexLexer,